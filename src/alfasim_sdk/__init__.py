@@ -124,6 +124,7 @@ from alfasim_sdk._internal.alfacase.case_description import PvtModelsDescription
 from alfasim_sdk._internal.alfacase.case_description import (
     PvtModelTableParametersDescription,
 )
+from alfasim_sdk._internal.alfacase.case_description import PvtTableHandle
 from alfasim_sdk._internal.alfacase.case_description import (
     ReferencedPressureContainerDescription,
 )
@@ -175,12 +176,66 @@ from alfasim_sdk._internal.alfacase.case_description import XAndYDescription
 
 # ALFACase: Utilities
 from alfasim_sdk._internal.alfacase.alfacase import convert_alfacase_to_description
+from alfasim_sdk._internal.alfacase.alfacase import (
+    convert_alfacase_to_lazy_description,
+)
 from alfasim_sdk._internal.alfacase.alfacase import convert_description_to_alfacase
 from alfasim_sdk._internal.alfacase.alfacase import generate_alfacase_file
+from alfasim_sdk._internal.alfacase.alfacase import write_description_as_alfacase
 from alfasim_sdk._internal.alfacase.alfatable import generate_alfatable_file
 from alfasim_sdk._internal.alfacase.alfatable import (
     load_pvt_model_table_parameters_description_from_alfatable,
 )
+from alfasim_sdk._internal.alfacase.description_cache import CaseDescriptionCache
+from alfasim_sdk._internal.alfacase.environment_properties import (
+    EnvironmentPropertyTable,
+)
+from alfasim_sdk._internal.alfacase.equipment_index import (
+    build_case_equipment_index,
+)
+from alfasim_sdk._internal.alfacase.equipment_index import build_equipment_index
+from alfasim_sdk._internal.alfacase.equipment_index import EquipmentIndex
+from alfasim_sdk._internal.alfacase.initial_conditions_evaluation import (
+    evaluate_initial_conditions,
+)
+from alfasim_sdk._internal.alfacase.initial_conditions_evaluation import (
+    evaluate_initial_conditions_on_mesh,
+)
+from alfasim_sdk._internal.alfacase.initial_conditions_evaluation import (
+    evaluate_initial_tracers_mass_fractions,
+)
+from alfasim_sdk._internal.alfacase.lazy_case_description import LazyCaseDescription
+from alfasim_sdk._internal.alfacase.pipe_mesh import build_pipe_mesh
+from alfasim_sdk._internal.alfacase.pipe_mesh import build_pipe_meshes
+from alfasim_sdk._internal.alfacase.pipe_mesh import PipeMesh
+from alfasim_sdk._internal.alfacase.profile_geometry import ProfileGeometry
+from alfasim_sdk._internal.alfacase.pvt_compositional import (
+    CompiledCompositionalModel,
+)
+from alfasim_sdk._internal.alfacase.pvt_compositional import (
+    compile_compositional_model,
+)
+from alfasim_sdk._internal.alfacase.pvt_correlations import (
+    BlackOilCorrelationEvaluator,
+)
+from alfasim_sdk._internal.alfacase.pvt_tab_file import (
+    load_pvt_model_table_parameters_description_from_tab,
+)
+from alfasim_sdk._internal.alfacase.pvt_tab_file import read_pvt_tab_file
+from alfasim_sdk._internal.alfacase.pvt_table_generator import generate_pvt_table
+from alfasim_sdk._internal.alfacase.pvt_table_generator import (
+    generate_pvt_table_file,
+)
+from alfasim_sdk._internal.alfacase.pvt_table_interpolator import (
+    PvtTableInterpolator,
+)
+from alfasim_sdk._internal.alfacase.pvt_table_interpolator import (
+    PvtTableOutOfRangeWarning,
+)
+from alfasim_sdk._internal.alfacase.pvt_table_resampling import (
+    PvtTableResamplingReport,
+)
+from alfasim_sdk._internal.alfacase.pvt_table_resampling import resample_pvt_table
 
 # Constants
 from alfasim_sdk._internal.constants import BUBBLE_FIELD
@@ -338,6 +393,7 @@ __all__ = [
     "PvtModelCorrelationDescription",
     "PvtModelsDescription",
     "PvtModelTableParametersDescription",
+    "PvtTableHandle",
     "ReferencedPressureContainerDescription",
     "ReferencedTemperaturesContainerDescription",
     "ReferencedTracersMassFractionsContainerDescription",
@@ -362,11 +418,37 @@ __all__ = [
     "WallLayerDescription",
     "WellDescription",
     "XAndYDescription",
+    "BlackOilCorrelationEvaluator",
+    "CaseDescriptionCache",
+    "CompiledCompositionalModel",
+    "EnvironmentPropertyTable",
+    "EquipmentIndex",
+    "LazyCaseDescription",
+    "PipeMesh",
+    "ProfileGeometry",
+    "PvtTableInterpolator",
+    "PvtTableOutOfRangeWarning",
+    "PvtTableResamplingReport",
+    "build_case_equipment_index",
+    "build_equipment_index",
+    "build_pipe_mesh",
+    "build_pipe_meshes",
+    "compile_compositional_model",
     "convert_alfacase_to_description",
+    "convert_alfacase_to_lazy_description",
     "convert_description_to_alfacase",
+    "evaluate_initial_conditions",
+    "evaluate_initial_conditions_on_mesh",
+    "evaluate_initial_tracers_mass_fractions",
     "generate_alfacase_file",
     "generate_alfatable_file",
+    "generate_pvt_table",
+    "generate_pvt_table_file",
     "load_pvt_model_table_parameters_description_from_alfatable",
+    "load_pvt_model_table_parameters_description_from_tab",
+    "read_pvt_tab_file",
+    "resample_pvt_table",
+    "write_description_as_alfacase",
     "BUBBLE_FIELD",
     "CompressorSpeedType",
     "CorrelationPackage",
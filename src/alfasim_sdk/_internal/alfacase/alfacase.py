@@ -1,43 +1,99 @@
+import os
 from pathlib import Path
+from typing import Callable
+from typing import Optional
+from typing import TextIO
+
+import numpy as np
 
 from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase.description_cache import CaseDescriptionCache
+from alfasim_sdk._internal.alfacase.lazy_case_description import LazyCaseDescription
 
 
 def generate_alfacase_file(
-    alfacase_description: case_description.CaseDescription, alfacase_file: Path
+    alfacase_description: case_description.CaseDescription,
+    alfacase_file: Path,
+    *,
+    array_sidecar_threshold: Optional[int] = None,
+    binary_alfatable: bool = False,
 ):
     """
     Dump the case_description to the given alfacase_file, using YAML format.
 
     PvtModels that are of mode constants.PVT_MODEL_TABLE will be dumped into a separate file (.alfatable).
+
+    :param array_sidecar_threshold:
+        When given, the values of arrays with at least this number of elements are dumped into
+        separate files (``<alfacase file stem>.<hash>.npy``) and the alfacase file only keeps the
+        name of the file on ``values``. These files are memory-mapped when the case is loaded.
+    :param binary_alfatable:
+        Dump the PvtModels into binary `.alfatable` files, which are memory-mapped when loaded
+        (see `generate_alfatable_file`).
     """
+    from alfasim_sdk._internal.alfacase.array_sidecar import ArraySidecarWriter
+
     _generate_alfatable_file_for_pvt_models_description(
-        alfacase_description.pvt_models, alfacase_file
+        alfacase_description.pvt_models, alfacase_file, binary=binary_alfatable
     )
-    alfacase_file_content = convert_description_to_alfacase(alfacase_description)
-    alfacase_file.write_text(alfacase_file_content, encoding="utf-8")
+    array_sidecar_writer = (
+        ArraySidecarWriter(alfacase_file, array_sidecar_threshold)
+        if array_sidecar_threshold is not None
+        else None
+    )
+    # Written to a temporary file first, so the alfacase file is never left partially written.
+    alfacase_file = Path(alfacase_file)
+    temp_file = alfacase_file.with_name(f"{alfacase_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file, "w", encoding="utf-8") as stream:
+            write_description_as_alfacase(
+                alfacase_description, stream, array_sidecar_writer=array_sidecar_writer
+            )
+        os.replace(str(temp_file), str(alfacase_file))
+    finally:
+        if temp_file.exists():
+            temp_file.unlink()
 
 
 def _generate_alfatable_file_for_pvt_models_description(
-    pvt_models: case_description.PvtModelsDescription, alfacase_file: Path
+    pvt_models: case_description.PvtModelsDescription,
+    alfacase_file: Path,
+    *,
+    binary: bool = False,
 ):
     """
     Create `.alfatable` files for each pvt_model which the mode is constants.PVT_MODEL_TABLE.
+
+    PvtModels with the same content (see `PvtModelTableParametersDescription.fingerprint`)
+    share a single file. The handles of the files on `tables` (see
+    `PvtModelsDescription.create_table_handles`) keep their reference instead.
     """
     from alfasim_sdk import generate_alfatable_file
 
-    for pvt_name, pvt_table_description in pvt_models.table_parameters.items():
-        alfatable_file = generate_alfatable_file(
-            alfacase_file=alfacase_file,
-            alfatable_filename=pvt_name,
-            description=pvt_table_description,
-        )
+    alfatable_files = {}
+    for pvt_name in pvt_models.table_parameters:
+        if pvt_models.is_table_handle(pvt_name):
+            # Keep the reference on `tables`, without reading the file.
+            continue
+        pvt_table_description = pvt_models.get_table_parameters(pvt_name)
+        fingerprint = pvt_table_description.fingerprint()
+        alfatable_file = alfatable_files.get(fingerprint)
+        if alfatable_file is None:
+            alfatable_file = alfatable_files[fingerprint] = generate_alfatable_file(
+                alfacase_file=alfacase_file,
+                alfatable_filename=pvt_name,
+                description=pvt_table_description,
+                binary=binary,
+            )
         pvt_models.tables[pvt_name] = alfatable_file.name
     pvt_models.table_parameters.clear()
 
 
 def convert_description_to_alfacase(
-    alfacase_description, *, enable_flow_style_on_numpy: bool = False
+    alfacase_description,
+    *,
+    enable_flow_style_on_numpy: bool = False,
+    array_sidecar_writer: Optional[Callable[[np.ndarray], Optional[str]]] = None,
 ) -> str:
     """
     Convert a given case (decorated with attrs) to YAML representation.
@@ -58,25 +114,85 @@ def convert_description_to_alfacase(
 
             pressure: [1, 2]
 
+    :param array_sidecar_writer:
+        When given, called with the values of each Array, returning the name of the file where
+        the values were written or ``None`` to write them inline.
     """
-    import attr
-    from strictyaml import YAML
-    from .case_to_alfacase import convert_dict_to_valid_alfacase_format
+    import io
 
-    case_description_dict = convert_dict_to_valid_alfacase_format(
-        attr.asdict(alfacase_description, recurse=False),
+    stream = io.StringIO()
+    write_description_as_alfacase(
+        alfacase_description,
+        stream,
         enable_flow_style_on_numpy=enable_flow_style_on_numpy,
+        array_sidecar_writer=array_sidecar_writer,
     )
-    return YAML(case_description_dict).as_yaml()
+    return stream.getvalue()
+
+
+def write_description_as_alfacase(
+    alfacase_description,
+    stream: TextIO,
+    *,
+    enable_flow_style_on_numpy: bool = False,
+    array_sidecar_writer: Optional[Callable[[np.ndarray], Optional[str]]] = None,
+) -> None:
+    """
+    Write a given case (decorated with attrs) to the given text stream, in YAML representation.
+
+    The content is written while the description is traversed, so the memory used doesn't grow
+    with the size of the case. The output is the same as `convert_description_to_alfacase`.
+    """
+    from .case_to_alfacase import AlfacaseStreamWriter
+
+    AlfacaseStreamWriter(
+        stream,
+        enable_flow_style_on_numpy=enable_flow_style_on_numpy,
+        array_sidecar_writer=array_sidecar_writer,
+    ).write(alfacase_description)
 
 
 def convert_alfacase_to_description(
     file_alfacase: Path,
+    *,
+    fast_loader: bool = False,
+    cache: Optional[CaseDescriptionCache] = None,
+    workers: int = 1,
 ) -> case_description.CaseDescription:
     """
     Return a alfasim_sdk.alfacase.case_description.Case with all information provided on file_yaml.
+
+    :param fast_loader:
+        Use the C accelerated YAML parser together with a schema compiled from the description classes
+        instead of strictyaml. The result and the error messages are the same for both modes.
+
+    :param cache:
+        When given, the description is obtained from this on-disk cache if the alfacase file
+        (and the files referenced by it) didn't change since it was stored.
+
+    :param workers:
+        Number of processes used to load the materials, nodes, pipes and wells.
+        The elements are loaded in parallel and merged in the same order as the file.
     """
     from alfasim_sdk._internal.alfacase.alfacase_to_case import load_case_description
     from alfasim_sdk._internal.alfacase.alfacase_to_case import DescriptionDocument
 
-    return load_case_description(DescriptionDocument.from_file(file_alfacase))
+    def load(file_path: Path) -> case_description.CaseDescription:
+        return load_case_description(
+            DescriptionDocument.from_file(file_path, fast_loader=fast_loader),
+            workers=workers,
+        )
+
+    if cache is not None:
+        return cache.load(Path(file_alfacase), load)
+    return load(file_alfacase)
+
+
+def convert_alfacase_to_lazy_description(file_alfacase: Path) -> LazyCaseDescription:
+    """
+    Return a read-only object compatible with alfasim_sdk.alfacase.case_description.Case where each
+    section (and each pipe and well) is only parsed and validated when accessed for the first time.
+
+    Use ``materialize()`` on the returned object to obtain the complete description.
+    """
+    return LazyCaseDescription.from_file(file_alfacase)
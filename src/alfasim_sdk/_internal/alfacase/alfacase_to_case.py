@@ -1,7 +1,9 @@
+import concurrent.futures
 import enum
 import inspect
 from functools import lru_cache
 from functools import partial
+from functools import wraps
 from numbers import Number
 from pathlib import Path
 from typing import Any
@@ -9,10 +11,12 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
 import attr
+import numpy as np
 from attr.validators import instance_of
 from barril.units import Array
 from barril.units import Scalar
@@ -45,10 +49,18 @@ class DescriptionDocument:
         return item in self.content
 
     @classmethod
-    def from_file(cls, file_path: Path) -> "DescriptionDocument":
+    def from_file(
+        cls, file_path: Path, *, fast_loader: bool = False
+    ) -> "DescriptionDocument":
         """
         Load the values from the given file_path validating against the Schema defined on
         alfacase.schema.case_schema
+
+        :param fast_loader:
+            When enabled, parse the file with the C accelerated YAML parser and validate the content
+            with a schema compiled from the CaseDescription classes (see `compiled_schema`).
+            Content not accepted by the compiled schema is loaded again with strictyaml,
+            so errors are reported with the same messages.
         """
         import strictyaml
         from alfasim_sdk._internal.alfacase.schema import case_description_schema
@@ -56,9 +68,22 @@ class DescriptionDocument:
             DescriptionError,
         )
 
+        yaml_string = Path(file_path).read_text(encoding="UTF-8")
+        if fast_loader:
+            from alfasim_sdk._internal.alfacase import compiled_schema
+
+            try:
+                content = compiled_schema.load_content(
+                    yaml_string, case_description.CaseDescription
+                )
+            except compiled_schema.FastPathNotApplicable:
+                pass
+            else:
+                return cls(content, file_path)
+
         try:
             content = strictyaml.dirty_load(
-                yaml_string=Path(file_path).read_text(encoding="UTF-8"),
+                yaml_string=yaml_string,
                 schema=case_description_schema,
                 allow_flow_style=True,
             )
@@ -77,6 +102,78 @@ def get_category_for(unit: Optional[str]) -> Optional[str]:
         return UnitDatabase.GetSingleton().GetDefaultCategory(unit)
 
 
+def _is_description_loader(loader_function: Callable) -> bool:
+    return len(inspect.getfullargspec(loader_function).args) == 1
+
+
+_is_description_loader_cached = lru_cache(maxsize=None)(_is_description_loader)
+
+
+def is_description_loader(loader_function: Callable) -> bool:
+    """
+    Description loaders receive only the document of the attribute (``load_*_description(document)``),
+    while value loaders receive the key and the document of the parent (``load_value(key, alfacase_content)``).
+    """
+    try:
+        return _is_description_loader_cached(loader_function)
+    except TypeError:  # Unhashable callable.
+        return _is_description_loader(loader_function)
+
+
+@attr.s(frozen=True, slots=True)
+class LoaderPlanEntry:
+    """
+    Pre-computed information about how to load one attribute of a description.
+
+    The category of Scalar/Array attributes is already bound to their loaders (see
+    `get_scalar_loader`) and the description class is created by the ``load_*_description``
+    function running the plan, so neither is stored here.
+
+    :ivar key:
+        Attribute name, same key used on the alfacase file.
+    :ivar loader:
+        The loader function.
+    :ivar is_description_loader:
+        If the loader receives only the document of the attribute (see `is_description_loader`).
+    """
+
+    key = attr.ib(type=str)
+    loader = attr.ib(type=Callable)
+    is_description_loader = attr.ib(type=bool)
+
+
+LoaderPlan = Tuple[LoaderPlanEntry, ...]
+
+
+def compile_loader_plan(
+    alfacase_to_case_description: Dict[str, Callable]
+) -> LoaderPlan:
+    """
+    Convert a dictionary with pairs attribute_name:loader_function into a LoaderPlan,
+    so the introspection of the loaders is done only once.
+    """
+    return tuple(
+        LoaderPlanEntry(
+            key=key,
+            loader=loader,
+            is_description_loader=is_description_loader(loader),
+        )
+        for key, loader in alfacase_to_case_description.items()
+    )
+
+
+def loader_plan(
+    function: Callable[[], Dict[str, Callable]]
+) -> Callable[[], LoaderPlan]:
+    """
+    Decorator for functions returning the loaders of a description, the result is compiled
+    with `compile_loader_plan` on the first call and reused on the next ones.
+    """
+    return lru_cache(maxsize=None)(
+        wraps(function)(lambda: compile_loader_plan(function()))
+    )
+
+
 def load_scalar(key: str, alfacase_content: DescriptionDocument, category) -> Scalar:
     """
     Create a barril.units.Scalar instance from the given alfacase_content.
@@ -104,6 +201,26 @@ def get_scalar_loader(
     )
 
 
+def _to_float_array(
+    values: Union[List[float], np.ndarray, str], alfacase_content: DescriptionDocument
+) -> np.ndarray:
+    """
+    Return the values as a contiguous ``float64`` array, without copying the arrays already
+    created by the fast loader.
+
+    When `values` is a string it is the name of a ``.npy`` file relative to the alfacase file,
+    which is memory-mapped (see `array_sidecar`).
+    """
+    if isinstance(values, str):
+        from alfasim_sdk._internal.alfacase.array_sidecar import get_array_sidecar_file
+        from alfasim_sdk._internal.alfacase.array_sidecar import load_array_sidecar
+
+        return load_array_sidecar(
+            get_array_sidecar_file(alfacase_content.file_path.parent, values)
+        )
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
 def load_array(key: str, alfacase_content: DescriptionDocument, category) -> Array:
     """
     Create a barril.units.Array instance from the given YAML content.
@@ -111,7 +228,7 @@ def load_array(key: str, alfacase_content: DescriptionDocument, category) -> Arr
     """
     return Array(
         category,
-        alfacase_content[key]["values"].content.data,
+        _to_float_array(alfacase_content[key]["values"].content.data, alfacase_content),
         alfacase_content[key]["unit"].content.data,
     )
 
@@ -139,7 +256,11 @@ def load_list_of_arrays(
     # TODO: ASIM-3556: All atributes from this module should get the category from the CaseDescription
     """
     return [
-        Array(category, entry.content.data["values"], entry.content.data["unit"])
+        Array(
+            category,
+            _to_float_array(entry.content.data["values"], entry),
+            entry.content.data["unit"],
+        )
         for entry in alfacase_content[key]
     ]
 
@@ -167,7 +288,7 @@ def load_dict_of_arrays(
     # TODO: ASIM-3556: All atributes from this module should get the category from the CaseDescription
     """
     return {
-        k: Array(category, v["values"], v["unit"])
+        k: Array(category, _to_float_array(v["values"], alfacase_content), v["unit"])
         for k, v in alfacase_content[key].content.data.items()
     }
 
@@ -213,6 +334,7 @@ def load_dict_with_scalar(
     }
 
 
+@lru_cache(maxsize=None)
 def get_dict_with_scalar_loader(*, category: str) -> Callable:
     """
     Return a LoadDictWithScalar function pre-populate with the category
@@ -231,6 +353,7 @@ def load_enum(
     return enum_class(enum_value)
 
 
+@lru_cache(maxsize=None)
 def get_enum_loader(*, enum_class: enum.EnumMeta) -> Callable:
     """
     Return a LoadEnum function pre-populated with the enum_class
@@ -305,10 +428,9 @@ def load_pvt_tables(alfacase_content: DescriptionDocument) -> Dict[str, Path]:
     }
 
 
-def load_pvt_model_correlation_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.PvtModelCorrelationDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_pvt_model_correlation_loader_plan() -> Dict[str, Callable]:
+    return {
         "oil_density_std": get_scalar_loader(from_unit="kg/m3"),
         "gas_density_std": get_scalar_loader(from_unit="kg/m3"),
         "rs_sat": get_scalar_loader(from_unit="sm3/sm3"),
@@ -317,6 +439,12 @@ def load_pvt_model_correlation_description(
         ),
     }
 
+
+def load_pvt_model_correlation_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.PvtModelCorrelationDescription]:
+    alfacase_to_case_description = _get_pvt_model_correlation_loader_plan()
+
     def generate_pvt_model_correlation(value: DescriptionDocument):
         case_values = to_case_values(value, alfacase_to_case_description)
         return case_description.PvtModelCorrelationDescription(**case_values)
@@ -329,16 +457,21 @@ def load_pvt_model_correlation_description(
     }
 
 
-def load_heavy_component_description(
-    document: DescriptionDocument,
-) -> List[case_description.HeavyComponentDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_heavy_component_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "scn": load_value,
         "MW": get_scalar_loader(from_unit="kg/mol"),
         "rho": get_scalar_loader(from_unit="kg/m3"),
     }
 
+
+def load_heavy_component_description(
+    document: DescriptionDocument,
+) -> List[case_description.HeavyComponentDescription]:
+    alfacase_to_case_description = _get_heavy_component_loader_plan()
+
     def generate_heavy_components_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.HeavyComponentDescription(**case_values)
@@ -349,10 +482,9 @@ def load_heavy_component_description(
     ]
 
 
-def load_light_component_description(
-    document: DescriptionDocument,
-) -> List[case_description.LightComponentDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_light_component_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "Pc": get_scalar_loader(from_unit="Pa"),
         "Tc": get_scalar_loader(from_unit="K"),
@@ -368,6 +500,12 @@ def load_light_component_description(
         "Cp_4": get_scalar_loader(from_unit="-"),
     }
 
+
+def load_light_component_description(
+    document: DescriptionDocument,
+) -> List[case_description.LightComponentDescription]:
+    alfacase_to_case_description = _get_light_component_loader_plan()
+
     def generate_light_components_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.LightComponentDescription(**case_values)
@@ -378,15 +516,20 @@ def load_light_component_description(
     ]
 
 
-def load_bip_description(
-    document: DescriptionDocument,
-) -> List[case_description.BipDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_bip_loader_plan() -> Dict[str, Callable]:
+    return {
         "component_1": load_value,
         "component_2": load_value,
         "value": load_value,
     }
 
+
+def load_bip_description(
+    document: DescriptionDocument,
+) -> List[case_description.BipDescription]:
+    alfacase_to_case_description = _get_bip_loader_plan()
+
     def generate_bip_description(alfacase_document: DescriptionDocument):
         case_values = to_case_values(alfacase_document, alfacase_to_case_description)
         return case_description.BipDescription(**case_values)
@@ -396,15 +539,20 @@ def load_bip_description(
     ]
 
 
-def load_composition_description(
-    document: DescriptionDocument,
-) -> List[case_description.CompositionDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_composition_loader_plan() -> Dict[str, Callable]:
+    return {
         "component": load_value,
         "molar_fraction": get_scalar_loader(from_unit="mol/mol"),
         "reference_enthalpy": get_scalar_loader(from_unit="J/mol"),
     }
 
+
+def load_composition_description(
+    document: DescriptionDocument,
+) -> List[case_description.CompositionDescription]:
+    alfacase_to_case_description = _get_composition_loader_plan()
+
     def generate_composition_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.CompositionDescription(**case_values)
@@ -415,14 +563,19 @@ def load_composition_description(
     ]
 
 
-def load_fluid_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.FluidDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_fluid_loader_plan() -> Dict[str, Callable]:
+    return {
         "composition": load_composition_description,
         "fraction_pairs": load_bip_description,
     }
 
+
+def load_fluid_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.FluidDescription]:
+    alfacase_to_case_description = _get_fluid_loader_plan()
+
     def generate_fluid_description(
         value: DescriptionDocument,
     ) -> case_description.FluidDescription:
@@ -437,10 +590,9 @@ def load_fluid_description(
     }
 
 
-def load_pvt_model_compositional_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.PvtModelCompositionalDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_pvt_model_compositional_loader_plan() -> Dict[str, Callable]:
+    return {
         "equation_of_state_type": get_enum_loader(
             enum_class=constants.EquationOfStateType
         ),
@@ -455,6 +607,12 @@ def load_pvt_model_compositional_description(
         "fluids": load_fluid_description,
     }
 
+
+def load_pvt_model_compositional_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.PvtModelCompositionalDescription]:
+    alfacase_to_case_description = _get_pvt_model_compositional_loader_plan()
+
     def generate_pvt_model_compositional(value: DescriptionDocument):
         case_values = to_case_values(value, alfacase_to_case_description)
         return case_description.PvtModelCompositionalDescription(**case_values)
@@ -467,17 +625,25 @@ def load_pvt_model_compositional_description(
     }
 
 
-def load_pvt_models_description(
-    document: DescriptionDocument,
-) -> case_description.PvtModelsDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_pvt_models_loader_plan() -> Dict[str, Callable]:
+    return {
         "default_model": load_value,
         "tables": load_pvt_tables,
         "correlations": load_pvt_model_correlation_description,
         "compositions": load_pvt_model_compositional_description,
     }
+
+
+def load_pvt_models_description(
+    document: DescriptionDocument,
+) -> case_description.PvtModelsDescription:
+    alfacase_to_case_description = _get_pvt_models_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
-    return case_description.PvtModelsDescription(**case_values)
+    pvt_models = case_description.PvtModelsDescription(**case_values)
+    # The tables are only read when their parameters are used.
+    pvt_models.create_table_handles()
+    return pvt_models
 
 
 # Used for testing - Will be ignored on the document contents
@@ -486,25 +652,32 @@ IGNORE_KEY = "IgnoreKey"
 
 def to_case_values(
     document: DescriptionDocument,
-    alfacase_to_case_description_dict: Dict[str, Callable],
+    alfacase_to_case_description: Union["LoaderPlan", Dict[str, Callable]],
 ) -> Dict[str, Any]:
     """
     Function that return a dictionary with the attributes and their respective values on CaseDescription domain.
 
     :param document:
         The DescriptionDocument object, with the value loaded from YAML file
-    :param alfacase_to_case_description_dict:
-        Dictionary with pairs attribute_name:loader_function to convert the values from YAML content
-        to case description domain.
+    :param alfacase_to_case_description:
+        A LoaderPlan (see `loader_plan`) or a dictionary with pairs attribute_name:loader_function
+        to convert the values from YAML content to case description domain.
     """
-    alfacase_to_case_description = {}
-    for attr_name, function_handle in alfacase_to_case_description_dict.items():
+    if isinstance(alfacase_to_case_description, dict):
+        alfacase_to_case_description = compile_loader_plan(alfacase_to_case_description)
+
+    case_values = {}
+    for entry in alfacase_to_case_description:
+        attr_name = entry.key
         if attr_name in document:
-            alfacase_to_case_description[attr_name] = execute_loader(
-                attr_name, function_handle, document
-            )
+            if entry.is_description_loader:
+                case_values[attr_name] = entry.loader(document[attr_name])
+            else:
+                case_values[attr_name] = entry.loader(
+                    key=attr_name, alfacase_content=document
+                )
 
-    return alfacase_to_case_description
+    return case_values
 
 
 def execute_loader(
@@ -513,18 +686,15 @@ def execute_loader(
     """
     Execute the loader function passing the YAML content, and return the value converted
     """
-    is_a_description_loader = len(inspect.getfullargspec(loader_function).args) == 1
-
-    if is_a_description_loader:
+    if is_description_loader(loader_function):
         return loader_function(alfacase_content[attr_name])
     else:
         return loader_function(key=attr_name, alfacase_content=alfacase_content)
 
 
-def load_casing_section_description(
-    document: DescriptionDocument,
-) -> List[case_description.CasingSectionDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_casing_section_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "hanger_depth": get_scalar_loader(from_unit="m"),
         "settings_depth": get_scalar_loader(from_unit="m"),
@@ -538,6 +708,12 @@ def load_casing_section_description(
         "material_above_filler": load_value,
     }
 
+
+def load_casing_section_description(
+    document: DescriptionDocument,
+) -> List[case_description.CasingSectionDescription]:
+    alfacase_to_case_description = _get_casing_section_loader_plan()
+
     def generate_casing_section_description(document: DescriptionDocument):
         case_content = to_case_values(document, alfacase_to_case_description)
         return case_description.CasingSectionDescription(**case_content)
@@ -548,22 +724,26 @@ def load_casing_section_description(
     ]
 
 
-def load_cv_table_description(
-    document: DescriptionDocument,
-) -> case_description.CvTableDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_cv_table_loader_plan() -> Dict[str, Callable]:
+    return {
         "opening": get_array_loader(from_unit="-"),
         "flow_coefficient": get_array_loader(from_unit="(galUS/min)/(psi^0.5)"),
     }
+
+
+def load_cv_table_description(
+    document: DescriptionDocument,
+) -> case_description.CvTableDescription:
+    alfacase_to_case_description = _get_cv_table_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.CvTableDescription(**case_values)
 
 
-def load_environment_property_description(
-    document: DescriptionDocument,
-) -> List[case_description.EnvironmentPropertyDescription]:
+@loader_plan
+def _get_environment_property_loader_plan() -> Dict[str, Callable]:
     # fmt: off
-    alfacase_to_case_description = {
+    return {
         'type': get_enum_loader(enum_class=constants.PipeEnvironmentHeatTransferCoefficientModelType),
         'position': get_scalar_loader(from_unit='m'),
         'temperature': get_scalar_loader(from_unit='degC'),
@@ -572,6 +752,13 @@ def load_environment_property_description(
         'fluid_velocity': get_scalar_loader(from_unit='m/s'),
     }
     # fmt: on
+
+
+def load_environment_property_description(
+    document: DescriptionDocument,
+) -> List[case_description.EnvironmentPropertyDescription]:
+    alfacase_to_case_description = _get_environment_property_loader_plan()
+
     def generate_environment_property_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.EnvironmentPropertyDescription(**case_values)
@@ -582,15 +769,20 @@ def load_environment_property_description(
     ]
 
 
-def load_formation_layer_description(
-    document: DescriptionDocument,
-) -> List[case_description.FormationLayerDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_formation_layer_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "start": get_scalar_loader(from_unit="m"),
         "material": load_value,
     }
 
+
+def load_formation_layer_description(
+    document: DescriptionDocument,
+) -> List[case_description.FormationLayerDescription]:
+    alfacase_to_case_description = _get_formation_layer_loader_plan()
+
     def generate_formation_layer_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.FormationLayerDescription(**case_values)
@@ -601,10 +793,9 @@ def load_formation_layer_description(
     ]
 
 
-def load_gas_lift_valve_equipment_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.GasLiftValveEquipmentDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_gas_lift_valve_equipment_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "position": get_scalar_loader(from_unit="m"),
         "diameter": get_scalar_loader(from_unit="m"),
@@ -613,6 +804,12 @@ def load_gas_lift_valve_equipment_description(
         "discharge_coeff": get_scalar_loader(from_unit="-"),
     }
 
+
+def load_gas_lift_valve_equipment_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.GasLiftValveEquipmentDescription]:
+    alfacase_to_case_description = _get_gas_lift_valve_equipment_loader_plan()
+
     def generate_gas_lift_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.GasLiftValveEquipmentDescription(**case_values)
@@ -625,16 +822,21 @@ def load_gas_lift_valve_equipment_description(
     }
 
 
-def load_heat_source_equipment_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.HeatSourceEquipmentDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_heat_source_equipment_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "start": get_scalar_loader(from_unit="m"),
         "length": get_scalar_loader(from_unit="m"),
         "power": get_scalar_loader(from_unit="W"),
     }
 
+
+def load_heat_source_equipment_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.HeatSourceEquipmentDescription]:
+    alfacase_to_case_description = _get_heat_source_equipment_loader_plan()
+
     def generate_heat_source_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.HeatSourceEquipmentDescription(**case_values)
@@ -655,15 +857,17 @@ def get_initial_conditions_table_loader(
     else:
         attr_loader = get_array_loader(from_unit=attr_unit)
 
+    alfacase_to_case_description = {
+        "positions": get_array_loader(from_unit="m"),
+        attr_name: attr_loader,
+    }
+    if is_referenced:
+        alfacase_to_case_description["reference_coordinate"] = get_scalar_loader(
+            from_unit="m"
+        )
+    alfacase_to_case_description = compile_loader_plan(alfacase_to_case_description)
+
     def load_initial_conditions_table(document: DescriptionDocument):
-        alfacase_to_case_description = {
-            "positions": get_array_loader(from_unit="m"),
-            attr_name: attr_loader,
-        }
-        if is_referenced:
-            alfacase_to_case_description["reference_coordinate"] = get_scalar_loader(
-                from_unit="m"
-            )
         case_values = to_case_values(document, alfacase_to_case_description)
         return table_class(**case_values)
 
@@ -675,15 +879,17 @@ def get_tracers_initial_conditions_table_loader(
 ):
     attr_loader = get_list_of_arrays_loader(from_unit=attr_unit)
 
+    alfacase_to_case_description = {
+        "positions": get_array_loader(from_unit="m"),
+        attr_name: attr_loader,
+    }
+    if is_referenced:
+        alfacase_to_case_description["reference_coordinate"] = get_scalar_loader(
+            from_unit="m"
+        )
+    alfacase_to_case_description = compile_loader_plan(alfacase_to_case_description)
+
     def load_initial_conditions_table(document: DescriptionDocument):
-        alfacase_to_case_description = {
-            "positions": get_array_loader(from_unit="m"),
-            attr_name: attr_loader,
-        }
-        if is_referenced:
-            alfacase_to_case_description["reference_coordinate"] = get_scalar_loader(
-                from_unit="m"
-            )
         case_values = to_case_values(document, alfacase_to_case_description)
         return table_class(**case_values)
 
@@ -706,15 +912,20 @@ load_velocities_container_description = get_initial_conditions_table_loader(
 )
 
 
-def load_initial_velocities_description(
-    document: DescriptionDocument,
-) -> case_description.InitialVelocitiesDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_initial_velocities_loader_plan() -> Dict[str, Callable]:
+    return {
         "position_input_type": get_enum_loader(enum_class=constants.TableInputType),
         "table_x": load_referenced_velocities_container_description,
         "table_y": load_referenced_velocities_container_description,
         "table_length": load_velocities_container_description,
     }
+
+
+def load_initial_velocities_description(
+    document: DescriptionDocument,
+) -> case_description.InitialVelocitiesDescription:
+    alfacase_to_case_description = _get_initial_velocities_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.InitialVelocitiesDescription(**case_values)
 
@@ -737,15 +948,20 @@ load_temperatures_container_description = get_initial_conditions_table_loader(
 )
 
 
-def load_initial_temperatures_description(
-    document: DescriptionDocument,
-) -> case_description.InitialTemperaturesDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_initial_temperatures_loader_plan() -> Dict[str, Callable]:
+    return {
         "position_input_type": get_enum_loader(enum_class=constants.TableInputType),
         "table_x": load_referenced_temperatures_container_description,
         "table_y": load_referenced_temperatures_container_description,
         "table_length": load_temperatures_container_description,
     }
+
+
+def load_initial_temperatures_description(
+    document: DescriptionDocument,
+) -> case_description.InitialTemperaturesDescription:
+    alfacase_to_case_description = _get_initial_temperatures_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.InitialTemperaturesDescription(**case_values)
 
@@ -768,15 +984,20 @@ load_volume_fractions_container_description = get_initial_conditions_table_loade
 )
 
 
-def load_initial_volume_fractions_description(
-    document: DescriptionDocument,
-) -> case_description.InitialVolumeFractionsDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_initial_volume_fractions_loader_plan() -> Dict[str, Callable]:
+    return {
         "position_input_type": get_enum_loader(enum_class=constants.TableInputType),
         "table_x": load_referenced_volume_fractions_container_description,
         "table_y": load_referenced_volume_fractions_container_description,
         "table_length": load_volume_fractions_container_description,
     }
+
+
+def load_initial_volume_fractions_description(
+    document: DescriptionDocument,
+) -> case_description.InitialVolumeFractionsDescription:
+    alfacase_to_case_description = _get_initial_volume_fractions_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.InitialVolumeFractionsDescription(**case_values)
 
@@ -797,15 +1018,20 @@ load_pressure_container_description = get_initial_conditions_table_loader(
 )
 
 
-def load_initial_pressures_description(
-    document: DescriptionDocument,
-) -> case_description.InitialPressuresDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_initial_pressures_loader_plan() -> Dict[str, Callable]:
+    return {
         "position_input_type": get_enum_loader(enum_class=constants.TableInputType),
         "table_x": load_referenced_pressure_container_description,
         "table_y": load_referenced_pressure_container_description,
         "table_length": load_pressure_container_description,
     }
+
+
+def load_initial_pressures_description(
+    document: DescriptionDocument,
+) -> case_description.InitialPressuresDescription:
+    alfacase_to_case_description = _get_initial_pressures_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.InitialPressuresDescription(**case_values)
 
@@ -828,23 +1054,27 @@ load_tracers_mass_fractions_container_description = (
 )
 
 
-def load_initial_tracers_mass_fractions_description(
-    document: DescriptionDocument,
-) -> case_description.InitialTracersMassFractionsDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_initial_tracers_mass_fractions_loader_plan() -> Dict[str, Callable]:
+    return {
         "position_input_type": get_enum_loader(enum_class=constants.TableInputType),
         "table_x": load_referenced_tracers_mass_fractions_container_description,
         "table_y": load_referenced_tracers_mass_fractions_container_description,
         "table_length": load_tracers_mass_fractions_container_description,
     }
+
+
+def load_initial_tracers_mass_fractions_description(
+    document: DescriptionDocument,
+) -> case_description.InitialTracersMassFractionsDescription:
+    alfacase_to_case_description = _get_initial_tracers_mass_fractions_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.InitialTracersMassFractionsDescription(**case_values)
 
 
-def load_initial_conditions_description(
-    document: DescriptionDocument,
-) -> case_description.InitialConditionsDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_initial_conditions_loader_plan() -> Dict[str, Callable]:
+    return {
         "velocities": load_initial_velocities_description,
         "temperatures": load_initial_temperatures_description,
         "volume_fractions": load_initial_volume_fractions_description,
@@ -852,6 +1082,12 @@ def load_initial_conditions_description(
         "tracers_mass_fractions": load_initial_tracers_mass_fractions_description,
         "fluid": load_value,
     }
+
+
+def load_initial_conditions_description(
+    document: DescriptionDocument,
+) -> case_description.InitialConditionsDescription:
+    alfacase_to_case_description = _get_initial_conditions_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.InitialConditionsDescription(**case_values)
 
@@ -872,15 +1108,20 @@ def _load_mass_source_common() -> Dict[str, Callable]:
     }
 
 
-def load_mass_source_equipment_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.MassSourceEquipmentDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_mass_source_equipment_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "position": get_scalar_loader(from_unit="m"),
         "material_above_filler": load_value,
+        **_load_mass_source_common(),
     }
-    alfacase_to_case_description.update(**_load_mass_source_common())
+
+
+def load_mass_source_equipment_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.MassSourceEquipmentDescription]:
+    alfacase_to_case_description = _get_mass_source_equipment_loader_plan()
 
     def generate_mass_source_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
@@ -894,10 +1135,9 @@ def load_mass_source_equipment_description(
     }
 
 
-def load_material_description(
-    document: DescriptionDocument,
-) -> List[case_description.MaterialDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_material_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "material_type": get_enum_loader(enum_class=constants.MaterialType),
         "density": get_scalar_loader(from_unit="kg/m3"),
@@ -909,6 +1149,12 @@ def load_material_description(
         "viscosity": get_scalar_loader(from_unit="cP"),
     }
 
+
+def load_material_description(
+    document: DescriptionDocument,
+) -> List[case_description.MaterialDescription]:
+    alfacase_to_case_description = _get_material_loader_plan()
+
     def generate_materials_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.MaterialDescription(**case_values)
@@ -919,32 +1165,48 @@ def load_material_description(
     ]
 
 
+@loader_plan
+def _get_internal_node_properties_loader_plan() -> Dict[str, Callable]:
+    return {"fluid": load_value}
+
+
 def load_internal_node_properties_description(
     document: DescriptionDocument,
 ) -> case_description.InternalNodePropertiesDescription:
-    alfacase_to_case_description = {"fluid": load_value}
+    alfacase_to_case_description = _get_internal_node_properties_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.InternalNodePropertiesDescription(**case_values)
 
 
+@loader_plan
+def _get_mass_source_node_properties_loader_plan() -> Dict[str, Callable]:
+    return _load_mass_source_common()
+
+
 def load_mass_source_node_properties_description(
     document: DescriptionDocument,
 ) -> case_description.MassSourceNodePropertiesDescription:
-    case_values = to_case_values(document, _load_mass_source_common())
+    case_values = to_case_values(
+        document, _get_mass_source_node_properties_loader_plan()
+    )
     return case_description.MassSourceNodePropertiesDescription(**case_values)
 
 
+@loader_plan
+def _get_pressure_node_properties_loader_plan() -> Dict[str, Callable]:
+    return _load_pressure_source_common()
+
+
 def load_pressure_node_properties_description(
     document: DescriptionDocument,
 ) -> case_description.PressureNodePropertiesDescription:
-    case_values = to_case_values(document, _load_pressure_source_common())
+    case_values = to_case_values(document, _get_pressure_node_properties_loader_plan())
     return case_description.PressureNodePropertiesDescription(**case_values)
 
 
-def load_separator_node_properties_description(
-    document: DescriptionDocument,
-) -> case_description.SeparatorNodePropertiesDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_separator_node_properties_loader_plan() -> Dict[str, Callable]:
+    return {
         "environment_temperature": get_scalar_loader(from_unit="K"),
         "geometry": get_enum_loader(enum_class=constants.SeparatorGeometryType),
         "length": get_scalar_loader(from_unit="m"),
@@ -955,14 +1217,19 @@ def load_separator_node_properties_description(
             category="volume fraction"
         ),
     }
+
+
+def load_separator_node_properties_description(
+    document: DescriptionDocument,
+) -> case_description.SeparatorNodePropertiesDescription:
+    alfacase_to_case_description = _get_separator_node_properties_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.SeparatorNodePropertiesDescription(**case_values)
 
 
-def load_node_description(
-    document: DescriptionDocument,
-) -> List[case_description.NodeDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_node_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "node_type": get_enum_loader(enum_class=constants.NodeCellType),
         "pvt_model": load_value,
@@ -972,6 +1239,12 @@ def load_node_description(
         "separator_properties": load_separator_node_properties_description,
     }
 
+
+def load_node_description(
+    document: DescriptionDocument,
+) -> List[case_description.NodeDescription]:
+    alfacase_to_case_description = _get_node_loader_plan()
+
     def generate_node_description(
         document: DescriptionDocument,
     ) -> case_description.NodeDescription:
@@ -983,26 +1256,36 @@ def load_node_description(
     ]
 
 
-def load_opening_curve_description(
-    document: DescriptionDocument,
-) -> case_description.OpeningCurveDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_opening_curve_loader_plan() -> Dict[str, Callable]:
+    return {
         "time": get_array_loader(from_unit="s"),
         "opening": get_array_loader(from_unit="-"),
     }
+
+
+def load_opening_curve_description(
+    document: DescriptionDocument,
+) -> case_description.OpeningCurveDescription:
+    alfacase_to_case_description = _get_opening_curve_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.OpeningCurveDescription(**case_values)
 
 
-def load_packer_description(
-    document: DescriptionDocument,
-) -> List[case_description.PackerDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_packer_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "position": get_scalar_loader(from_unit="m"),
         "material_above": load_value,
     }
 
+
+def load_packer_description(
+    document: DescriptionDocument,
+) -> List[case_description.PackerDescription]:
+    alfacase_to_case_description = _get_packer_loader_plan()
+
     def generate_packer_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.PackerDescription(**case_values)
@@ -1012,28 +1295,38 @@ def load_packer_description(
     ]
 
 
-def load_pipe_segments_description(
-    document: DescriptionDocument,
-) -> case_description.PipeSegmentsDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_pipe_segments_loader_plan() -> Dict[str, Callable]:
+    return {
         "start_positions": get_array_loader(from_unit="m"),
         "diameters": get_array_loader(from_unit="m"),
         "roughnesses": get_array_loader(from_unit="m"),
         "wall_names": load_value,
     }
+
+
+def load_pipe_segments_description(
+    document: DescriptionDocument,
+) -> case_description.PipeSegmentsDescription:
+    alfacase_to_case_description = _get_pipe_segments_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.PipeSegmentsDescription(**case_values)
 
 
-def load_profile_output_description(
-    document: DescriptionDocument,
-) -> List[case_description.ProfileOutputDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_profile_output_loader_plan() -> Dict[str, Callable]:
+    return {
         "curve_names": load_value,
         "element_name": load_value,
         "location": get_enum_loader(enum_class=constants.OutputAttachmentLocation),
     }
 
+
+def load_profile_output_description(
+    document: DescriptionDocument,
+) -> List[case_description.ProfileOutputDescription]:
+    alfacase_to_case_description = _get_profile_output_loader_plan()
+
     def generate_profile_definitions(
         document: DescriptionDocument,
     ) -> case_description.ProfileOutputDescription:
@@ -1046,15 +1339,20 @@ def load_profile_output_description(
     ]
 
 
-def load_linear_ipr_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.LinearIPRDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_linear_ipr_loader_plan() -> Dict[str, Callable]:
+    return {
         "well_index_phase": get_enum_loader(enum_class=constants.WellIndexPhaseType),
         "min_pressure_difference": get_scalar_loader(from_unit="Pa"),
         "well_index": get_scalar_loader(from_unit="m3/bar.d"),
     }
 
+
+def load_linear_ipr_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.LinearIPRDescription]:
+    alfacase_to_case_description = _get_linear_ipr_loader_plan()
+
     def generate_linear_ipr_correlation(value: DescriptionDocument):
         case_values = to_case_values(value, alfacase_to_case_description)
         return case_description.LinearIPRDescription(**case_values)
@@ -1067,25 +1365,35 @@ def load_linear_ipr_description(
     }
 
 
-def load_ipr_curve_description(
-    document: DescriptionDocument,
-) -> case_description.IPRCurveDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_ipr_curve_loader_plan() -> Dict[str, Callable]:
+    return {
         "pressure_difference": get_array_loader(from_unit="Pa"),
         "flow_rate": get_array_loader(from_unit="sm3/d"),
     }
+
+
+def load_ipr_curve_description(
+    document: DescriptionDocument,
+) -> case_description.IPRCurveDescription:
+    alfacase_to_case_description = _get_ipr_curve_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.IPRCurveDescription(**case_values)
 
 
-def load_table_ipr_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.LinearIPRDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_table_ipr_loader_plan() -> Dict[str, Callable]:
+    return {
         "well_index_phase": get_enum_loader(enum_class=constants.WellIndexPhaseType),
         "table": load_ipr_curve_description,
     }
 
+
+def load_table_ipr_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.LinearIPRDescription]:
+    alfacase_to_case_description = _get_table_ipr_loader_plan()
+
     def generate_table_ipr_correlation(value: DescriptionDocument):
         case_values = to_case_values(value, alfacase_to_case_description)
         return case_description.TableIPRDescription(**case_values)
@@ -1098,13 +1406,18 @@ def load_table_ipr_description(
     }
 
 
-def load_ipr_models_description(
-    document: DescriptionDocument,
-) -> case_description.IPRModelsDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_ipr_models_loader_plan() -> Dict[str, Callable]:
+    return {
         "linear_models": load_linear_ipr_description,
         "table_models": load_table_ipr_description,
     }
+
+
+def load_ipr_models_description(
+    document: DescriptionDocument,
+) -> case_description.IPRModelsDescription:
+    alfacase_to_case_description = _get_ipr_models_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.IPRModelsDescription(**case_values)
 
@@ -1124,10 +1437,9 @@ def _load_pressure_source_common() -> Dict[str, Callable]:
     }
 
 
-def load_reservoir_inflow_equipment_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.ReservoirInflowEquipmentDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_reservoir_inflow_equipment_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "fluid": load_value,
         "start": get_scalar_loader(from_unit="m"),
@@ -1137,8 +1449,14 @@ def load_reservoir_inflow_equipment_description(
         "productivity_ipr": load_value,
         "injectivity_ipr": load_value,
         "tracer_mass_fraction": get_array_loader(category="mass fraction"),
+        **_load_pressure_source_common(),
     }
-    alfacase_to_case_description.update(**_load_pressure_source_common())
+
+
+def load_reservoir_inflow_equipment_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.ReservoirInflowEquipmentDescription]:
+    alfacase_to_case_description = _get_reservoir_inflow_equipment_loader_plan()
 
     def generate_reservoir_inflow_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
@@ -1152,40 +1470,55 @@ def load_reservoir_inflow_equipment_description(
     }
 
 
-def load_speed_curve_description(
-    document: DescriptionDocument,
-) -> case_description.SpeedCurveDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_speed_curve_loader_plan() -> Dict[str, Callable]:
+    return {
         "time": get_array_loader(from_unit="s"),
         "speed": get_array_loader(from_unit="rpm"),
     }
+
+
+def load_speed_curve_description(
+    document: DescriptionDocument,
+) -> case_description.SpeedCurveDescription:
+    alfacase_to_case_description = _get_speed_curve_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.SpeedCurveDescription(**case_values)
 
 
-def load_table_pump_description(
-    document: DescriptionDocument,
-) -> case_description.TablePumpDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_table_pump_loader_plan() -> Dict[str, Callable]:
+    return {
         "speeds": get_array_loader(from_unit="rpm"),
         "void_fractions": get_array_loader(category="volume fraction"),
         "flow_rates": get_array_loader(category="volume flow rate"),
         "pressure_boosts": get_array_loader(from_unit="bar"),
     }
+
+
+def load_table_pump_description(
+    document: DescriptionDocument,
+) -> case_description.TablePumpDescription:
+    alfacase_to_case_description = _get_table_pump_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.TablePumpDescription(**case_values)
 
 
-def load_trend_output_description(
-    document: DescriptionDocument,
-) -> List[case_description.TrendOutputDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_trend_output_loader_plan() -> Dict[str, Callable]:
+    return {
         "curve_names": load_value,
         "location": get_enum_loader(enum_class=constants.OutputAttachmentLocation),
         "element_name": load_value,
         "position": get_scalar_loader(from_unit="m"),
     }
 
+
+def load_trend_output_description(
+    document: DescriptionDocument,
+) -> List[case_description.TrendOutputDescription]:
+    alfacase_to_case_description = _get_trend_output_loader_plan()
+
     def generate_trend_description(
         document: DescriptionDocument,
     ) -> case_description.TrendOutputDescription:
@@ -1197,10 +1530,9 @@ def load_trend_output_description(
     ]
 
 
-def load_tubing_description(
-    document: DescriptionDocument,
-) -> List[case_description.TubingDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_tubing_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "length": get_scalar_loader(from_unit="m"),
         "outer_diameter": get_scalar_loader(from_unit="m"),
@@ -1209,6 +1541,12 @@ def load_tubing_description(
         "material": load_value,
     }
 
+
+def load_tubing_description(
+    document: DescriptionDocument,
+) -> List[case_description.TubingDescription]:
+    alfacase_to_case_description = _get_tubing_loader_plan()
+
     def generate_tubings_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.TubingDescription(**case_values)
@@ -1219,15 +1557,20 @@ def load_tubing_description(
     ]
 
 
-def load_wall_layer_description(
-    document: DescriptionDocument,
-) -> List[case_description.WallLayerDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_wall_layer_loader_plan() -> Dict[str, Callable]:
+    return {
         "thickness": get_scalar_loader(from_unit="m"),
         "material_name": load_value,
         "has_annulus_flow": load_value,
     }
 
+
+def load_wall_layer_description(
+    document: DescriptionDocument,
+) -> List[case_description.WallLayerDescription]:
+    alfacase_to_case_description = _get_wall_layer_loader_plan()
+
     def generate_wall_layer_container_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.WallLayerDescription(**case_values)
@@ -1238,43 +1581,58 @@ def load_wall_layer_description(
     ]
 
 
-def load_annulus_description(
-    document: DescriptionDocument,
-) -> case_description.AnnulusDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_annulus_loader_plan() -> Dict[str, Callable]:
+    return {
         "has_annulus_flow": load_value,
         "pvt_model": load_value,
         "top_node": load_value,
         "initial_conditions": load_initial_conditions_description,
         "gas_lift_valve_equipment": load_gas_lift_valve_equipment_description,
     }
+
+
+def load_annulus_description(
+    document: DescriptionDocument,
+) -> case_description.AnnulusDescription:
+    alfacase_to_case_description = _get_annulus_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.AnnulusDescription(**case_values)
 
 
-def load_case_output_description(
-    document: DescriptionDocument,
-) -> case_description.CaseOutputDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_case_output_loader_plan() -> Dict[str, Callable]:
+    return {
         "profiles": load_profile_output_description,
         "trends": load_trend_output_description,
         "profile_frequency": get_scalar_loader(from_unit="s"),
         "trend_frequency": get_scalar_loader(from_unit="s"),
     }
+
+
+def load_case_output_description(
+    document: DescriptionDocument,
+) -> case_description.CaseOutputDescription:
+    alfacase_to_case_description = _get_case_output_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.CaseOutputDescription(**case_values)
 
 
-def load_open_hole_description(
-    document: DescriptionDocument,
-) -> List[case_description.OpenHoleDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_open_hole_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "length": get_scalar_loader(from_unit="m"),
         "diameter": get_scalar_loader(from_unit="m"),
         "inner_roughness": get_scalar_loader(from_unit="m"),
     }
 
+
+def load_open_hole_description(
+    document: DescriptionDocument,
+) -> List[case_description.OpenHoleDescription]:
+    alfacase_to_case_description = _get_open_hole_loader_plan()
+
     def generate_open_hole_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.OpenHoleDescription(**case_values)
@@ -1285,36 +1643,45 @@ def load_open_hole_description(
     ]
 
 
-def load_casing_description(
-    document: DescriptionDocument,
-) -> case_description.CasingDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_casing_loader_plan() -> Dict[str, Callable]:
+    return {
         "casing_sections": load_casing_section_description,
         "tubings": load_tubing_description,
         "packers": load_packer_description,
         "open_holes": load_open_hole_description,
     }
+
+
+def load_casing_description(
+    document: DescriptionDocument,
+) -> case_description.CasingDescription:
+    alfacase_to_case_description = _get_casing_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.CasingDescription(**case_values)
 
 
-def load_compressor_pressure_table_description(
-    document: DescriptionDocument,
-) -> case_description.CompressorPressureTableDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_compressor_pressure_table_loader_plan() -> Dict[str, Callable]:
+    return {
         "speed_entries": get_array_loader(from_unit="rpm"),
         "corrected_mass_flow_rate_entries": get_array_loader(from_unit="kg/s"),
         "pressure_ratio_table": get_array_loader(from_unit="-"),
         "isentropic_efficiency_table": get_array_loader(from_unit="-"),
     }
+
+
+def load_compressor_pressure_table_description(
+    document: DescriptionDocument,
+) -> case_description.CompressorPressureTableDescription:
+    alfacase_to_case_description = _get_compressor_pressure_table_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.CompressorPressureTableDescription(**case_values)
 
 
-def load_compressor_equipment_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.CompressorEquipmentDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_compressor_equipment_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "position": get_scalar_loader(from_unit="m"),
         "table": load_compressor_pressure_table_description,
@@ -1329,6 +1696,12 @@ def load_compressor_equipment_description(
         "flow_direction": get_enum_loader(enum_class=constants.FlowDirection),
     }
 
+
+def load_compressor_equipment_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.CompressorEquipmentDescription]:
+    alfacase_to_case_description = _get_compressor_equipment_loader_plan()
+
     def generate_compressor_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.CompressorEquipmentDescription(**case_values)
@@ -1341,10 +1714,9 @@ def load_compressor_equipment_description(
     }
 
 
-def load_environment_description(
-    document: DescriptionDocument,
-) -> case_description.EnvironmentDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_environment_loader_plan() -> Dict[str, Callable]:
+    return {
         "thermal_model": get_enum_loader(enum_class=constants.PipeThermalModelType),
         "position_input_mode": get_enum_loader(
             enum_class=constants.PipeThermalPositionInput
@@ -1353,25 +1725,35 @@ def load_environment_description(
         "md_properties_table": load_environment_property_description,
         "tvd_properties_table": load_environment_property_description,
     }
+
+
+def load_environment_description(
+    document: DescriptionDocument,
+) -> case_description.EnvironmentDescription:
+    alfacase_to_case_description = _get_environment_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.EnvironmentDescription(**case_values)
 
 
-def load_formation_description(
-    document: DescriptionDocument,
-) -> case_description.FormationDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_formation_loader_plan() -> Dict[str, Callable]:
+    return {
         "reference_y_coordinate": get_scalar_loader(from_unit="m"),
         "layers": load_formation_layer_description,
     }
+
+
+def load_formation_description(
+    document: DescriptionDocument,
+) -> case_description.FormationDescription:
+    alfacase_to_case_description = _get_formation_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.FormationDescription(**case_values)
 
 
-def load_pump_equipment_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.PumpEquipmentDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_pump_equipment_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "position": get_scalar_loader(from_unit="m"),
         "type": get_enum_loader(enum_class=constants.PumpType),
@@ -1385,6 +1767,12 @@ def load_pump_equipment_description(
         "flow_direction": get_enum_loader(enum_class=constants.FlowDirection),
     }
 
+
+def load_pump_equipment_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.PumpEquipmentDescription]:
+    alfacase_to_case_description = _get_pump_equipment_loader_plan()
+
     def generate_pump_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.PumpEquipmentDescription(**case_values)
@@ -1397,10 +1785,9 @@ def load_pump_equipment_description(
     }
 
 
-def load_valve_equipment_description(
-    document: DescriptionDocument,
-) -> Dict[str, case_description.ValveEquipmentDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_valve_equipment_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "position": get_scalar_loader(from_unit="m"),
         "type": get_enum_loader(enum_class=constants.ValveType),
@@ -1415,6 +1802,12 @@ def load_valve_equipment_description(
         "flow_direction": get_enum_loader(enum_class=constants.FlowDirection),
     }
 
+
+def load_valve_equipment_description(
+    document: DescriptionDocument,
+) -> Dict[str, case_description.ValveEquipmentDescription]:
+    alfacase_to_case_description = _get_valve_equipment_loader_plan()
+
     def generate_valve_description(document: DescriptionDocument):
 
         case_values = to_case_values(document, alfacase_to_case_description)
@@ -1428,15 +1821,20 @@ def load_valve_equipment_description(
     }
 
 
-def load_wall_description(
-    document: DescriptionDocument,
-) -> List[case_description.WallDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_wall_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "inner_roughness": get_scalar_loader(from_unit="m"),
         "wall_layer_container": load_wall_layer_description,
     }
 
+
+def load_wall_description(
+    document: DescriptionDocument,
+) -> List[case_description.WallDescription]:
+    alfacase_to_case_description = _get_wall_loader_plan()
+
     def generate_walls_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.WallDescription(**case_values)
@@ -1446,10 +1844,9 @@ def load_wall_description(
     ]
 
 
-def load_equipment_description(
-    document: DescriptionDocument,
-) -> case_description.EquipmentDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_equipment_loader_plan() -> Dict[str, Callable]:
+    return {
         "mass_sources": load_mass_source_equipment_description,
         "pumps": load_pump_equipment_description,
         "valves": load_valve_equipment_description,
@@ -1457,48 +1854,68 @@ def load_equipment_description(
         "heat_sources": load_heat_source_equipment_description,
         "compressors": load_compressor_equipment_description,
     }
+
+
+def load_equipment_description(
+    document: DescriptionDocument,
+) -> case_description.EquipmentDescription:
+    alfacase_to_case_description = _get_equipment_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.EquipmentDescription(**case_values)
 
 
-def load_x_and_y_description(
-    document: DescriptionDocument,
-) -> case_description.XAndYDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_x_and_y_loader_plan() -> Dict[str, Callable]:
+    return {
         "x": get_array_loader(from_unit="m"),
         "y": get_array_loader(from_unit="m"),
     }
+
+
+def load_x_and_y_description(
+    document: DescriptionDocument,
+) -> case_description.XAndYDescription:
+    alfacase_to_case_description = _get_x_and_y_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.XAndYDescription(**case_values)
 
 
-def load_length_and_elevation_description(
-    document: DescriptionDocument,
-) -> case_description.LengthAndElevationDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_length_and_elevation_loader_plan() -> Dict[str, Callable]:
+    return {
         "length": get_array_loader(from_unit="m"),
         "elevation": get_array_loader(from_unit="m"),
     }
+
+
+def load_length_and_elevation_description(
+    document: DescriptionDocument,
+) -> case_description.LengthAndElevationDescription:
+    alfacase_to_case_description = _get_length_and_elevation_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.LengthAndElevationDescription(**case_values)
 
 
-def load_profile_description(
-    document: DescriptionDocument,
-) -> case_description.ProfileDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_profile_loader_plan() -> Dict[str, Callable]:
+    return {
         "x_and_y": load_x_and_y_description,
         "length_and_elevation": load_length_and_elevation_description,
     }
+
+
+def load_profile_description(
+    document: DescriptionDocument,
+) -> case_description.ProfileDescription:
+    alfacase_to_case_description = _get_profile_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.ProfileDescription(**case_values)
 
 
-def load_pipe_description(
-    document: DescriptionDocument,
-) -> List[case_description.PipeDescription]:
+@loader_plan
+def _get_pipe_loader_plan() -> Dict[str, Callable]:
     # fmt: off
-    alfacase_to_case_description = {
+    return {
         "environment": load_environment_description,
         "equipment": load_equipment_description,
         "initial_conditions": load_initial_conditions_description,
@@ -1512,6 +1929,13 @@ def load_pipe_description(
         "target_port": get_enum_loader(enum_class=constants.WellConnectionPort),
     }
     # fmt: on
+
+
+def load_pipe_description(
+    document: DescriptionDocument,
+) -> List[case_description.PipeDescription]:
+    alfacase_to_case_description = _get_pipe_loader_plan()
+
     def generate_pipes_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.PipeDescription(**case_values)
@@ -1521,10 +1945,9 @@ def load_pipe_description(
     ]
 
 
-def load_well_description(
-    document: DescriptionDocument,
-) -> List[case_description.WellDescription]:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_well_loader_plan() -> Dict[str, Callable]:
+    return {
         "name": load_value,
         "pvt_model": load_value,
         "stagnant_fluid": load_value,
@@ -1539,6 +1962,12 @@ def load_well_description(
         "formation": load_formation_description,
     }
 
+
+def load_well_description(
+    document: DescriptionDocument,
+) -> List[case_description.WellDescription]:
+    alfacase_to_case_description = _get_well_loader_plan()
+
     def generate_wells_description(document: DescriptionDocument):
         case_values = to_case_values(document, alfacase_to_case_description)
         return case_description.WellDescription(**case_values)
@@ -1548,11 +1977,10 @@ def load_well_description(
     ]
 
 
-def load_physics_description(
-    document: DescriptionDocument,
-) -> case_description.PhysicsDescription:
+@loader_plan
+def _get_physics_loader_plan() -> Dict[str, Callable]:
     # fmt: off
-    alfacase_to_case_description = {
+    return {
         'hydrodynamic_model': get_enum_loader(enum_class=constants.HydrodynamicModelType),
         'simulation_regime': get_enum_loader(enum_class=constants.SimulationRegimeType),
         'energy_model': get_enum_loader(enum_class=constants.EnergyModel),
@@ -1565,13 +1993,20 @@ def load_physics_description(
         'correlations_package': get_enum_loader(enum_class=constants.CorrelationPackageType),
     }
     # fmt: on
+
+
+def load_physics_description(
+    document: DescriptionDocument,
+) -> case_description.PhysicsDescription:
+    alfacase_to_case_description = _get_physics_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.PhysicsDescription(**case_values)
 
 
 # fmt: off
-def load_numerical_options_description(document: DescriptionDocument) -> case_description.NumericalOptionsDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_numerical_options_loader_plan() -> Dict[str, Callable]:
+    return {
         'tolerance': load_value,
         'maximum_iterations': load_value,
         'maximum_timestep_change_factor': load_value,
@@ -1586,15 +2021,18 @@ def load_numerical_options_description(document: DescriptionDocument) -> case_de
         'caching_atol': load_value,
         'always_repeat_timestep': load_value,
     }
+
+
+def load_numerical_options_description(document: DescriptionDocument) -> case_description.NumericalOptionsDescription:
+    alfacase_to_case_description = _get_numerical_options_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.NumericalOptionsDescription(**case_values)
 # fmt: on
 
 # fmt: off
-def load_time_options_description(
-    document: DescriptionDocument
-) -> case_description.TimeOptionsDescription:
-    alfacase_to_case_description = {
+@loader_plan
+def _get_time_options_loader_plan() -> Dict[str, Callable]:
+    return {
         "stop_on_steady_state": load_value,
         "initial_time": get_scalar_loader(from_unit="h"),
         "final_time": get_scalar_loader(from_unit="h"),
@@ -1604,6 +2042,12 @@ def load_time_options_description(
         "restart_autosave_frequency": get_scalar_loader(from_unit="h"),
         "minimum_time_for_steady_state_stop": get_scalar_loader(from_unit="s"),
     }
+
+
+def load_time_options_description(
+    document: DescriptionDocument
+) -> case_description.TimeOptionsDescription:
+    alfacase_to_case_description = _get_time_options_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.TimeOptionsDescription(**case_values)
 
@@ -1611,12 +2055,17 @@ def load_time_options_description(
 # fmt: on
 
 
+@loader_plan
+def _get_tracer_model_constant_coefficients_loader_plan() -> Dict[str, Callable]:
+    return {
+        "partition_coefficients": get_dict_with_scalar_loader(category="mass fraction")
+    }
+
+
 def load_tracer_model_constant_coefficients_description(
     document: DescriptionDocument,
 ) -> Dict[str, case_description.TracerModelConstantCoefficientsDescription]:
-    alfacase_to_case_description = {
-        "partition_coefficients": get_dict_with_scalar_loader(category="mass fraction")
-    }
+    alfacase_to_case_description = _get_tracer_model_constant_coefficients_loader_plan()
 
     def generate_tracer_model_constant_coefficients_description(
         value: DescriptionDocument,
@@ -1634,21 +2083,25 @@ def load_tracer_model_constant_coefficients_description(
     }
 
 
+@loader_plan
+def _get_tracers_loader_plan() -> Dict[str, Callable]:
+    return {
+        "constant_coefficients": load_tracer_model_constant_coefficients_description
+    }
+
+
 def load_tracers_description(
     document: DescriptionDocument,
 ) -> case_description.TracersDescription:
-    alfacase_to_case_description = {
-        "constant_coefficients": load_tracer_model_constant_coefficients_description
-    }
+    alfacase_to_case_description = _get_tracers_loader_plan()
     case_values = to_case_values(document, alfacase_to_case_description)
     return case_description.TracersDescription(**case_values)
 
 
-def load_case_description(
-    document: DescriptionDocument,
-) -> case_description.CaseDescription:
+@loader_plan
+def _get_case_loader_plan() -> Dict[str, Callable]:
     # fmt: off
-    alfacase_to_case_description = {
+    return {
         'physics': load_physics_description,
         'numerical_options': load_numerical_options_description,
         'time_options': load_time_options_description,
@@ -1668,5 +2121,102 @@ def load_case_description(
         'wells': load_well_description,
     }
     # fmt: on
-    case_values = to_case_values(document, alfacase_to_case_description)
+
+
+# Sections from CaseDescription with independent elements, which can be loaded in parallel.
+PARALLEL_SECTIONS = ("materials", "nodes", "pipes", "wells")
+
+
+def _load_section_chunk(
+    loader_function: Callable, data: List[Any], file_path: Path
+) -> bytes:
+    """
+    Load a slice of the elements from a section, executed on the worker processes.
+
+    The result is returned already pickled since barril's Array is not supported by the default pickler.
+    """
+    from alfasim_sdk._internal.alfacase.compiled_schema import CompiledYAML
+    from alfasim_sdk._internal.alfacase.description_cache import dumps_description
+
+    return dumps_description(
+        loader_function(DescriptionDocument(CompiledYAML(data), file_path))
+    )
+
+
+def submit_parallel_sections(
+    executor: concurrent.futures.Executor, document: DescriptionDocument, workers: int
+) -> Dict[str, List[concurrent.futures.Future]]:
+    """
+    Submit the loading of the elements from the `PARALLEL_SECTIONS` of the given document to the
+    executor, return the futures (in document order) for each section found on the document.
+
+    Only the validated data (``content.data``) is sent to the workers, so this works with documents
+    loaded with strictyaml or with the compiled schema.
+    """
+    loaders = {entry.key: entry.loader for entry in _get_case_loader_plan()}
+    # Use a few chunks per worker to balance sections with elements of different sizes.
+    chunk_count = workers * 4
+    futures = {}
+    for section in PARALLEL_SECTIONS:
+        if section not in document:
+            continue
+        data = document[section].content.data
+        chunk_size = max(1, -(-len(data) // chunk_count))
+        futures[section] = [
+            executor.submit(
+                _load_section_chunk,
+                loaders[section],
+                data[start : start + chunk_size],
+                document.file_path,
+            )
+            for start in range(0, len(data), chunk_size)
+        ]
+    return futures
+
+
+def collect_parallel_sections(
+    futures: Dict[str, List[concurrent.futures.Future]]
+) -> Dict[str, List[Any]]:
+    """
+    Merge the results from `submit_parallel_sections`, keeping the document order.
+    """
+    import pickle
+
+    return {
+        section: [
+            element
+            for future in section_futures
+            for element in pickle.loads(future.result())
+        ]
+        for section, section_futures in futures.items()
+    }
+
+
+def load_case_description(
+    document: DescriptionDocument, *, workers: int = 1
+) -> case_description.CaseDescription:
+    """
+    :param workers:
+        When greater than 1, the elements from `PARALLEL_SECTIONS` are loaded using a pool of processes,
+        while the other sections are loaded by the current process.
+    """
+    alfacase_to_case_description = _get_case_loader_plan()
+    if workers <= 1:
+        case_values = to_case_values(document, alfacase_to_case_description)
+        return case_description.CaseDescription(**case_values)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = submit_parallel_sections(executor, document, workers)
+        case_values = to_case_values(
+            document,
+            tuple(
+                entry
+                for entry in alfacase_to_case_description
+                if entry.key not in futures
+            ),
+        )
+        case_values.update(collect_parallel_sections(futures))
+
     return case_description.CaseDescription(**case_values)
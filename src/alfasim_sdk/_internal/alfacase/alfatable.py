@@ -1,65 +1,249 @@
+import json
+import struct
 from pathlib import Path
+from typing import Any
+from typing import Dict
 
 from alfasim_sdk._internal.alfacase import case_description
 from alfasim_sdk._internal.alfacase.alfacase_to_case import get_category_for
 
 
-def generate_alfatable_file(alfacase_file, alfatable_filename, description):
+# Binary alfatable files start with this signature, followed by the format version (uint8),
+# the size of the header (uint32) and the header itself (JSON with the attributes that are not
+# arrays). The values start at an offset aligned with `_BINARY_ALIGNMENT` bytes, in a single
+# contiguous block of little-endian float64: pressure values, temperature values and then each
+# one of the table variables (usually with one value for each pressure and temperature pair).
+# The table variables are stored as float32 instead when the description has float32 values,
+# using the version 2 of the format (with ``variables_dtype`` on the header), so readers that only
+# know the version 1 reject the file instead of reading the values as float64.
+BINARY_ALFATABLE_SIGNATURE = b"\x93ALFATABLE"
+_BINARY_ALFATABLE_VERSION = 1
+_BINARY_ALFATABLE_VARIABLES_DTYPE_VERSION = 2
+_BINARY_PREFIX = struct.Struct("<BI")
+_BINARY_ALIGNMENT = 64
+_BINARY_DTYPE = "<f8"
+_BINARY_FLOAT32_DTYPE = "<f4"
+
+_STD_PROPERTIES_AND_UNITS = {
+    "pressure_std": "bar",
+    "temperature_std": "degC",
+    "gas_density_std": "kg/m3",
+    "oil_density_std": "kg/m3",
+    "water_density_std": "kg/m3",
+    "gas_oil_ratio": "sm3/sm3",
+    "gas_liquid_ratio": "sm3/sm3",
+    "water_cut": "-",
+    "total_water_fraction": "-",
+}
+
+
+def generate_alfatable_file(
+    alfacase_file, alfatable_filename, description, *, binary: bool = False
+):
     """
     Create `.alfatable` file for the given description.
+
+    :param binary:
+        Write the file in the binary format instead of YAML, where the values of the table are
+        stored in a single contiguous block which is memory-mapped when the file is loaded.
     """
     from boltons.strutils import slugify
 
     from alfasim_sdk import convert_description_to_alfacase
 
-    alfatable_content = convert_description_to_alfacase(
-        description, enable_flow_style_on_numpy=True
-    )
     alfatable_file = (
         alfacase_file.parent
         / f"{alfacase_file.stem}.{slugify(alfatable_filename)}.alfatable"
     )
+    if binary:
+        _write_binary_alfatable(alfatable_file, description)
+        return alfatable_file
+
+    alfatable_content = convert_description_to_alfacase(
+        description, enable_flow_style_on_numpy=True
+    )
     alfatable_file.write_text(alfatable_content, encoding="utf-8")
     return alfatable_file
 
 
+def is_binary_alfatable(file_path) -> bool:
+    """
+    Return if the given alfatable file is in the binary format.
+    """
+    with open(file_path, "rb") as file:
+        return file.read(len(BINARY_ALFATABLE_SIGNATURE)) == BINARY_ALFATABLE_SIGNATURE
+
+
+def _write_binary_alfatable(
+    file_path: Path, description: case_description.PvtModelTableParametersDescription
+) -> None:
+    import numpy as np
+
+    from alfasim_sdk._internal.alfacase.case_description_attributes import (
+        get_contiguous_block,
+    )
+
+    variables_size = {len(values) for values in description.table_variables}
+    if len(variables_size) > 1:
+        raise ValueError(
+            f"All table variables must have the same size to be stored in a binary alfatable, got sizes {sorted(variables_size)}"
+        )
+    is_float32 = len(description.table_variables) > 0 and all(
+        np.asarray(values).dtype == np.float32 for values in description.table_variables
+    )
+    variables_dtype = _BINARY_FLOAT32_DTYPE if is_float32 else _BINARY_DTYPE
+    table_variables = get_contiguous_block(description.table_variables)
+    if table_variables is None:
+        table_variables = [
+            np.asarray(values, dtype=variables_dtype)
+            for values in description.table_variables
+        ]
+    else:
+        # Written with a single call when the table is already stored in a contiguous block.
+        table_variables = [np.ascontiguousarray(table_variables, dtype=variables_dtype)]
+
+    header = {
+        "pressure_size": len(description.pressure_values),
+        "temperature_size": len(description.temperature_values),
+        "variables_count": len(description.table_variables),
+        "variables_size": variables_size.pop() if variables_size else 0,
+        "variable_names": list(description.variable_names),
+        "label": description.label,
+        "number_of_phases": description.number_of_phases,
+        "warn_when_outside": description.warn_when_outside,
+    }
+    for key in _STD_PROPERTIES_AND_UNITS:
+        scalar = getattr(description, key)
+        header[key] = {"value": scalar.GetValue(), "unit": scalar.GetUnit()}
+    if is_float32:
+        version = _BINARY_ALFATABLE_VARIABLES_DTYPE_VERSION
+        header["variables_dtype"] = variables_dtype
+    else:
+        version = _BINARY_ALFATABLE_VERSION
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    prefix_size = len(BINARY_ALFATABLE_SIGNATURE) + _BINARY_PREFIX.size
+    padding = -(prefix_size + len(header_bytes)) % _BINARY_ALIGNMENT
+    header_bytes += b" " * padding
+
+    with open(file_path, "wb") as file:
+        file.write(BINARY_ALFATABLE_SIGNATURE)
+        file.write(_BINARY_PREFIX.pack(version, len(header_bytes)))
+        file.write(header_bytes)
+        file.write(np.asarray(description.pressure_values, _BINARY_DTYPE).tobytes())
+        file.write(np.asarray(description.temperature_values, _BINARY_DTYPE).tobytes())
+        for values in table_variables:
+            file.write(memoryview(values).cast("B"))
+
+
+def _load_binary_alfatable_content(file_path) -> Dict[str, Any]:
+    """
+    Return the content of a binary alfatable, with the values memory-mapped (read-only).
+    """
+    import numpy as np
+
+    with open(file_path, "rb") as file:
+        signature = file.read(len(BINARY_ALFATABLE_SIGNATURE))
+        if signature != BINARY_ALFATABLE_SIGNATURE:
+            raise RuntimeError(f"Not a binary alfatable file: {file_path}")
+        version, header_size = _BINARY_PREFIX.unpack(file.read(_BINARY_PREFIX.size))
+        if version not in (
+            _BINARY_ALFATABLE_VERSION,
+            _BINARY_ALFATABLE_VARIABLES_DTYPE_VERSION,
+        ):
+            raise RuntimeError(
+                f"Unsupported binary alfatable version {version} on {file_path}"
+            )
+        content = json.loads(file.read(header_size).decode("utf-8"))
+
+    pressure_size = content.pop("pressure_size")
+    temperature_size = content.pop("temperature_size")
+    variables_count = content.pop("variables_count")
+    variables_size = content.pop("variables_size")
+    if version == _BINARY_ALFATABLE_VERSION:
+        variables_dtype = _BINARY_DTYPE
+    else:
+        variables_dtype = content.pop("variables_dtype")
+    if variables_dtype not in (_BINARY_DTYPE, _BINARY_FLOAT32_DTYPE):
+        raise RuntimeError(
+            f"Unsupported binary alfatable values type {variables_dtype} on {file_path}"
+        )
+
+    def map_values(offset: int, dtype: str, size: int):
+        if size == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(file_path, dtype=dtype, mode="r", offset=offset, shape=(size,))
+
+    offset = len(BINARY_ALFATABLE_SIGNATURE) + _BINARY_PREFIX.size + header_size
+    grid_size = pressure_size + temperature_size
+    grid = map_values(offset, _BINARY_DTYPE, grid_size)
+    table = map_values(
+        offset + grid_size * np.dtype(_BINARY_DTYPE).itemsize,
+        variables_dtype,
+        variables_count * variables_size,
+    )
+    content["pressure_values"] = grid[:pressure_size]
+    content["temperature_values"] = grid[pressure_size:]
+    content["table_variables"] = list(table.reshape(variables_count, variables_size))
+    return content
+
+
 def load_pvt_model_table_parameters_description_from_alfatable(
     file_path,
 ) -> case_description.PvtModelTableParametersDescription:
     """
     Load the content from the alfatable in the given file_path. The validation is turned off due to performance issues.
+
+    Binary alfatable files (see `generate_alfatable_file`) are memory-mapped, so the values are only
+    read when used and the same file can be shared read-only by several processes.
     """
     from ruamel import yaml as ruamelyaml
     from barril.units import Scalar
     import numpy as np
 
+    if is_binary_alfatable(file_path):
+        content = _load_binary_alfatable_content(file_path)
+        table_parameter_keys_and_scalars = {
+            key: Scalar(
+                get_category_for(unit), content[key]["value"], content[key]["unit"]
+            )
+            for key, unit in _STD_PROPERTIES_AND_UNITS.items()
+        }
+        return case_description.PvtModelTableParametersDescription(
+            pressure_values=content["pressure_values"],
+            temperature_values=content["temperature_values"],
+            table_variables=content["table_variables"],
+            variable_names=content["variable_names"],
+            label=content["label"],
+            number_of_phases=content["number_of_phases"],
+            warn_when_outside=content["warn_when_outside"],
+            **table_parameter_keys_and_scalars,
+        )
+
     content = ruamelyaml.safe_load(Path(file_path).read_text(encoding="UTF-8"))
 
     table_parameter_keys_and_values = {
         "pressure_values": np.array(content["pressure_values"]),
         "temperature_values": np.array(content["temperature_values"]),
-        "table_variables": [np.array(value) for value in content["table_variables"]],
+        "table_variables": _to_table_variables(content["table_variables"]),
         "variable_names": content["variable_names"],
         "label": content.get("label", None),
         "number_of_phases": content["number_of_phases"],
         "warn_when_outside": content["warn_when_outside"],
     }
-    key_and_unit = {
-        "pressure_std": "bar",
-        "temperature_std": "degC",
-        "gas_density_std": "kg/m3",
-        "oil_density_std": "kg/m3",
-        "water_density_std": "kg/m3",
-        "gas_oil_ratio": "sm3/sm3",
-        "gas_liquid_ratio": "sm3/sm3",
-        "water_cut": "-",
-        "total_water_fraction": "-",
-    }
-
     table_parameter_keys_and_scalars = {
         key: Scalar(get_category_for(unit), content[key]["value"], content[key]["unit"])
-        for key, unit in key_and_unit.items()
+        for key, unit in _STD_PROPERTIES_AND_UNITS.items()
     }
     return case_description.PvtModelTableParametersDescription(
         **table_parameter_keys_and_values, **table_parameter_keys_and_scalars
     )
+
+
+def _to_table_variables(values):
+    import numpy as np
+
+    if len({len(i) for i in values}) == 1:
+        # Same size for all variables, create the contiguous block directly.
+        return list(np.array(values))
+    return [np.array(i) for i in values]
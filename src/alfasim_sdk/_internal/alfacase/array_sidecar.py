@@ -0,0 +1,107 @@
+"""
+Storage of the values of big arrays in ``.npy`` files next to the alfacase file (sidecars).
+
+The alfacase file keeps only the name of the sidecar in place of the values::
+
+    x:
+      values: mycase.3f0c1a2b4d5e6f70.npy
+      unit: m
+
+Sidecars are named after the alfacase file and a hash of their contents, so arrays with the
+same values share a single file.
+"""
+import hashlib
+from pathlib import Path
+from typing import Optional
+from typing import Set
+
+import attr
+import numpy as np
+from attr.validators import instance_of
+
+
+ARRAY_SIDECAR_SUFFIX = ".npy"
+
+
+@attr.s
+class ArraySidecarWriter:
+    """
+    Write the values of arrays with at least ``threshold`` elements to sidecar files.
+
+    :ivar alfacase_file:
+        The alfacase file being generated, the sidecars are created on the same directory.
+    :ivar threshold:
+        Minimum number of elements for an array to be written to a sidecar file.
+    """
+
+    alfacase_file: Path = attr.ib(converter=Path)
+    threshold: int = attr.ib(validator=instance_of(int))
+    _written_files: Set[Path] = attr.ib(factory=set, init=False)
+
+    def __call__(self, values: np.ndarray) -> Optional[str]:
+        """
+        Write the given values to a sidecar file, returning its name (relative to the alfacase
+        file), or ``None`` if the array is too small and should be written inline.
+        """
+        if len(values) < self.threshold:
+            return None
+
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        digest = hashlib.sha1(values.tobytes()).hexdigest()[:16]
+        sidecar_file = (
+            self.alfacase_file.parent
+            / f"{self.alfacase_file.stem}.{digest}{ARRAY_SIDECAR_SUFFIX}"
+        )
+        if sidecar_file not in self._written_files:
+            np.save(str(sidecar_file), values, allow_pickle=False)
+            self._written_files.add(sidecar_file)
+        return sidecar_file.name
+
+
+def get_array_sidecar_file(directory: Path, name: str) -> Path:
+    """
+    Return the sidecar file with the given name (as written on an alfacase file) on the directory
+    of the alfacase file.
+
+    Only plain ``.npy`` file names are accepted, so alfacase files can't refer to files outside
+    of their directory.
+
+    :raises RuntimeError:
+        If the name is not a ``.npy`` file name or the file is not on the directory.
+    """
+    directory = Path(directory)
+    is_file_name = (
+        name not in ("", ".", "..")
+        and "/" not in name
+        and "\\" not in name
+        and Path(name).name == name
+        and not Path(name).is_absolute()
+    )
+    if not is_file_name or not name.endswith(ARRAY_SIDECAR_SUFFIX):
+        raise RuntimeError(
+            f"Invalid array file {name!r}, expected the name of a {ARRAY_SIDECAR_SUFFIX} file"
+            f" on {str(directory)}"
+        )
+    file_path = directory / name
+    if file_path.resolve().parent != directory.resolve():
+        raise RuntimeError(f"The array file {name} must be placed on {str(directory)}")
+    return file_path
+
+
+def load_array_sidecar(file_path: Path) -> np.ndarray:
+    """
+    Return the values stored on the given sidecar file, memory-mapped (read-only) so big arrays
+    are not read until needed.
+    """
+    if not file_path.is_file():
+        raise RuntimeError(
+            f"The array file {file_path.name} must be placed on {str(file_path.parent)}"
+        )
+    values = np.load(str(file_path), mmap_mode="r", allow_pickle=False)
+    if values.ndim != 1:
+        raise RuntimeError(
+            f"The array file {file_path.name} must contain a 1-dimensional array, found {values.ndim} dimensions"
+        )
+    if values.dtype != np.float64:
+        values = np.ascontiguousarray(values, dtype=np.float64)
+    return values
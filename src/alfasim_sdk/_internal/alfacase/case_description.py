@@ -1,11 +1,14 @@
+import hashlib
+import json
 from numbers import Number
 from pathlib import Path
+from typing import Any
 from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
-from typing import Set
 from typing import Tuple
+from typing import TYPE_CHECKING
 from typing import Union
 
 import attr
@@ -25,13 +28,20 @@ from .case_description_attributes import collapse_array_repr
 from .case_description_attributes import dict_of
 from .case_description_attributes import dict_of_array
 from .case_description_attributes import dict_with_scalar
+from .case_description_attributes import get_contiguous_block
 from .case_description_attributes import InvalidReferenceError
 from .case_description_attributes import list_of_strings
 from .case_description_attributes import Numpy1DArray
 from .case_description_attributes import numpy_array_validator
 from .case_description_attributes import PhaseName
+from .case_description_attributes import to_contiguous_arrays
+from .object_cache import ObjectCache
 from alfasim_sdk._internal import constants
 
+if TYPE_CHECKING:
+    from .environment_properties import EnvironmentPropertyTable
+    from .profile_geometry import ProfileGeometry
+
 
 @attr.s(frozen=True, slots=True)
 class PluginDescription:
@@ -909,6 +919,15 @@ class LengthAndElevationDescription:
         for length, elevation in zip(length_values, elevation_values):
             yield (length, self.length.unit), (elevation, self.elevation.unit)
 
+    def get_geometry(self) -> "ProfileGeometry":
+        """
+        Return the geometry of the profile as numpy arrays (see `ProfileGeometry`), created only
+        once for each description.
+        """
+        from .profile_geometry import get_profile_geometry
+
+        return get_profile_geometry(self)
+
 
 @attr.s(frozen=True, slots=True)
 class XAndYDescription:
@@ -930,6 +949,15 @@ class XAndYDescription:
         for x, y in zip(self.x.GetValues(self.x.unit), self.y.GetValues(self.y.unit)):
             yield (x, self.x.unit), (y, self.y.unit)
 
+    def get_geometry(self) -> "ProfileGeometry":
+        """
+        Return the geometry of the profile as numpy arrays (see `ProfileGeometry`), created only
+        once for each description.
+        """
+        from .profile_geometry import get_profile_geometry
+
+        return get_profile_geometry(self)
+
 
 @attr.s()
 class ProfileDescription:
@@ -962,6 +990,17 @@ class ProfileDescription:
             )
             raise ValueError(msg)
 
+    def get_geometry(self) -> "ProfileGeometry":
+        """
+        Return the geometry of the profile, from either x_and_y or length_and_elevation.
+        """
+        profile = self.x_and_y or self.length_and_elevation
+        if profile is None:
+            raise ValueError(
+                "The profile has neither x_and_y nor length_and_elevation defined"
+            )
+        return profile.get_geometry()
+
 
 @attr.s()
 class EquipmentDescription:
@@ -1017,6 +1056,15 @@ class EnvironmentDescription:
         else:
             return self.tvd_properties_table
 
+    def get_property_table(self) -> "EnvironmentPropertyTable":
+        """
+        Return the properties of the environment as numpy arrays sorted by position (see
+        `EnvironmentPropertyTable`), created only once for each description.
+        """
+        from .environment_properties import get_environment_property_table
+
+        return get_environment_property_table(self)
+
 
 @attr.s(slots=True)
 class PipeDescription:
@@ -1510,6 +1558,9 @@ class PvtModelTableParametersDescription:
         List of array like values for each property such as densities, specific heats,
         enthalpies, etc.
 
+        Arrays with the same size and dtype are stored as rows of a single contiguous array,
+        see `table_values`.
+
     :ivar List[str] variable_names:
         List of property names
 
@@ -1527,6 +1578,7 @@ class PvtModelTableParametersDescription:
         validator=numpy_array_validator(dimension=1), repr=collapse_array_repr
     )
     table_variables: List[Numpy1DArray] = attr.ib(
+        converter=to_contiguous_arrays,
         validator=numpy_array_validator(dimension=1, is_list=True),
         repr=collapse_array_repr,
     )
@@ -1588,6 +1640,40 @@ class PvtModelTableParametersDescription:
     def temperature_unit(self):
         return "K"
 
+    @property
+    def table_values(self) -> np.ndarray:
+        """
+        The table variables as a single contiguous array with shape
+        ``(number of variables, number of pressures, number of temperatures)``.
+
+        The elements of `table_variables` are views of this array, so no values are copied (unless
+        `table_variables` was replaced after the creation of the description, in which case a new
+        array with a copy of the values is returned).
+        """
+        block = get_contiguous_block(self.table_variables)
+        if block is None and self.table_variables:
+            block = get_contiguous_block(
+                to_contiguous_arrays(list(self.table_variables))
+            )
+            if block is None:
+                raise ValueError(
+                    "The table variables must be 1-D arrays with the same size and dtype"
+                )
+
+        shape = (
+            len(self.table_variables),
+            len(self.pressure_values),
+            len(self.temperature_values),
+        )
+        if block is None:
+            return np.empty(shape)
+        if block.shape[1] != shape[1] * shape[2]:
+            raise ValueError(
+                f"The table variables must have one value for each pressure and temperature"
+                f" ({shape[1]}x{shape[2]}), got {block.shape[1]} values"
+            )
+        return block.reshape(shape)
+
     @staticmethod
     def create_constant(
         rho_g_ref=1.0,
@@ -1807,31 +1893,202 @@ class PvtModelTableParametersDescription:
             number_of_phases=-1,
         )
 
+    def fingerprint(self) -> str:
+        """
+        Return a hash (hex digest) of the content of the table: the arrays, the names of the
+        variables, the standard properties and the other attributes.
+
+        The hash is stable between sessions and computed only once: it is recomputed only when
+        an attribute is replaced (changing the values of the arrays in-place is not detected).
+        """
+        return _PVT_TABLE_FINGERPRINTS.get(
+            self, self._get_fingerprint_token(), self._compute_fingerprint
+        )
+
+    def _compute_fingerprint(self) -> str:
+        sha = hashlib.sha256()
+        _update_hash_with_array(sha, self.pressure_values)
+        _update_hash_with_array(sha, self.temperature_values)
+        # Same hash whether the table variables are stored in a contiguous block or not.
+        sha.update(str([len(i) for i in self.table_variables]).encode("UTF-8"))
+        block = get_contiguous_block(self.table_variables)
+        for values in [block] if block is not None else self.table_variables:
+            _update_hash_with_values(sha, values)
+
+        attributes = {
+            "variable_names": self.variable_names,
+            "label": self.label,
+            "number_of_phases": self.number_of_phases,
+            "warn_when_outside": self.warn_when_outside,
+        }
+        for name in _PVT_TABLE_STD_PROPERTIES:
+            scalar = getattr(self, name)
+            attributes[name] = [
+                scalar.GetCategory(),
+                float(scalar.GetValue()),
+                scalar.GetUnit(),
+            ]
+        sha.update(json.dumps(attributes, sort_keys=True).encode("UTF-8"))
+        return sha.hexdigest()
+
+    def _get_fingerprint_token(self) -> Tuple[Any, ...]:
+        """
+        The objects used to compute the fingerprint, to check if it must be computed again.
+        """
+        return (
+            self.pressure_values,
+            self.temperature_values,
+            self.table_variables,
+            *self.table_variables,
+            self.variable_names,
+            *self.variable_names,
+            self.label,
+            self.number_of_phases,
+            self.warn_when_outside,
+            *(getattr(self, name) for name in _PVT_TABLE_STD_PROPERTIES),
+        )
+
     def __eq__(self, other):
         """
         Need to re-implement the equality operator because ndarrays don't support equality, so the attr's generated
         __eq__ function does not work.
+
+        The values are always compared (not the cached `fingerprint`, which doesn't detect changes
+        of the arrays in-place), with a single comparison when the table variables of both tables
+        are stored in contiguous blocks.
         """
         if type(self) is not type(other):
             return False
+        if self is other:
+            return True
 
-        if len(self.table_variables) != len(other.table_variables):
+        if (
+            len(self.table_variables) != len(other.table_variables)
+            or self.variable_names != other.variable_names
+            or self.number_of_phases != other.number_of_phases
+            or self.pressure_std != other.pressure_std
+            or self.temperature_std != other.temperature_std
+            or not np.array_equal(self.pressure_values, other.pressure_values)
+            or not np.array_equal(self.temperature_values, other.temperature_values)
+        ):
             return False
 
-        for array1, array2 in zip(self.table_variables, other.table_variables):
-            if not np.array_equal(array1, array2):
-                return False
-
-        return (
-            (self.pressure_values == other.pressure_values).all()
-            and (self.temperature_values == other.temperature_values).all()
-            and self.variable_names == other.variable_names
-            and self.pressure_std == other.pressure_std
-            and self.temperature_std == other.temperature_std
-            and self.number_of_phases == other.number_of_phases
+        block = get_contiguous_block(self.table_variables)
+        other_block = get_contiguous_block(other.table_variables)
+        if block is not None and other_block is not None:
+            return np.array_equal(block, other_block)
+        return all(
+            np.array_equal(array1, array2)
+            for array1, array2 in zip(self.table_variables, other.table_variables)
         )
 
 
+# Fingerprints already computed for each PvtModelTableParametersDescription.
+_PVT_TABLE_FINGERPRINTS: ObjectCache[str] = ObjectCache()
+
+_PVT_TABLE_STD_PROPERTIES = (
+    "pressure_std",
+    "temperature_std",
+    "gas_density_std",
+    "oil_density_std",
+    "water_density_std",
+    "gas_oil_ratio",
+    "gas_liquid_ratio",
+    "water_cut",
+    "total_water_fraction",
+)
+
+
+def _update_hash_with_array(sha, values: np.ndarray) -> None:
+    sha.update(str(np.shape(values)).encode("UTF-8"))
+    _update_hash_with_values(sha, values)
+
+
+def _update_hash_with_values(sha, values: np.ndarray) -> None:
+    # Hash the values as float64 (as `np.array_equal` compares values regardless of the dtype),
+    # adding 0.0 so -0.0 and 0.0 have the same hash.
+    values = np.ascontiguousarray(values, dtype=np.float64) + 0.0
+    sha.update(memoryview(values).cast("B"))
+
+
+@attr.s(slots=True)
+class PvtTableHandle:
+    """
+    Reference to the parameters of a PVT table stored on a file (``.alfatable`` or ``.tab``), which
+    is only read when the parameters are needed (see `load`), keeping the loaded parameters.
+
+    Can be used in place of `PvtModelTableParametersDescription` on `PvtModelsDescription.table_parameters`.
+
+    :ivar file_path:
+        The ``.alfatable`` or ``.tab`` file.
+    :ivar model_name:
+        The PVT model to read from a ``.tab`` file, required when the file has more than one model.
+    """
+
+    file_path: Path = attr.ib(converter=Path)
+    model_name: Optional[str] = attr.ib(
+        default=None, validator=optional(instance_of(str))
+    )
+    _description: Optional[PvtModelTableParametersDescription] = attr.ib(
+        default=None, init=False, eq=False, repr=False
+    )
+
+    @classmethod
+    def from_value(cls, value: Union[str, Path]) -> "PvtTableHandle":
+        """
+        Create a handle from a value as used on `PvtModelsDescription.tables`
+        (``"<file>"`` or ``"<file>|<model name>"``).
+        """
+        file_path, model_name = PvtModelsDescription.get_pvt_file_and_model_name(value)
+        return cls(file_path, model_name)
+
+    def exists(self) -> bool:
+        """
+        Check if the file (and the model on ``.tab`` files) exists, without reading the table.
+        """
+        if not self.file_path.is_file():
+            return False
+        if self.model_name is None or self.file_path.suffix == ".alfatable":
+            return True
+        from alfasim_sdk._internal.alfacase.pvt_tab_file import get_pvt_tab_file_index
+
+        return self.model_name in get_pvt_tab_file_index(self.file_path).labels
+
+    def is_loaded(self) -> bool:
+        return self._description is not None
+
+    def load(self) -> PvtModelTableParametersDescription:
+        """
+        Return the parameters of the table, reading the file only on the first call.
+        """
+        if self._description is None:
+            if self.file_path.suffix == ".alfatable":
+                from alfasim_sdk._internal.alfacase.alfatable import (
+                    load_pvt_model_table_parameters_description_from_alfatable,
+                )
+
+                description = (
+                    load_pvt_model_table_parameters_description_from_alfatable(
+                        self.file_path
+                    )
+                )
+            else:
+                from alfasim_sdk._internal.alfacase.pvt_tab_file import (
+                    load_pvt_model_table_parameters_description_from_tab,
+                )
+
+                description = load_pvt_model_table_parameters_description_from_tab(
+                    str(self)
+                )
+            self._description = description
+        return self._description
+
+    def __str__(self) -> str:
+        if self.model_name is None:
+            return str(self.file_path)
+        return f"{self.file_path}|{self.model_name}"
+
+
 @attr.s(slots=True)
 class PvtModelsDescription:
     """
@@ -1882,6 +2139,10 @@ class PvtModelsDescription:
         where the original PVT file cannot be guaranteed to exist therefore the only reproducible way to recreate
         the PVT is trough the PvtModelTableParametersDescription.
 
+        The values can also be a `PvtTableHandle`, so the file is only read when the parameters are needed
+        (see `get_table_parameters` and `create_table_handles`). Loading a `.alfacase` file adds a handle
+        for each one of the `tables`, which are exported as the reference on `tables`.
+
 
     .. include:: /alfacase_definitions/PvtModelsDescription.txt
 
@@ -1924,9 +2185,42 @@ class PvtModelsDescription:
     )
     table_parameters: Dict[str, PvtModelTableParametersDescription] = attr.ib(
         default=attr.Factory(dict),
-        validator=dict_of(PvtModelTableParametersDescription),
+        validator=dict_of((PvtModelTableParametersDescription, PvtTableHandle)),
     )
 
+    def create_table_handles(self) -> None:
+        """
+        Add a `PvtTableHandle` on `table_parameters` for each one of the `tables` (which are not
+        there yet), without reading the files.
+
+        Called when loading a ``.alfacase`` file, so only the tables which are used are read.
+        """
+        for name, value in self.tables.items():
+            if name not in self.table_parameters:
+                self.table_parameters[name] = PvtTableHandle.from_value(value)
+
+    def is_table_handle(self, name: str) -> bool:
+        """
+        Check if the entry of `table_parameters` with the given name is the handle of the file on
+        `tables` (as created by `create_table_handles`).
+        """
+        value = self.table_parameters.get(name)
+        return (
+            isinstance(value, PvtTableHandle)
+            and name in self.tables
+            and value == PvtTableHandle.from_value(self.tables[name])
+        )
+
+    def get_table_parameters(self, name: str) -> PvtModelTableParametersDescription:
+        """
+        Return the parameters of the PVT table with the given name from `table_parameters`,
+        loading the file of a `PvtTableHandle` if necessary.
+        """
+        value = self.table_parameters[name]
+        if isinstance(value, PvtTableHandle):
+            return value.load()
+        return value
+
     @staticmethod
     def get_pvt_file_and_model_name(
         value: Union[str, Path]
@@ -2148,25 +2442,7 @@ class CaseDescription:
         :param bool reset_invalid_reference:
             Set the element to None if a insistence is found instead of raising an exception.
         """
-
-        def _get_all_pvt_models_declared_on_file(file_path: Path) -> Set[str]:
-            """
-            Read the pvt model file and return a tuple with all PVT Models declared on it
-            """
-            import csv
-            import re
-
-            all_pvt_models_declared = set()
-            reader = csv.reader(file_path.read_text().splitlines(), delimiter=",")
-            for line in reader:
-                all_line_content = ",".join(line)
-                if "PVTTABLE LABEL" in all_line_content:
-                    matches = re.findall(r"LABEL\s+=\s+([^,]+)", all_line_content)
-                    all_pvt_models_declared.add(
-                        matches[0].replace('"', "").replace("'", "")
-                    )
-
-            return all_pvt_models_declared
+        from alfasim_sdk._internal.alfacase.pvt_tab_file import get_pvt_tab_file_index
 
         keys_from_pvt_tables_to_remove = []
         for key, value in self.pvt_models.tables.items():
@@ -2186,9 +2462,7 @@ class CaseDescription:
 
             # Check if user select PVT model is inside the file.
             if model_name:
-                pvt_models_available_on_file = _get_all_pvt_models_declared_on_file(
-                    pvt_file
-                )
+                pvt_models_available_on_file = get_pvt_tab_file_index(pvt_file).labels
                 if model_name not in pvt_models_available_on_file:
                     if not reset_invalid_reference:
                         raise InvalidReferenceError(
@@ -2199,6 +2473,15 @@ class CaseDescription:
         for key in keys_from_pvt_tables_to_remove:
             del self.pvt_models.tables[key]
 
+        # Only check if the files of the handles exist, the tables are read when used.
+        for key, value in list(self.pvt_models.table_parameters.items()):
+            if isinstance(value, PvtTableHandle) and not value.exists():
+                if not reset_invalid_reference:
+                    raise InvalidReferenceError(
+                        f"Error on '{key}', '{value}' is not a valid PVT table"
+                    )
+                del self.pvt_models.table_parameters[key]
+
     def _check_restart_file(self):
         restart_file = self.physics.restart_filepath
         if restart_file and not Path(restart_file).is_file():
@@ -248,6 +248,58 @@ def numpy_array_validator(dimension: int, is_list: bool = False):
     return _numpy_array_validator
 
 
+def get_contiguous_block(arrays: List[np.ndarray]) -> Optional[np.ndarray]:
+    """
+    Return the 2-D array with the given 1-D arrays as its rows, without copying the values,
+    or ``None`` if the arrays are not consecutive rows of a single contiguous array (see
+    `to_contiguous_arrays`).
+    """
+    if not arrays or not all(isinstance(i, np.ndarray) for i in arrays):
+        return None
+    first = arrays[0]
+    if first.ndim != 1 or first.base is None or not first.flags.c_contiguous:
+        return None
+
+    row_size = first.nbytes
+    start = first.__array_interface__["data"][0]
+    for index, array in enumerate(arrays):
+        if (
+            array.base is not first.base
+            or array.shape != first.shape
+            or array.dtype != first.dtype
+            or not array.flags.c_contiguous
+            or array.__array_interface__["data"][0] != start + index * row_size
+        ):
+            return None
+
+    # All rows are inside the memory of the same base array, one right after the other.
+    return np.lib.stride_tricks.as_strided(
+        first,
+        shape=(len(arrays), len(first)),
+        strides=(row_size, first.itemsize),
+        writeable=first.flags.writeable,
+    )
+
+
+def to_contiguous_arrays(value: Any) -> Any:
+    """
+    An attr converter that stores a list of 1-D arrays with the same size and dtype as views of
+    a single contiguous 2-D array (one row for each array). Other values are kept as given.
+    """
+    if not isinstance(value, list) or get_contiguous_block(value) is not None:
+        return value
+    if not value or not all(isinstance(i, np.ndarray) and i.ndim == 1 for i in value):
+        return value
+    first = value[0]
+    if any(i.shape != first.shape or i.dtype != first.dtype for i in value):
+        return value
+
+    block = np.empty((len(value), len(first)), dtype=first.dtype)
+    for index, array in enumerate(value):
+        block[index] = array
+    return list(block)
+
+
 class DescriptionError(Exception):
     """
     Base exception for exceptions in case description.
@@ -2,8 +2,10 @@ import math
 from enum import Enum
 from functools import partial
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Union
 
 import attr
@@ -18,6 +20,10 @@ from alfasim_sdk._internal.alfacase.generate_schema import is_attrs
 
 ATTRIBUTES = Union[Scalar, Array, Enum, np.ndarray, List, List[Enum]]
 
+# Receives the values of an Array and returns the name of the file where they were written,
+# or None when they should be written inline (see `array_sidecar.ArraySidecarWriter`).
+ArraySidecarWriter = Callable[[np.ndarray], Optional[str]]
+
 
 NON_FININTE_VALUES_TO_STRING = [
     (math.isnan, ".nan"),
@@ -26,6 +32,51 @@ NON_FININTE_VALUES_TO_STRING = [
 ]
 
 
+def _format_float(value: float) -> str:
+    # YAML 1.2 specification uses `.nan` instead of `nan` and `.inf` instead of `inf`.
+    for validator, fixed_value in NON_FININTE_VALUES_TO_STRING:
+        if validator(value):
+            return fixed_value
+    return str(value)
+
+
+def format_float_array(values: Union[np.ndarray, List[float]]) -> List[str]:
+    """
+    Return the text for each one of the given values, the same obtained with ``str`` (the
+    shortest text that round-trips), converting all the values at once when they are floats.
+
+    Non-finite values are written as ``.nan``, ``.inf`` and ``-.inf`` (see `NON_FININTE_VALUES_TO_STRING`).
+    """
+    array = np.asarray(values)
+    is_float_array = array.dtype.kind == "f" and (
+        isinstance(values, np.ndarray) or all(isinstance(i, float) for i in values)
+    )
+    if not is_float_array:
+        # Keep the text of other types (like integers) exactly as given.
+        return [_format_float(i) if isinstance(i, float) else str(i) for i in values]
+
+    text = array.astype(str)
+    if not np.isfinite(array).all():
+        text[np.isnan(array)] = ".nan"
+        text[np.isposinf(array)] = ".inf"
+        text[np.isneginf(array)] = "-.inf"
+    return text.tolist()
+
+
+def _import_ruamel_module(name: str):
+    """
+    Import the given module of the ruamel package used by strictyaml: newer strictyaml versions
+    are built on their own copy of ruamel (``strictyaml.ruamel``), which rejects the objects
+    (events, sequences, ...) of the standalone ``ruamel.yaml`` package.
+    """
+    import importlib
+
+    try:
+        return importlib.import_module(f"strictyaml.ruamel.{name}")
+    except ImportError:
+        return importlib.import_module(f"ruamel.yaml.{name}")
+
+
 def format_list(values: List[Any], *, enable_flow_style: bool = False):
     """
     This method marks specific nodes for dumping in flow mode,
@@ -37,36 +88,50 @@ def format_list(values: List[Any], *, enable_flow_style: bool = False):
     For more details check:
     https://stackoverflow.com/questions/63364894/how-to-dump-only-lists-with-flow-style-with-pyyaml-or-ruamel-yaml
     """
-    import ruamel
-
-    retval = ruamel.yaml.comments.CommentedSeq(values)
+    retval = _import_ruamel_module("comments").CommentedSeq(values)
 
     if enable_flow_style:
         retval.fa.set_flow_style()
     return retval
 
 
+def _convert_array_to_valid_alfacase_format(
+    value: Array, array_sidecar_writer: Optional[ArraySidecarWriter]
+) -> Dict[str, Union[str, List[str]]]:
+    sidecar_file_name = (
+        array_sidecar_writer(value.values) if array_sidecar_writer else None
+    )
+    if sidecar_file_name is not None:
+        return {"values": sidecar_file_name, "unit": value.unit}
+    return {"values": format_float_array(value.values), "unit": value.unit}
+
+
 def _convert_value_to_valid_alfacase_format(
-    value: ATTRIBUTES, enable_flow_style_on_numpy: bool
+    value: ATTRIBUTES,
+    enable_flow_style_on_numpy: bool,
+    array_sidecar_writer: Optional[ArraySidecarWriter] = None,
 ) -> Union[str, Dict[str, str], List[str], List[List[str]]]:
     """
     Returns an yaml convertible representation from the given equipment_attribute
 
     :param enable_flow_style_on_numpy:
         Signalize that numpy arrays should dumped with inline list ( pressure: [1, 2] ).
+
+    :param array_sidecar_writer:
+        When given, called with the values of each Array to (optionally) write them in a separate file.
     """
     if isinstance(value, Scalar):
         return {"value": str(value.value), "unit": value.unit}
 
     if isinstance(value, Array):
-        return {"values": [str(i) for i in value.values], "unit": value.unit}
+        return _convert_array_to_valid_alfacase_format(value, array_sidecar_writer)
 
     if isinstance(value, Enum):
         return value.value
 
     if isinstance(value, np.ndarray) and value.ndim == 1:
         return format_list(
-            values=[str(coefficients) for coefficients in value],
+            values=format_float_array(value),
             enable_flow_style=enable_flow_style_on_numpy,
         )
 
@@ -75,7 +140,7 @@ def _convert_value_to_valid_alfacase_format(
     ):
         return [
             format_list(
-                values=[str(np_value) for np_value in np_array],
+                values=format_float_array(np_array),
                 enable_flow_style=enable_flow_style_on_numpy,
             )
             for np_array in value
@@ -83,29 +148,23 @@ def _convert_value_to_valid_alfacase_format(
 
     if isinstance(value, list) and all((isinstance(item, Array) for item in value)):
         return [
-            {"values": [str(i) for i in item.values], "unit": item.unit}
+            _convert_array_to_valid_alfacase_format(item, array_sidecar_writer)
             for item in value
         ]
 
     if isinstance(value, list):
         return [str(i) for i in value]
 
-    # YAML 1.2 specification uses `.nan` instead of `nan` and `.inf` instead of `inf`.
     if isinstance(value, float):
-        for validator, fixed_value in NON_FININTE_VALUES_TO_STRING:
-            if validator(value):
-                float_formatted_value = fixed_value
-                break
-        else:
-            float_formatted_value = str(value)
-
-        return float_formatted_value
+        return _format_float(value)
 
     return str(value)
 
 
 def convert_dict_to_valid_alfacase_format(
-    case_description_dict: Dict[str, ATTRIBUTES], enable_flow_style_on_numpy: bool
+    case_description_dict: Dict[str, ATTRIBUTES],
+    enable_flow_style_on_numpy: bool,
+    array_sidecar_writer: Optional[ArraySidecarWriter] = None,
 ) -> Dict[str, Any]:
     """
     Convert all values of the dictionary to string.
@@ -115,6 +174,8 @@ def convert_dict_to_valid_alfacase_format(
     :param enable_flow_style_on_numpy:
         Signalize that numpy arrays should dumped with inline list ( pressure: [1, 2] ).
 
+    :param array_sidecar_writer:
+        When given, called with the values of each Array to (optionally) write them in a separate file.
     """
     converted_dict = {}
     for key, value in case_description_dict.items():
@@ -131,13 +192,13 @@ def convert_dict_to_valid_alfacase_format(
             if isinstance(value, list):
                 converted_value = [
                     convert_dict_to_valid_alfacase_format(
-                        to_dict(i), enable_flow_style_on_numpy
+                        to_dict(i), enable_flow_style_on_numpy, array_sidecar_writer
                     )
                     for i in value
                 ]
             else:
                 converted_value = convert_dict_to_valid_alfacase_format(
-                    to_dict(value), enable_flow_style_on_numpy
+                    to_dict(value), enable_flow_style_on_numpy, array_sidecar_writer
                 )
 
             if converted_value:
@@ -146,17 +207,166 @@ def convert_dict_to_valid_alfacase_format(
 
         if isinstance(value, dict):
             converted_dict[key] = convert_dict_to_valid_alfacase_format(
-                value, enable_flow_style_on_numpy
+                value, enable_flow_style_on_numpy, array_sidecar_writer
             )
             continue
 
         converted_dict[key] = _convert_value_to_valid_alfacase_format(
-            value, enable_flow_style_on_numpy
+            value, enable_flow_style_on_numpy, array_sidecar_writer
         )
 
     return converted_dict
 
 
+def _has_alfacase_content(case_description_dict: Dict[str, ATTRIBUTES]) -> bool:
+    """
+    Return if `convert_dict_to_valid_alfacase_format` would produce any key for the given dict.
+    """
+    for key, value in case_description_dict.items():
+        is_empty_dict = isinstance(value, dict) and not value
+        if is_empty_dict or value is None or key in IGNORED_PROPERTIES:
+            continue
+        if is_attrs(value) and not isinstance(value, list):
+            if _has_alfacase_content(attr.asdict(value, recurse=False)):
+                return True
+            continue
+        return True
+    return False
+
+
+class AlfacaseStreamWriter:
+    """
+    Write descriptions as alfacase (YAML) directly to a text stream, while walking the attrs tree.
+
+    The output is exactly the same as ``strictyaml.YAML(convert_dict_to_valid_alfacase_format(...)).as_yaml()``,
+    since the same YAML emitter is used, but only the value being written is kept in memory instead
+    of the whole converted dict and the YAML tree built from it.
+
+    :param enable_flow_style_on_numpy:
+        Signalize that numpy arrays should dumped with inline list ( pressure: [1, 2] ).
+
+    :param array_sidecar_writer:
+        When given, called with the values of each Array to (optionally) write them in a separate file.
+    """
+
+    _MAP_TAG = "tag:yaml.org,2002:map"
+    _SEQ_TAG = "tag:yaml.org,2002:seq"
+    _STR_TAG = "tag:yaml.org,2002:str"
+
+    def __init__(
+        self,
+        stream,
+        *,
+        enable_flow_style_on_numpy: bool = False,
+        array_sidecar_writer: Optional[ArraySidecarWriter] = None,
+    ) -> None:
+        from strictyaml.dumper import StrictYAMLDumper
+
+        self._dumper = StrictYAMLDumper(stream, allow_unicode=True)
+        self._events = _import_ruamel_module("events")
+        self._enable_flow_style_on_numpy = enable_flow_style_on_numpy
+        self._array_sidecar_writer = array_sidecar_writer
+
+    def write(self, alfacase_description) -> None:
+        """
+        Write the given description (decorated with attrs) as a YAML document.
+        """
+        events = self._events
+
+        try:
+            self._dumper.emit(events.StreamStartEvent())
+            self._dumper.emit(events.DocumentStartEvent())
+            self._write_description_dict(
+                attr.asdict(alfacase_description, recurse=False)
+            )
+            self._dumper.emit(events.DocumentEndEvent())
+            self._dumper.emit(events.StreamEndEvent())
+        finally:
+            self._dumper.dispose()
+
+    def _write_description_dict(
+        self, case_description_dict: Dict[str, ATTRIBUTES]
+    ) -> None:
+        """
+        Streaming equivalent of `convert_dict_to_valid_alfacase_format`.
+        """
+        events = self._events
+
+        to_dict = partial(attr.asdict, recurse=False)
+        self._dumper.emit(
+            events.MappingStartEvent(None, self._MAP_TAG, True, flow_style=False)
+        )
+        for key, value in case_description_dict.items():
+            is_empty_dict = isinstance(value, dict) and not value
+            ignore = key in IGNORED_PROPERTIES
+
+            if is_empty_dict or value is None or ignore:
+                continue
+
+            if is_attrs(value):
+                if isinstance(value, list):
+                    self._write_scalar(key)
+                    self._dumper.emit(
+                        events.SequenceStartEvent(
+                            None, self._SEQ_TAG, True, flow_style=False
+                        )
+                    )
+                    for item in value:
+                        self._write_description_dict(to_dict(item))
+                    self._dumper.emit(events.SequenceEndEvent())
+                elif _has_alfacase_content(to_dict(value)):
+                    self._write_scalar(key)
+                    self._write_description_dict(to_dict(value))
+                continue
+
+            self._write_scalar(key)
+            if isinstance(value, dict):
+                self._write_description_dict(value)
+            else:
+                self._write_node(
+                    _convert_value_to_valid_alfacase_format(
+                        value,
+                        self._enable_flow_style_on_numpy,
+                        self._array_sidecar_writer,
+                    )
+                )
+        self._dumper.emit(events.MappingEndEvent())
+
+    def _write_node(self, value: Union[str, Dict[str, Any], List[Any]]) -> None:
+        events = self._events
+
+        if isinstance(value, dict):
+            self._dumper.emit(
+                events.MappingStartEvent(None, self._MAP_TAG, True, flow_style=False)
+            )
+            for key, item in value.items():
+                self._write_scalar(key)
+                self._write_node(item)
+            self._dumper.emit(events.MappingEndEvent())
+        elif isinstance(value, list):
+            flow_attributes = getattr(value, "fa", None)
+            flow_style = flow_attributes.flow_style(False) if flow_attributes else False
+            self._dumper.emit(
+                events.SequenceStartEvent(
+                    None, self._SEQ_TAG, True, flow_style=flow_style
+                )
+            )
+            for item in value:
+                self._write_node(item)
+            self._dumper.emit(events.SequenceEndEvent())
+        else:
+            self._write_scalar(value)
+
+    def _write_scalar(self, value: str) -> None:
+        events = self._events
+
+        self._dumper.emit(
+            events.ScalarEvent(
+                None, self._STR_TAG, (True, True, True), value, style=None
+            )
+        )
+
+
 EquipmentTypes = Union[
     case_description.MassSourceEquipmentDescription,
     case_description.HeatSourceEquipmentDescription,
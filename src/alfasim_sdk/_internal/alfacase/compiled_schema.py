@@ -0,0 +1,349 @@
+"""
+Fast path to load alfacase files.
+
+The regular path (``strictyaml.dirty_load`` + ``case_description_schema``) keeps a
+``YAMLChunk`` for every node of the document, which is very expensive for big cases.
+
+This module parses the content with the C accelerated parser from ``ruamel.yaml``
+(``CBaseLoader`` keeps all scalars as strings, just like strictyaml) and validates the
+plain python objects against a schema compiled directly from the attrs classes
+declared on ``case_description``, following the same rules used by ``generate_schema``.
+
+Any content that the compiled schema doesn't accept is reported with
+`FastPathNotApplicable`, callers are expected to fall back to the strictyaml path,
+which then provides the error message for the user.
+"""
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Tuple
+
+import attr
+import numpy as np
+import typing_inspect
+from typing_inspect import is_optional_type
+
+from alfasim_sdk._internal.alfacase.generate_schema import convert_to_snake_case
+from alfasim_sdk._internal.alfacase.generate_schema import IGNORED_PROPERTIES
+from alfasim_sdk._internal.alfacase.generate_schema import is_array
+from alfasim_sdk._internal.alfacase.generate_schema import is_attrs
+from alfasim_sdk._internal.alfacase.generate_schema import is_boolean
+from alfasim_sdk._internal.alfacase.generate_schema import is_dict
+from alfasim_sdk._internal.alfacase.generate_schema import is_enum
+from alfasim_sdk._internal.alfacase.generate_schema import is_float
+from alfasim_sdk._internal.alfacase.generate_schema import is_int
+from alfasim_sdk._internal.alfacase.generate_schema import is_list
+from alfasim_sdk._internal.alfacase.generate_schema import is_numpy_1_darray
+from alfasim_sdk._internal.alfacase.generate_schema import is_path
+from alfasim_sdk._internal.alfacase.generate_schema import is_scalar
+from alfasim_sdk._internal.alfacase.generate_schema import is_str
+from alfasim_sdk._internal.alfacase.generate_schema import is_union
+
+
+# Same expressions used by strictyaml.utils (compiled only once here).
+_DECIMAL_RE = re.compile(r"^[-+]?[0-9_]*(\.[0-9_]*)?([eE][-+]?[0-9_]+)?$")
+_INFINITY_RE = re.compile(r"^[-+]?\.?(?:inf|Inf|INF)$")
+_NOT_A_NUMBER_RE = re.compile(r"^\.?(?:nan|NaN|NAN)$")
+_INTEGER_RE = re.compile(r"^[-+]?[0-9_]+$")
+_TRUE_VALUES = frozenset(["yes", "true", "on", "1", "y"])
+_FALSE_VALUES = frozenset(["no", "false", "off", "0", "n"])
+
+# Text with only these characters (values joined by new lines) is converted by ``float`` exactly
+# like `_validate_float` does, otherwise each value is validated individually (``.inf``, ``.nan``).
+_PLAIN_FLOATS_RE = re.compile(r"[-+.0-9_eE\n]*\Z")
+
+# Anchors, aliases and tags are rejected by strictyaml but accepted by the plain parser.
+_STRICTYAML_DISALLOWED_CHARACTERS = ("&", "*", "!")
+
+Validator = Callable[[Any], Any]
+
+
+class FastPathNotApplicable(Exception):
+    """
+    Raised when the content can't be handled by the compiled schema.
+    """
+
+
+class CompiledYAML:
+    """
+    Lightweight replacement for ``strictyaml.YAML`` holding already validated data.
+
+    Implements only the subset of the interface used by the loaders on ``alfacase_to_case``.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+    def __getitem__(self, key) -> "CompiledYAML":
+        return CompiledYAML(self.data[key])
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def items(self) -> Iterator[Tuple["CompiledYAML", "CompiledYAML"]]:
+        for key, value in self.data.items():
+            yield CompiledYAML(key), CompiledYAML(value)
+
+    def __repr__(self) -> str:
+        return f"CompiledYAML({self.data!r})"
+
+
+def _not_applicable(expected: str, value: Any) -> FastPathNotApplicable:
+    return FastPathNotApplicable(f"when expecting {expected}, found {value!r}")
+
+
+def _validate_str(value: Any) -> str:
+    if type(value) is not str:
+        raise _not_applicable("a str", value)
+    return value
+
+
+def _validate_float(value: Any) -> float:
+    if type(value) is not str:
+        raise _not_applicable("a float", value)
+    if _INFINITY_RE.match(value) or _NOT_A_NUMBER_RE.match(value):
+        value = value.replace(".", "")
+    elif not _DECIMAL_RE.match(value):
+        raise _not_applicable("a float", value)
+    try:
+        return float(value.replace("_", ""))
+    except ValueError:
+        raise _not_applicable("a float", value)
+
+
+def _validate_int(value: Any) -> int:
+    if type(value) is not str or not _INTEGER_RE.match(value):
+        raise _not_applicable("an integer", value)
+    return int(value.replace("_", ""))
+
+
+def _validate_bool(value: Any) -> bool:
+    if type(value) is str:
+        lower_value = value.lower()
+        if lower_value in _TRUE_VALUES:
+            return True
+        if lower_value in _FALSE_VALUES:
+            return False
+    raise _not_applicable("a boolean", value)
+
+
+def _make_enum_validator(type_) -> Validator:
+    choices = frozenset(i.value for i in type_)
+
+    def validate_enum(value: Any) -> str:
+        if type(value) is not str or value not in choices:
+            raise _not_applicable(f"one of {sorted(choices)}", value)
+        return value
+
+    return validate_enum
+
+
+def _make_seq_validator(item_validator: Validator) -> Validator:
+    def validate_seq(value: Any) -> list:
+        if type(value) is not list:
+            raise _not_applicable("a sequence", value)
+        return [item_validator(i) for i in value]
+
+    return validate_seq
+
+
+def _validate_float_array(value: Any) -> np.ndarray:
+    """
+    Convert a sequence of floats straight into a contiguous ``float64`` array.
+
+    The text of all values is checked in a single pass, so only sequences with special values
+    (like ``.inf`` or ``.nan``) need to be validated value by value.
+    """
+    if type(value) is not list:
+        raise _not_applicable("a sequence", value)
+    try:
+        joined_values = "\n".join(value)
+    except TypeError:
+        raise _not_applicable("a sequence of floats", value)
+
+    if _PLAIN_FLOATS_RE.match(joined_values):
+        try:
+            return np.fromiter(map(float, value), dtype=np.float64, count=len(value))
+        except ValueError:
+            pass  # Let `_validate_float` handle (or report) the unusual values.
+    return np.fromiter(map(_validate_float, value), dtype=np.float64, count=len(value))
+
+
+def _make_map_pattern_validator(value_validator: Validator) -> Validator:
+    def validate_map_pattern(value: Any) -> dict:
+        if type(value) is not dict:
+            raise _not_applicable("a mapping", value)
+        return {_validate_str(k): value_validator(v) for k, v in value.items()}
+
+    return validate_map_pattern
+
+
+def _make_map_validator(
+    required: Tuple[str, ...], validators: Dict[str, Validator]
+) -> Validator:
+    required_keys = frozenset(required)
+
+    def validate_map(value: Any) -> dict:
+        if type(value) is not dict:
+            raise _not_applicable("a mapping", value)
+        result = {}
+        for key, item in value.items():
+            validator = validators.get(key)
+            if validator is None:
+                raise _not_applicable(f"one of {sorted(validators)}", key)
+            result[key] = validator(item)
+        if not required_keys.issubset(result):
+            raise _not_applicable(f"keys {sorted(required_keys)}", sorted(result))
+        return result
+
+    return validate_map
+
+
+def _validate_array_values(value: Any) -> Any:
+    # Either the values or the name of the ".npy" file with the values (see `array_sidecar`).
+    if type(value) is str:
+        return value
+    return _validate_float_array(value)
+
+
+_scalar_validator = _make_map_validator(
+    ("value", "unit"), {"value": _validate_float, "unit": _validate_str}
+)
+_array_validator = _make_map_validator(
+    ("values", "unit"), {"values": _validate_array_values, "unit": _validate_str}
+)
+
+
+def _compile_union(type_) -> Validator:
+    if set(type_.__args__) == {str, Path}:
+        return _validate_str
+
+    validators = {}
+    for arg in type_.__args__:
+        key = convert_to_snake_case(arg.__name__.replace("Description", ""))
+        validators[key] = _make_seq_validator(compile_schema(arg))
+    return _make_map_validator((), validators)
+
+
+_LIST_OF_COMPILERS = [
+    (is_enum, _make_enum_validator),
+    (is_attrs, lambda type_: compile_schema(type_)),
+    (
+        is_list,
+        lambda type_: _make_seq_validator(
+            _compile_type(typing_inspect.get_args(type_)[0])
+        ),
+    ),
+    (is_float, lambda type_: _validate_float),
+    (is_str, lambda type_: _validate_str),
+    (is_boolean, lambda type_: _validate_bool),
+    (is_numpy_1_darray, lambda type_: _validate_float_array),
+    (
+        is_dict,
+        lambda type_: _make_map_pattern_validator(
+            _compile_type(typing_inspect.get_args(type_)[1])
+        ),
+    ),
+    (is_union, _compile_union),
+    (is_scalar, lambda type_: _scalar_validator),
+    (is_array, lambda type_: _array_validator),
+    (is_int, lambda type_: _validate_int),
+    (is_path, lambda type_: _validate_str),
+]
+
+
+def _compile_type(type_) -> Validator:
+    if is_optional_type(type_):
+        type_ = typing_inspect.get_args(type_, evaluate=True)[0]
+
+    for predicate_function, compile_function in _LIST_OF_COMPILERS:
+        if predicate_function(type_):
+            return compile_function(type_)
+
+    raise RuntimeError(f"Compiled schema does not know how to handle {type_}.")
+
+
+@lru_cache(maxsize=None)
+def compile_attribute_validators(class_: type) -> Dict[str, Validator]:
+    """
+    Return the validators for each attribute of the given attrs `class_` that can be
+    defined on an alfacase file.
+    """
+    return {
+        key: _compile_type(value.type)
+        for key, value in attr.fields_dict(class_).items()
+        if key not in IGNORED_PROPERTIES
+    }
+
+
+def get_required_attributes(class_: type) -> Tuple[str, ...]:
+    """
+    Return the attributes of `class_` that must be defined on an alfacase file (the ones without default).
+    """
+    return tuple(
+        key
+        for key, value in attr.fields_dict(class_).items()
+        if key not in IGNORED_PROPERTIES and value.default is attr.NOTHING
+    )
+
+
+@lru_cache(maxsize=None)
+def compile_schema(class_: type) -> Validator:
+    """
+    Return a validator for the given attrs `class_`, equivalent to the strictyaml schema
+    generated by `generate_schema.generate_alfacase_schema`.
+
+    The validator receives the plain python objects obtained from the YAML parser
+    (where all scalars are strings) and returns the data converted exactly like the
+    ``.data`` attribute from a ``strictyaml.YAML`` object, except for the values of
+    arrays, which are returned as ``float64`` numpy arrays instead of lists of floats.
+    """
+    return _make_map_validator(
+        get_required_attributes(class_), compile_attribute_validators(class_)
+    )
+
+
+def _get_yaml_loader():
+    from ruamel import yaml as ruamelyaml
+
+    return getattr(ruamelyaml, "CBaseLoader", ruamelyaml.BaseLoader)
+
+
+def parse_content(yaml_string: str) -> Any:
+    """
+    Parse the given `yaml_string` keeping all scalars as strings, without any validation.
+
+    :raises FastPathNotApplicable:
+        When the content is not valid YAML or uses YAML features that strictyaml doesn't allow.
+    """
+    from ruamel import yaml as ruamelyaml
+
+    if any(c in yaml_string for c in _STRICTYAML_DISALLOWED_CHARACTERS):
+        raise FastPathNotApplicable("Content uses features not supported by strictyaml")
+
+    try:
+        return ruamelyaml.load(yaml_string, Loader=_get_yaml_loader())
+    except Exception as e:
+        # Any parsing problem (including duplicated keys, which ruamel reports as warnings)
+        # is reported by strictyaml.
+        raise FastPathNotApplicable(str(e))
+
+
+def load_content(yaml_string: str, class_: type) -> CompiledYAML:
+    """
+    Parse and validate the given `yaml_string` against the compiled schema from `class_`.
+
+    :raises FastPathNotApplicable:
+        When the content is not accepted by the compiled schema or uses YAML features
+        that strictyaml doesn't allow.
+    """
+    return CompiledYAML(compile_schema(class_)(parse_content(yaml_string)))
@@ -0,0 +1,321 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import attr
+from attr.validators import instance_of
+from barril.units import Array
+
+from alfasim_sdk._internal.alfacase import case_description
+
+
+CACHE_ENTRY_SUFFIX = ".case-description"
+_LOCK_FILE_NAME = "cache.lock"
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _reduce_array(value: Array):
+    # barril's Array keeps references to local functions of the unit database, which can't be pickled.
+    return Array, (value.GetCategory(), value.values, value.unit)
+
+
+def dumps_description(obj) -> bytes:
+    """
+    Pickle the given description (or any object containing descriptions), supporting barril's Array.
+    """
+    import copyreg
+    import io
+
+    stream = io.BytesIO()
+    pickler = pickle.Pickler(stream, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[Array] = _reduce_array
+    pickler.dump(obj)
+    return stream.getvalue()
+
+
+def _hash_file(file_path: Path) -> str:
+    sha = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(_CHUNK_SIZE), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def get_referenced_files(
+    description: case_description.CaseDescription,
+) -> List[Path]:
+    """
+    Return the external files referenced by the given description (PVT tables, restart file and
+    the ``.npy`` files of the arrays memory-mapped from sidecars, see `array_sidecar`).
+    """
+    referenced_files = []
+    for value in description.pvt_models.tables.values():
+        pvt_file, _ = case_description.PvtModelsDescription.get_pvt_file_and_model_name(
+            value
+        )
+        referenced_files.append(pvt_file)
+    if description.physics.restart_filepath is not None:
+        referenced_files.append(Path(description.physics.restart_filepath))
+    referenced_files.extend(dict.fromkeys(_iter_memory_mapped_files(description)))
+    return referenced_files
+
+
+def _iter_memory_mapped_files(value) -> Iterator[Path]:
+    """
+    Yield the files of the memory-mapped arrays found on the given description (recursively).
+    """
+    import numpy as np
+
+    if isinstance(value, Array):
+        value = value.values
+    if isinstance(value, np.ndarray):
+        # Views of memory-mapped arrays are also found by their base.
+        while isinstance(value, np.ndarray):
+            if isinstance(value, np.memmap) and value.filename is not None:
+                yield Path(value.filename)
+                return
+            value = value.base
+    elif attr.has(type(value)):
+        for field in attr.fields(type(value)):
+            yield from _iter_memory_mapped_files(getattr(value, field.name))
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_memory_mapped_files(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_memory_mapped_files(item)
+
+
+# The modification time (in nanoseconds), size and hash of a file.
+_FileState = Tuple[int, int, str]
+
+
+def _get_file_state(file_path: Path) -> _FileState:
+    stat = os.stat(str(file_path))
+    return stat.st_mtime_ns, stat.st_size, _hash_file(file_path)
+
+
+def _get_referenced_files_states(
+    description: case_description.CaseDescription,
+) -> Optional[Dict[str, _FileState]]:
+    try:
+        return {
+            str(file_path): _get_file_state(file_path)
+            for file_path in get_referenced_files(description)
+        }
+    except OSError:
+        return None
+
+
+def _referenced_files_are_unchanged(referenced_files: Dict[str, _FileState]) -> bool:
+    try:
+        for file_path, (mtime_ns, size, file_hash) in referenced_files.items():
+            stat = os.stat(file_path)
+            # Only hash the file again when it might have changed.
+            if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+                continue
+            if stat.st_size != size or _hash_file(Path(file_path)) != file_hash:
+                return False
+    except OSError:
+        return False
+    return True
+
+
+@attr.s(frozen=True)
+class CaseDescriptionCache:
+    """
+    Persistent on-disk cache for CaseDescription objects loaded from alfacase files.
+
+    Entries are keyed by a hash of the alfacase file contents, its location and the SDK version.
+    Each entry also stores the hash of the files referenced by the case (PVT tables and restart file),
+    so changing any of them invalidates the entry (files are only hashed again when their
+    modification time or size changes).
+
+    Entries are written atomically and the least recently used entries are removed when the cache
+    grows beyond ``max_size``, which allows the same cache directory to be shared by several processes.
+
+    :ivar directory:
+        Directory where the entries are stored, created on demand.
+    :ivar max_size:
+        Maximum size in bytes for all entries.
+    :ivar lock_timeout:
+        Age in seconds of the cache lock file after which the lock is considered stale (left by a
+        process that died while holding it) and broken. The holder of the lock updates the
+        modification time of the lock file while holding it.
+    """
+
+    directory: Path = attr.ib(converter=Path)
+    max_size: int = attr.ib(default=1024 ** 3, validator=instance_of(int))
+    lock_timeout: float = attr.ib(default=30.0)
+
+    def get_key(self, alfacase_file: Path) -> str:
+        """
+        Return the key for the given alfacase file in its current state.
+        """
+        from alfasim_sdk._internal.version import __version__
+
+        sha = hashlib.sha256()
+        sha.update(__version__.encode("UTF-8"))
+        sha.update(b"\0")
+        sha.update(str(Path(alfacase_file).absolute()).encode("UTF-8"))
+        sha.update(b"\0")
+        sha.update(Path(alfacase_file).read_bytes())
+        return sha.hexdigest()
+
+    def load(
+        self,
+        alfacase_file: Path,
+        loader: Callable[[Path], case_description.CaseDescription],
+    ) -> case_description.CaseDescription:
+        """
+        Return the CaseDescription for the given alfacase file from the cache, calling `loader` and
+        storing its result when there is no valid entry.
+        """
+        key = self.get_key(alfacase_file)
+        description = self.get(key)
+        if description is None:
+            description = loader(alfacase_file)
+            self.put(key, description)
+        return description
+
+    def get(self, key: str) -> Optional[case_description.CaseDescription]:
+        """
+        Return the description stored with the given key, or ``None`` if there is no valid entry.
+        """
+        entry_file = self._get_entry_file(key)
+        try:
+            content = entry_file.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            referenced_files, description = pickle.loads(content)
+        except Exception:
+            # Corrupted or incompatible entry.
+            self._remove(entry_file)
+            return None
+
+        if not _referenced_files_are_unchanged(referenced_files):
+            return None
+
+        self._touch(entry_file)
+        return description
+
+    def put(self, key: str, description: case_description.CaseDescription) -> None:
+        """
+        Store the description with the given key, removing old entries if necessary.
+        """
+        referenced_files = _get_referenced_files_states(description)
+        if referenced_files is None:
+            return
+        content = dumps_description((referenced_files, description))
+        if len(content) > self.max_size:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry_file = self._get_entry_file(key)
+        temp_file = entry_file.with_name(f"{entry_file.name}.{os.getpid()}.tmp")
+        temp_file.write_bytes(content)
+        os.replace(str(temp_file), str(entry_file))
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache size is within ``max_size``.
+        """
+        with self._lock():
+            entries = sorted(self._iter_entries(), key=lambda entry: entry[1])
+            total_size = sum(size for _, _, size in entries)
+            for entry_file, _, size in entries:
+                if total_size <= self.max_size:
+                    break
+                self._remove(entry_file)
+                total_size -= size
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        with self._lock():
+            for entry_file, _, _ in self._iter_entries():
+                self._remove(entry_file)
+
+    def _get_entry_file(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_ENTRY_SUFFIX}"
+
+    def _iter_entries(self) -> Iterator[Tuple[Path, float, int]]:
+        if not self.directory.is_dir():
+            return
+        for entry_file in self.directory.glob(f"*{CACHE_ENTRY_SUFFIX}"):
+            try:
+                stat = entry_file.stat()
+            except OSError:
+                continue
+            yield entry_file, stat.st_mtime, stat.st_size
+
+    @staticmethod
+    def _touch(entry_file: Path) -> None:
+        try:
+            os.utime(str(entry_file))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _remove(entry_file: Path) -> None:
+        try:
+            entry_file.unlink()
+        except OSError:
+            pass
+
+    def _is_stale_lock(self, lock_file: Path) -> bool:
+        try:
+            lock_age = time.time() - lock_file.stat().st_mtime
+        except OSError:
+            # Released in the meantime.
+            return False
+        return lock_age > self.lock_timeout
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """
+        Inter-process lock based on the exclusive creation of a file in the cache directory.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lock_file = self.directory / _LOCK_FILE_NAME
+        while True:
+            try:
+                fd = os.open(str(lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self._is_stale_lock(lock_file):
+                    self._remove(lock_file)
+                else:
+                    time.sleep(0.01)
+            else:
+                break
+        # Keep the lock file recent, so waiting processes don't consider it stale.
+        released = threading.Event()
+
+        def refresh_lock() -> None:
+            while not released.wait(self.lock_timeout / 3):
+                self._touch(lock_file)
+
+        refresh_thread = threading.Thread(target=refresh_lock, daemon=True)
+        refresh_thread.start()
+        try:
+            yield
+        finally:
+            released.set()
+            refresh_thread.join()
+            os.close(fd)
+            self._remove(lock_file)
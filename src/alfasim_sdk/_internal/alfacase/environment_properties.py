@@ -0,0 +1,186 @@
+"""
+Columnar (numpy) view of the properties of the environment of pipes (`EnvironmentDescription`),
+for the evaluation of the properties on many positions at once.
+"""
+from typing import Dict
+from typing import Iterable
+from typing import Sequence
+from typing import Tuple
+
+import attr
+import numpy as np
+
+from alfasim_sdk._internal import constants
+from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase.object_cache import ObjectCache
+from alfasim_sdk._internal.alfacase.pipe_mesh import PipeMesh
+
+# The SI unit of the properties of `EnvironmentPropertyDescription` which are interpolated.
+_PROPERTY_UNITS = {
+    "temperature": "K",
+    "heat_transfer_coefficient": "W/m2.K",
+    "overall_heat_transfer_coefficient": "W/m2.K",
+    "fluid_velocity": "m/s",
+}
+
+ENVIRONMENT_PROPERTIES = tuple(_PROPERTY_UNITS)
+
+
+@attr.s(frozen=True, slots=True, eq=False)
+class EnvironmentPropertyTable:
+    """
+    The properties of an environment as arrays sorted by position, in SI units.
+
+    Properties are linearly interpolated between the positions, and constant before the first and
+    after the last position.
+
+    :ivar position_input_mode:
+        If the positions are the measured depth (length along the pipe) or the true vertical depth
+        (below `reference_y_coordinate`).
+    :ivar reference_y_coordinate:
+        The vertical coordinate where the true vertical depth is zero [m].
+    :ivar position:
+        Position of each row of the table [m].
+    :ivar temperature:
+        Temperature of the environment [K].
+    :ivar heat_transfer_coefficient:
+        [W/m2.K]
+    :ivar overall_heat_transfer_coefficient:
+        [W/m2.K]
+    :ivar fluid_velocity:
+        Velocity of the fluid of the environment [m/s].
+    :ivar type:
+        The heat transfer coefficient model of each row.
+    """
+
+    position_input_mode: constants.PipeThermalPositionInput = attr.ib()
+    reference_y_coordinate: float = attr.ib()
+    position: np.ndarray = attr.ib()
+    temperature: np.ndarray = attr.ib()
+    heat_transfer_coefficient: np.ndarray = attr.ib()
+    overall_heat_transfer_coefficient: np.ndarray = attr.ib()
+    fluid_velocity: np.ndarray = attr.ib()
+    type: Tuple[
+        constants.PipeEnvironmentHeatTransferCoefficientModelType, ...
+    ] = attr.ib()
+
+    @classmethod
+    def from_properties(
+        cls,
+        properties: Sequence[case_description.EnvironmentPropertyDescription],
+        position_input_mode: constants.PipeThermalPositionInput = constants.PipeThermalPositionInput.Md,
+        reference_y_coordinate: float = 0.0,
+    ) -> "EnvironmentPropertyTable":
+        """
+        Create the table from the given rows (in any order, rows with the same position keep their
+        order).
+        """
+        positions = np.array(
+            [p.position.GetValue("m") for p in properties], dtype=np.float64
+        )
+        order = np.argsort(positions, kind="stable")
+        columns = {
+            name: np.array(
+                [getattr(properties[i], name).GetValue(unit) for i in order],
+                dtype=np.float64,
+            )
+            for name, unit in _PROPERTY_UNITS.items()
+        }
+        positions = positions[order]
+        # Read-only, since the (cached) table is shared by all users of the description.
+        for array in (positions, *columns.values()):
+            array.flags.writeable = False
+        return cls(
+            position_input_mode=position_input_mode,
+            reference_y_coordinate=float(reference_y_coordinate),
+            position=positions,
+            type=tuple(properties[i].type for i in order),
+            **columns,
+        )
+
+    def __len__(self) -> int:
+        return len(self.position)
+
+    def evaluate(
+        self, positions, properties: Iterable[str] = ENVIRONMENT_PROPERTIES
+    ) -> Dict[str, np.ndarray]:
+        """
+        Return the values of the given properties on the positions [m] (in the position input mode
+        of the table).
+
+        :raises ValueError:
+            If the table is empty or a property is not known.
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        if len(self.position) == 0:
+            raise ValueError("The environment has no properties")
+        result = {}
+        for name in properties:
+            if name not in _PROPERTY_UNITS:
+                raise ValueError(
+                    f"Unknown environment property {name!r}, expected one of: {', '.join(ENVIRONMENT_PROPERTIES)}"
+                )
+            result[name] = np.interp(positions, self.position, getattr(self, name))
+        return result
+
+    def get_types(self, positions) -> np.ndarray:
+        """
+        Return the heat transfer coefficient model on the positions [m], from the last row at or
+        before each position (or the first row, before it), as an array of objects.
+        """
+        if len(self.position) == 0:
+            raise ValueError("The environment has no properties")
+        index = np.searchsorted(self.position, positions, side="right") - 1
+        types = np.empty(len(self.type), dtype=object)
+        types[:] = self.type
+        return types[np.clip(index, 0, len(self.type) - 1)]
+
+    def get_mesh_positions(self, mesh: PipeMesh) -> np.ndarray:
+        """
+        Return the positions of the cells of the mesh in the position input mode of the table [m].
+        """
+        if self.position_input_mode == constants.PipeThermalPositionInput.Tvd:
+            return self.reference_y_coordinate - mesh.y
+        else:
+            return mesh.x_coord_center
+
+    def evaluate_on_mesh(
+        self, mesh: PipeMesh, properties: Iterable[str] = ENVIRONMENT_PROPERTIES
+    ) -> Dict[str, np.ndarray]:
+        """
+        Return the values of the given properties on each cell of the mesh (see `evaluate`).
+        """
+        return self.evaluate(self.get_mesh_positions(mesh), properties)
+
+
+# Tables already created for each description.
+_TABLES: ObjectCache[EnvironmentPropertyTable] = ObjectCache()
+
+
+def get_environment_property_table(
+    environment: case_description.EnvironmentDescription,
+) -> EnvironmentPropertyTable:
+    """
+    Return the table of the properties of the environment (from the table of its position input
+    mode), which is only created once for each description (while its rows are the same, the
+    list of rows can be changed).
+    """
+    if environment.position_input_mode == constants.PipeThermalPositionInput.Md:
+        properties = environment.md_properties_table
+    else:
+        properties = environment.tvd_properties_table
+    token = (
+        environment.position_input_mode,
+        environment.reference_y_coordinate,
+        properties,
+        *properties,
+    )
+    return _TABLES.get(
+        environment,
+        token,
+        lambda: EnvironmentPropertyTable.from_properties(
+            properties,
+            environment.position_input_mode,
+            environment.reference_y_coordinate.GetValue("m"),
+        ),
+    )
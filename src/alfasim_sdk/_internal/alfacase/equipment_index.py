@@ -0,0 +1,226 @@
+"""
+Position-sorted index of the equipment (`EquipmentDescription`) of pipes and wells, for range
+queries and assignment of equipment to cells with numpy operations.
+"""
+from typing import Iterable
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import attr
+import numpy as np
+
+from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase.pipe_mesh import PipeMesh
+
+# The attributes of `EquipmentDescription`, which are also the values of `EquipmentIndex.equipment_type`.
+EQUIPMENT_TYPES = (
+    "mass_sources",
+    "pumps",
+    "valves",
+    "reservoir_inflows",
+    "heat_sources",
+    "compressors",
+)
+# Equipment placed on a range of positions (with `start` and `length` instead of `position`).
+_RANGE_EQUIPMENT_TYPES = ("reservoir_inflows", "heat_sources")
+
+
+@attr.s(frozen=True, slots=True, eq=False)
+class EquipmentIndex:
+    """
+    The equipment of one or more pipes (or wells) as columns, sorted by pipe and position.
+
+    Reservoir inflows and heat sources cover the positions from their ``start`` to
+    ``start + length``, all other equipment is placed on a single position.
+
+    :ivar pipe_names:
+        The names of the pipes of the index.
+    :ivar pipe_offsets:
+        The equipment of the pipe ``i`` is on the rows from ``pipe_offsets[i]`` to
+        ``pipe_offsets[i + 1]`` (``len(pipe_names) + 1`` values).
+    :ivar pipe_index:
+        The index of the pipe of each equipment (in `pipe_names`).
+    :ivar equipment_type:
+        The type of each equipment (one of `EQUIPMENT_TYPES`).
+    :ivar name:
+        The name of each equipment.
+    :ivar position:
+        Position of each equipment along its pipe [m] (the start of reservoir inflows and heat
+        sources).
+    :ivar end_position:
+        Last position of each equipment [m] (the same as `position`, except for reservoir inflows
+        and heat sources).
+    """
+
+    pipe_names: Tuple[str, ...] = attr.ib()
+    pipe_offsets: np.ndarray = attr.ib()
+    pipe_index: np.ndarray = attr.ib()
+    equipment_type: np.ndarray = attr.ib()
+    name: np.ndarray = attr.ib()
+    position: np.ndarray = attr.ib()
+    end_position: np.ndarray = attr.ib()
+
+    def __len__(self) -> int:
+        return len(self.position)
+
+    @property
+    def pipe_name(self) -> np.ndarray:
+        """
+        The name of the pipe of each equipment.
+        """
+        return np.array(self.pipe_names, dtype=str)[self.pipe_index]
+
+    def get_pipe(self, pipe_name: str) -> "EquipmentIndex":
+        """
+        Return the index of the equipment of the given pipe.
+
+        :raises ValueError:
+            If the pipe is not part of the index.
+        """
+        pipe = self._get_pipe_index(pipe_name)
+        return self._take(
+            np.arange(self.pipe_offsets[pipe], self.pipe_offsets[pipe + 1])
+        )
+
+    def query(
+        self, start: float, end: float, pipe_name: Optional[str] = None
+    ) -> "EquipmentIndex":
+        """
+        Return the index of the equipment placed between the given positions [m] (inclusive), on
+        all pipes or only on the given pipe. Reservoir inflows and heat sources are included when
+        any part of them is between the positions.
+        """
+        if pipe_name is None:
+            pipes = range(len(self.pipe_names))
+        else:
+            pipes = [self._get_pipe_index(pipe_name)]
+        rows = []
+        for pipe in pipes:
+            first = self.pipe_offsets[pipe]
+            last = self.pipe_offsets[pipe + 1]
+            # Only equipment starting before the end of the range, from those keep the ones which
+            # end after the start of the range.
+            last = first + np.searchsorted(self.position[first:last], end, side="right")
+            candidates = np.arange(first, last)
+            rows.append(candidates[self.end_position[first:last] >= start])
+        return self._take(np.concatenate(rows) if rows else np.array([], np.intp))
+
+    def get_cells(
+        self, meshes: Union[PipeMesh, Mapping[str, PipeMesh]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the first and last cell of each equipment (the same cell for equipment on a single
+        position), given the mesh of each pipe by name (or a single mesh, for an index of a single
+        pipe).
+
+        Equipment placed on a face is assigned to the cell after the face (or the last cell, on the
+        end of the pipe), and equipment outside of the pipe to the first or last cell.
+
+        :raises ValueError:
+            If the mesh of a pipe is missing.
+        """
+        if isinstance(meshes, PipeMesh):
+            if len(self.pipe_names) > 1:
+                raise ValueError(
+                    "The mesh of each pipe is required when the index has more than one pipe"
+                )
+            meshes = dict.fromkeys(self.pipe_names, meshes)
+
+        first_cell = np.empty(len(self), dtype=np.intp)
+        last_cell = np.empty(len(self), dtype=np.intp)
+        for pipe, pipe_name in enumerate(self.pipe_names):
+            rows = slice(self.pipe_offsets[pipe], self.pipe_offsets[pipe + 1])
+            if rows.start == rows.stop:
+                continue
+            mesh = meshes.get(pipe_name)
+            if mesh is None:
+                raise ValueError(f"The mesh of pipe '{pipe_name}' is missing")
+            faces = mesh.x_coord_face
+            first = np.searchsorted(faces, self.position[rows], side="right") - 1
+            last = np.searchsorted(faces, self.end_position[rows], side="left") - 1
+            np.clip(first, 0, mesh.cell_count - 1, out=first)
+            first_cell[rows] = first
+            last_cell[rows] = np.clip(last, first, mesh.cell_count - 1)
+        return first_cell, last_cell
+
+    def _get_pipe_index(self, pipe_name: str) -> int:
+        try:
+            return self.pipe_names.index(pipe_name)
+        except ValueError:
+            raise ValueError(f"The equipment index has no pipe named '{pipe_name}'")
+
+    def _take(self, rows: np.ndarray) -> "EquipmentIndex":
+        pipe_index = self.pipe_index[rows]
+        return EquipmentIndex(
+            pipe_names=self.pipe_names,
+            pipe_offsets=np.searchsorted(
+                pipe_index, np.arange(len(self.pipe_names) + 1)
+            ),
+            pipe_index=pipe_index,
+            equipment_type=self.equipment_type[rows],
+            name=self.name[rows],
+            position=self.position[rows],
+            end_position=self.end_position[rows],
+        )
+
+
+def build_equipment_index(
+    equipment: Union[
+        case_description.EquipmentDescription,
+        Iterable[Tuple[str, case_description.EquipmentDescription]],
+    ],
+) -> EquipmentIndex:
+    """
+    Create the index of the equipment of a single pipe (with an empty pipe name) or of many pipes,
+    given as pairs of pipe name and equipment.
+    """
+    if isinstance(equipment, case_description.EquipmentDescription):
+        equipment = [("", equipment)]
+    pipe_names = []
+    pipe_index = []
+    equipment_types = []
+    names = []
+    positions = []
+    end_positions = []
+    for pipe, (pipe_name, pipe_equipment) in enumerate(equipment):
+        pipe_names.append(pipe_name)
+        for equipment_type in EQUIPMENT_TYPES:
+            for name, description in getattr(pipe_equipment, equipment_type).items():
+                if equipment_type in _RANGE_EQUIPMENT_TYPES:
+                    position = description.start.GetValue("m")
+                    end_position = position + description.length.GetValue("m")
+                else:
+                    position = end_position = description.position.GetValue("m")
+                pipe_index.append(pipe)
+                equipment_types.append(equipment_type)
+                names.append(name)
+                positions.append(position)
+                end_positions.append(end_position)
+
+    pipe_index = np.array(pipe_index, dtype=np.intp)
+    positions = np.array(positions, dtype=np.float64)
+    order = np.lexsort((positions, pipe_index))
+    pipe_index = pipe_index[order]
+    return EquipmentIndex(
+        pipe_names=tuple(pipe_names),
+        pipe_offsets=np.searchsorted(pipe_index, np.arange(len(pipe_names) + 1)),
+        pipe_index=pipe_index,
+        equipment_type=np.array(equipment_types, dtype=str)[order],
+        name=np.array(names, dtype=str)[order],
+        position=positions[order],
+        end_position=np.array(end_positions, dtype=np.float64)[order],
+    )
+
+
+def build_case_equipment_index(
+    case: case_description.CaseDescription,
+) -> EquipmentIndex:
+    """
+    Create the index of the equipment of all pipes and wells of the case (by their names).
+    """
+    return build_equipment_index(
+        [(pipe.name, pipe.equipment) for pipe in case.pipes]
+        + [(well.name, well.equipment) for well in case.wells]
+    )
@@ -152,7 +152,8 @@ def is_array(type_):
 
 
 def array_to_alfacase_schema(type_, block_indentation):
-    return 'Map({"values": Seq(Float()), "unit": Str()})'
+    # The values can also be the name of a ".npy" file, see `generate_alfacase_file`.
+    return 'Map({"values": Seq(Float()) | Str(), "unit": Str()})'
 
 
 def is_int(type_):
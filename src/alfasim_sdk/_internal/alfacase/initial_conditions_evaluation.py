@@ -0,0 +1,241 @@
+"""
+Evaluation of the tables of the initial conditions (`InitialConditionsDescription`) on the cells
+of a pipe, creating `InitialConditionArrays` with numpy interpolation.
+"""
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+
+from alfasim_sdk._internal import constants
+from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase.pipe_mesh import PipeMesh
+
+_InitialTableDescription = Union[
+    case_description.InitialPressuresDescription,
+    case_description.InitialVolumeFractionsDescription,
+    case_description.InitialTracersMassFractionsDescription,
+    case_description.InitialVelocitiesDescription,
+    case_description.InitialTemperaturesDescription,
+]
+
+
+def evaluate_initial_conditions(
+    initial_conditions: case_description.InitialConditionsDescription,
+    x_coord_center,
+    *,
+    x=None,
+    y=None,
+    x_coord_face=None,
+    temperature_keys: Optional[Sequence[str]] = None,
+) -> case_description.InitialConditionArrays:
+    """
+    Evaluate the initial pressures, volume fractions, velocities and temperatures on the given
+    cells, using the table selected by the ``position_input_type`` of each of them.
+
+    Values are linearly interpolated between the positions of the tables (the positions of
+    `table_x` and `table_y` are relative to their ``reference_coordinate``) and constant beyond
+    the first and last positions.
+
+    :param x_coord_center:
+        Position of the center of each cell along the pipe [m], used by `table_length`.
+    :param x:
+        Horizontal coordinate of each cell [m], only required when a `table_x` is used.
+    :param y:
+        Vertical coordinate of each cell [m], only required when a `table_y` is used.
+    :param x_coord_face:
+        Position of each face along the pipe [m], only copied to the result.
+    :param temperature_keys:
+        The keys of `InitialConditionArrays.temperature` (which all receive the same
+        temperatures), by default the phases of the volume fractions.
+    :raises ValueError:
+        If a table is empty or not consistent, or the coordinates required by a table are missing.
+    """
+    from barril.units import Array
+
+    coordinates = _get_coordinates(x_coord_center, x, y)
+    (pressure,) = _evaluate_table(
+        initial_conditions.pressures, ["pressures"], "Pa", coordinates
+    )
+    volume_fractions = _evaluate_phase_table(
+        initial_conditions.volume_fractions, "fractions", "-", coordinates
+    )
+    velocity = _evaluate_phase_table(
+        initial_conditions.velocities, "velocities", "m/s", coordinates
+    )
+    (temperature,) = _evaluate_table(
+        initial_conditions.temperatures, ["temperatures"], "K", coordinates
+    )
+    if temperature_keys is None:
+        temperature_keys = list(volume_fractions)
+
+    if x_coord_face is not None:
+        x_coord_face = Array(np.asarray(x_coord_face, dtype=np.float64), "m")
+    return case_description.InitialConditionArrays(
+        pressure=Array(pressure, "Pa"),
+        volume_fractions={
+            phase: Array(values, "-") for phase, values in volume_fractions.items()
+        },
+        velocity={phase: Array(values, "m/s") for phase, values in velocity.items()},
+        temperature={key: Array(temperature.copy(), "K") for key in temperature_keys},
+        x_coord_center=Array(coordinates[constants.TableInputType.length].copy(), "m"),
+        x_coord_face=x_coord_face,
+    )
+
+
+def evaluate_initial_conditions_on_mesh(
+    initial_conditions: case_description.InitialConditionsDescription,
+    mesh: PipeMesh,
+    *,
+    temperature_keys: Optional[Sequence[str]] = None,
+) -> case_description.InitialConditionArrays:
+    """
+    Evaluate the initial conditions on the cells of a `PipeMesh` (see
+    `evaluate_initial_conditions`).
+    """
+    return evaluate_initial_conditions(
+        initial_conditions,
+        mesh.x_coord_center,
+        x=mesh.x,
+        y=mesh.y,
+        x_coord_face=mesh.x_coord_face,
+        temperature_keys=temperature_keys,
+    )
+
+
+def evaluate_initial_tracers_mass_fractions(
+    tracers_mass_fractions: case_description.InitialTracersMassFractionsDescription,
+    x_coord_center,
+    *,
+    x=None,
+    y=None,
+) -> np.ndarray:
+    """
+    Evaluate the initial mass fractions of the tracers on the given cells (which are not part of
+    `InitialConditionArrays`), see `evaluate_initial_conditions`.
+
+    :return:
+        The mass fraction of each tracer on each cell (tracers x cells) [kg/kg].
+    """
+    coordinates = _get_coordinates(x_coord_center, x, y)
+    table = _get_active_table(tracers_mass_fractions)
+    input_type = tracers_mass_fractions.position_input_type
+    # Each array holds the mass fractions of all tracers on one position.
+    arrays = table.tracers_mass_fractions
+    if len(arrays) == 0:
+        return np.empty((0, len(coordinates[constants.TableInputType.length])))
+    tracer_counts = {len(array) for array in arrays}
+    if len(tracer_counts) > 1:
+        raise ValueError(
+            f"The initial tracers mass fractions table by {input_type.value} has a different"
+            f" number of tracers on each position: {sorted(tracer_counts)}"
+        )
+    values = np.array([array.GetValues("-") for array in arrays], dtype=np.float64)
+    return _interpolate(table, values.T, coordinates[input_type], input_type)
+
+
+def _get_coordinates(
+    x_coord_center, x, y
+) -> Dict[constants.TableInputType, Optional[np.ndarray]]:
+    x_coord_center = np.asarray(x_coord_center, dtype=np.float64)
+    coordinates = {
+        constants.TableInputType.length: x_coord_center,
+        constants.TableInputType.horizontal_position: x,
+        constants.TableInputType.vertical_position: y,
+    }
+    for input_type, values in coordinates.items():
+        if values is not None:
+            values = np.asarray(values, dtype=np.float64)
+            if values.shape != x_coord_center.shape:
+                raise ValueError(
+                    f"Expected {x_coord_center.size} coordinates for {input_type.value}, got {values.size}"
+                )
+            coordinates[input_type] = values
+    return coordinates
+
+
+def _get_active_table(description: _InitialTableDescription):
+    input_type = description.position_input_type
+    if input_type == constants.TableInputType.horizontal_position:
+        return description.table_x
+    elif input_type == constants.TableInputType.vertical_position:
+        return description.table_y
+    else:
+        return description.table_length
+
+
+def _evaluate_table(
+    description: _InitialTableDescription,
+    attributes: List[str],
+    unit: str,
+    coordinates: Dict[constants.TableInputType, Optional[np.ndarray]],
+) -> np.ndarray:
+    table = _get_active_table(description)
+    input_type = description.position_input_type
+    values = _get_values([getattr(table, attribute) for attribute in attributes], unit)
+    return _interpolate(table, values, coordinates[input_type], input_type)
+
+
+def _evaluate_phase_table(
+    description: _InitialTableDescription,
+    attribute: str,
+    unit: str,
+    coordinates: Dict[constants.TableInputType, Optional[np.ndarray]],
+) -> Dict[str, np.ndarray]:
+    table = _get_active_table(description)
+    input_type = description.position_input_type
+    values_by_phase = getattr(table, attribute)
+    values = _get_values(list(values_by_phase.values()), unit)
+    values = _interpolate(table, values, coordinates[input_type], input_type)
+    return dict(zip(values_by_phase, values))
+
+
+def _get_values(arrays: List, unit: str) -> List[np.ndarray]:
+    return [np.asarray(array.GetValues(unit), dtype=np.float64) for array in arrays]
+
+
+def _interpolate(
+    table,
+    values: Sequence[np.ndarray],
+    cell_positions: Optional[np.ndarray],
+    input_type: constants.TableInputType,
+) -> np.ndarray:
+    """
+    Interpolate the given values (each one with a value for each position of the table) on the
+    cells, returning an array with the interpolated values (values x cells).
+    """
+    if cell_positions is None:
+        coordinate = (
+            "x" if input_type == constants.TableInputType.horizontal_position else "y"
+        )
+        raise ValueError(
+            f"The {coordinate} coordinate of the cells is required by tables with {input_type.value}"
+        )
+    positions = np.asarray(table.positions.GetValues("m"), dtype=np.float64)
+    reference_coordinate = getattr(table, "reference_coordinate", None)
+    if reference_coordinate is not None:
+        positions = positions + reference_coordinate.GetValue("m")
+
+    if len(values) == 0:
+        return np.empty((0, len(cell_positions)))
+    if len(positions) == 0:
+        raise ValueError(
+            f"The initial conditions table by {input_type.value} has no positions"
+        )
+    for table_values in values:
+        if len(table_values) != len(positions):
+            raise ValueError(
+                f"The initial conditions table by {input_type.value} has {len(positions)} positions"
+                f" but {len(table_values)} values"
+            )
+
+    # `np.interp` requires increasing positions (`table_y` is usually given from top to bottom).
+    order = np.argsort(positions, kind="stable")
+    positions = positions[order]
+    result = np.empty((len(values), len(cell_positions)))
+    for index, table_values in enumerate(values):
+        result[index] = np.interp(cell_positions, positions, table_values[order])
+    return result
@@ -0,0 +1,343 @@
+"""
+Lazy loading of alfacase files.
+
+The content of the file is only split in sections (top level keys of the case), each section
+is parsed, validated and converted to descriptions when accessed for the first time.
+The elements of the ``pipes`` and ``wells`` sections are also handled individually.
+
+The validation uses the schema compiled from the descriptions (see `compiled_schema`), when it
+fails (or the file uses YAML features not handled by the splitting of the sections) the whole file
+is loaded with strictyaml: invalid contents are reported with the usual messages, and valid
+contents are loaded from the strictyaml document, as done by the regular loader.
+"""
+import re
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import TYPE_CHECKING
+from typing import Union
+
+import attr
+
+from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase.compiled_schema import compile_attribute_validators
+from alfasim_sdk._internal.alfacase.compiled_schema import CompiledYAML
+from alfasim_sdk._internal.alfacase.compiled_schema import FastPathNotApplicable
+from alfasim_sdk._internal.alfacase.compiled_schema import get_required_attributes
+from alfasim_sdk._internal.alfacase.compiled_schema import parse_content
+
+if TYPE_CHECKING:
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import DescriptionDocument
+
+# Sections where each element is loaded only when accessed.
+LAZY_LIST_SECTIONS = ("pipes", "wells")
+
+_TOP_LEVEL_KEY_RE = re.compile(r"^([A-Za-z_]\w*):(?:[ \t]|$)")
+_SEQUENCE_ITEM_RE = re.compile(r"^( *)-(?:[ \t]|$)")
+
+
+def split_top_level_sections(yaml_string: str) -> Dict[str, str]:
+    """
+    Split the text from an alfacase file in the text of each top level key, without parsing it.
+
+    :raises FastPathNotApplicable:
+        When the content is not a simple block mapping (the file is then handled by strictyaml).
+    """
+    sections: Dict[str, List[str]] = {}
+    current = None
+    for line in yaml_string.splitlines(keepends=True):
+        stripped = line.strip()
+        if not stripped or line[0] in " \t#-":
+            if current is None and stripped and not stripped.startswith("#"):
+                raise FastPathNotApplicable(f"Unexpected content: {line!r}")
+            if current is not None:
+                current.append(line)
+            continue
+
+        match = _TOP_LEVEL_KEY_RE.match(line)
+        if match is None:
+            raise FastPathNotApplicable(f"Expecting a top level key, found {line!r}")
+        key = match.group(1)
+        if key in sections:
+            raise FastPathNotApplicable(f"Duplicated key: {key}")
+        current = sections[key] = [line]
+
+    return {key: "".join(lines) for key, lines in sections.items()}
+
+
+def split_sequence_items(section_text: str) -> List[str]:
+    """
+    Split the text of a section with a block sequence (``key:`` followed by ``- `` items) in the text
+    of each item, which can be parsed individually as a sequence with a single element.
+
+    :raises FastPathNotApplicable:
+        When the section is not a block sequence.
+    """
+    lines = section_text.splitlines(keepends=True)
+    header = lines[0].split("#", 1)[0].rstrip()
+    if not header.endswith(":") or header.count(":") != 1:
+        raise FastPathNotApplicable(f"Not a block sequence: {lines[0]!r}")
+
+    content_lines = [
+        line for line in lines[1:] if line.strip() and not line.lstrip().startswith("#")
+    ]
+    if not content_lines:
+        return []
+
+    match = _SEQUENCE_ITEM_RE.match(content_lines[0])
+    if match is None:
+        raise FastPathNotApplicable(f"Not a block sequence: {content_lines[0]!r}")
+    indent = match.group(1)
+
+    items: List[List[str]] = []
+    for line in lines[1:]:
+        if not line.strip() or line.lstrip().startswith("#"):
+            if items:
+                items[-1].append("\n")
+            continue
+        if not line.startswith(indent):
+            raise FastPathNotApplicable(f"Unexpected indentation: {line!r}")
+        line = line[len(indent) :]
+        if line[0] == "-" and _SEQUENCE_ITEM_RE.match(line):
+            items.append([])
+        elif line[0] not in " \t":
+            raise FastPathNotApplicable(f"Unexpected content: {line!r}")
+        items[-1].append(line)
+
+    return ["".join(item) for item in items]
+
+
+def _load_document(file_path: Path) -> "DescriptionDocument":
+    """
+    Load the whole file with strictyaml, which reports invalid contents with the usual error
+    messages.
+    """
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import DescriptionDocument
+
+    return DescriptionDocument.from_file(file_path)
+
+
+def _parse_and_validate(text: str, section: str) -> Any:
+    """
+    Parse and validate the text from a section (or from one of the elements of a section).
+
+    :raises FastPathNotApplicable:
+        When the text is not accepted by the compiled schema.
+    """
+    validator = compile_attribute_validators(case_description.CaseDescription)[section]
+    content = parse_content(text)
+    if isinstance(content, dict):
+        content = content.get(section)
+    return validator(content)
+
+
+def _get_case_loaders() -> Dict[str, Any]:
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import _get_case_loader_plan
+
+    return {entry.key: entry for entry in _get_case_loader_plan()}
+
+
+def _load_attribute(key: str, validated_value: Any, file_path: Path) -> Any:
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import DescriptionDocument
+
+    document = DescriptionDocument(CompiledYAML({key: validated_value}), file_path)
+    return _load_attribute_from_document(key, document)
+
+
+def _load_attribute_from_document(key: str, document: "DescriptionDocument") -> Any:
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import to_case_values
+
+    return to_case_values(document, (_get_case_loaders()[key],))[key]
+
+
+class LazyDescriptionList(Sequence):
+    """
+    Read-only sequence of descriptions, each element is parsed, validated and loaded on first access.
+    """
+
+    def __init__(self, items: List[Callable[[], Any]]) -> None:
+        self._items = items
+        self._values: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("list index out of range")
+        try:
+            return self._values[index]
+        except KeyError:
+            value = self._values[index] = self._items[index]()
+            return value
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: Any) -> bool:
+        return list(self) == list(other) if isinstance(other, Sequence) else False
+
+    def is_loaded(self, index: int) -> bool:
+        return index in self._values
+
+    def __repr__(self) -> str:
+        return f"LazyDescriptionList(<{len(self)} items, {len(self._values)} loaded>)"
+
+
+class LazyCaseDescription:
+    """
+    A read-only, `CaseDescription` compatible object where each section is loaded on first access.
+
+    Use `materialize` to obtain a regular `CaseDescription`.
+    """
+
+    def __init__(
+        self,
+        sections: Dict[str, Optional[str]],
+        file_path: Path,
+        document: Optional["DescriptionDocument"] = None,
+    ) -> None:
+        self._sections = sections
+        self._file_path = file_path
+        # The whole file loaded with strictyaml, only when the fast path can't be used.
+        self._document = document
+        self._values: Dict[str, Any] = {}
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> "LazyCaseDescription":
+        """
+        Open the given alfacase file, only checking that the top level keys are valid.
+        """
+        file_path = Path(file_path)
+        yaml_string = file_path.read_text(encoding="UTF-8")
+        try:
+            sections = split_top_level_sections(yaml_string)
+            validators = compile_attribute_validators(case_description.CaseDescription)
+            unknown_keys = set(sections).difference(validators)
+            if unknown_keys:
+                raise FastPathNotApplicable(f"Unknown keys: {sorted(unknown_keys)}")
+            missing_keys = set(
+                get_required_attributes(case_description.CaseDescription)
+            ).difference(sections)
+            if missing_keys:
+                raise FastPathNotApplicable(f"Missing keys: {sorted(missing_keys)}")
+        except FastPathNotApplicable:
+            # Valid files which can't be split (a document marker, for instance) are loaded by
+            # strictyaml, and their sections are loaded from the document when accessed.
+            document = _load_document(file_path)
+            sections = dict.fromkeys(document.content.data)
+            return cls(sections, file_path, document)
+        return cls(sections, file_path)
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Return if the given section was already loaded.
+        """
+        return name in self._values
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name not in _CASE_ATTRIBUTES:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        try:
+            return self._values[name]
+        except KeyError:
+            value = self._values[name] = self._load_section(name)
+            return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _CASE_ATTRIBUTES:
+            raise attr.exceptions.FrozenInstanceError()
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()).union(_CASE_ATTRIBUTES))
+
+    def materialize(self) -> case_description.CaseDescription:
+        """
+        Load all sections and return the equivalent `CaseDescription`.
+        """
+        case_values = {}
+        for name in self._sections:
+            value = getattr(self, name)
+            if isinstance(value, LazyDescriptionList):
+                value = list(value)
+            case_values[name] = value
+        return case_description.CaseDescription(**case_values)
+
+    def __repr__(self) -> str:
+        return f"LazyCaseDescription({str(self._file_path)!r}, loaded={sorted(self._values)})"
+
+    def _get_document(self) -> "DescriptionDocument":
+        if self._document is None:
+            self._document = _load_document(self._file_path)
+        return self._document
+
+    def _load_section_from_document(self, name: str) -> Any:
+        return _load_attribute_from_document(name, self._get_document())
+
+    def _load_section(self, name: str) -> Any:
+        if name not in self._sections:
+            default = _CASE_ATTRIBUTES[name].default
+            return default.factory() if isinstance(default, attr.Factory) else default
+        section_text = self._sections[name]
+        if section_text is None:
+            return self._load_section_from_document(name)
+
+        if name in LAZY_LIST_SECTIONS:
+            try:
+                items_text = split_sequence_items(section_text)
+            except FastPathNotApplicable:
+                pass
+            else:
+                return LazyDescriptionList(
+                    [
+                        _LazyItemLoader(name, index, item_text, self)
+                        for index, item_text in enumerate(items_text)
+                    ]
+                )
+
+        try:
+            validated_value = _parse_and_validate(section_text, name)
+        except FastPathNotApplicable:
+            return self._load_section_from_document(name)
+        return _load_attribute(name, validated_value, self._file_path)
+
+
+@attr.s(frozen=True, slots=True)
+class _LazyItemLoader:
+    """
+    Callable that loads one element from a section with a list of descriptions.
+    """
+
+    section = attr.ib(type=str)
+    index = attr.ib(type=int)
+    item_text = attr.ib(type=str)
+    case = attr.ib(type=LazyCaseDescription)
+
+    def __call__(self) -> Any:
+        try:
+            validated_value = _parse_and_validate(self.item_text, self.section)
+        except FastPathNotApplicable:
+            # Loads the whole section, which is rare (only for contents not handled by the
+            # compiled schema).
+            return self.case._load_section_from_document(self.section)[self.index]
+        return _load_attribute(self.section, validated_value, self.case.file_path)[0]
+
+
+_CASE_ATTRIBUTES = attr.fields_dict(case_description.CaseDescription)
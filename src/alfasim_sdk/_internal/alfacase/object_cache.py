@@ -0,0 +1,53 @@
+"""
+Cache of values computed from descriptions (like the geometry of a profile), kept while the
+description exists and the objects used to compute the value are the same.
+"""
+import weakref
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import Tuple
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class ObjectCache(Generic[T]):
+    """
+    Values computed from objects, by the id of the object.
+
+    Each value is stored with a token, a tuple with the objects used to compute it (the
+    attributes of the object, the items of its lists, ...), and the value is only reused while
+    all of them are the same objects, so replacing an attribute or changing a list of the object
+    computes the value again (changing the values of an array in-place is not detected).
+    Tokens must only have the objects themselves, not values computed from them (like the
+    length of a list), which are new objects on each call.
+
+    Entries are removed when their object is garbage collected, so the objects are not kept
+    alive by the cache (and ids are not reused by other objects while in the cache).
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Tuple[Tuple[Any, ...], T]] = {}
+
+    def get(self, obj: Any, token: Tuple[Any, ...], create: Callable[[], T]) -> T:
+        """
+        Return the value for the object, calling `create` when there is no value or it was
+        computed with a different token.
+        """
+        entry = self._entries.get(id(obj))
+        if entry is not None and _is_same_token(entry[0], token):
+            return entry[1]
+
+        value = create()
+        if id(obj) not in self._entries:
+            weakref.finalize(obj, self._entries.pop, id(obj), None)
+        self._entries[id(obj)] = (token, value)
+        return value
+
+
+def _is_same_token(token1: Tuple[Any, ...], token2: Tuple[Any, ...]) -> bool:
+    return len(token1) == len(token2) and all(
+        obj1 is obj2 for obj1, obj2 in zip(token1, token2)
+    )
@@ -0,0 +1,184 @@
+"""
+Discretization of pipes (`PipeDescription`) in cells, computing the properties of all cells with
+numpy operations.
+"""
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import attr
+import numpy as np
+from barril.units import Scalar
+
+from alfasim_sdk._internal.alfacase import case_description
+
+# Intervals between the points of the profile and segments shorter than this are ignored [m].
+_MIN_INTERVAL_LENGTH = 1e-9
+
+
+@attr.s(frozen=True, slots=True, eq=False)
+class PipeMesh:
+    """
+    The cells of a pipe.
+
+    Faces are placed on all points of the profile and at the start of all segments (so each cell
+    has a single inclination, diameter and roughness), and each interval between those is divided
+    in cells of the same size, not bigger than the target cell size.
+
+    :ivar x_coord_face:
+        Position of each face along the pipe [m] (cells + 1 values).
+    :ivar x_coord_center:
+        Position of the center of each cell along the pipe [m].
+    :ivar cell_length:
+        Length of each cell [m].
+    :ivar x:
+        Horizontal coordinate of the center of each cell [m].
+    :ivar y:
+        Vertical coordinate of the center of each cell [m].
+    :ivar inclination:
+        Inclination of each cell [rad].
+    :ivar diameter:
+        Diameter of each cell [m].
+    :ivar roughness:
+        Roughness of each cell [m].
+    :ivar segment_index:
+        Index of the segment (from `PipeSegmentsDescription`) of each cell.
+    :ivar wall_names:
+        Wall name of each segment (`None` when not defined).
+    """
+
+    x_coord_face: np.ndarray = attr.ib()
+    x_coord_center: np.ndarray = attr.ib()
+    cell_length: np.ndarray = attr.ib()
+    x: np.ndarray = attr.ib()
+    y: np.ndarray = attr.ib()
+    inclination: np.ndarray = attr.ib()
+    diameter: np.ndarray = attr.ib()
+    roughness: np.ndarray = attr.ib()
+    segment_index: np.ndarray = attr.ib()
+    wall_names: Tuple[Optional[str], ...] = attr.ib()
+
+    @property
+    def cell_count(self) -> int:
+        return len(self.x_coord_center)
+
+    @property
+    def cell_wall_names(self) -> np.ndarray:
+        """
+        The wall name of each cell (an array of objects).
+        """
+        wall_names = np.empty(len(self.wall_names), dtype=object)
+        wall_names[:] = self.wall_names
+        return wall_names[self.segment_index]
+
+
+def build_pipe_mesh(
+    pipe: case_description.PipeDescription,
+    target_cell_size: Union[Scalar, float],
+) -> PipeMesh:
+    """
+    Create the cells of the given pipe, using its profile and segments.
+
+    :param target_cell_size:
+        The maximum size of the cells ([m] when given as a float).
+    :raises ValueError:
+        If the profile or segments of the pipe are not valid.
+    """
+    if isinstance(target_cell_size, Scalar):
+        target_cell_size = target_cell_size.GetValue("m")
+    if not target_cell_size > 0.0:
+        raise ValueError(
+            f"The target cell size must be positive, got {target_cell_size}"
+        )
+
+    geometry = pipe.profile.get_geometry()
+    segments = pipe.segments
+    if (
+        segments.start_positions is None
+        or segments.diameters is None
+        or segments.roughnesses is None
+    ):
+        raise ValueError(
+            f"The segments of pipe '{pipe.name}' must define start_positions, diameters and roughnesses"
+        )
+    start_positions = np.asarray(segments.start_positions.GetValues("m"), dtype=float)
+    diameters = np.asarray(segments.diameters.GetValues("m"), dtype=float)
+    roughnesses = np.asarray(segments.roughnesses.GetValues("m"), dtype=float)
+    if not len(start_positions) == len(diameters) == len(roughnesses) > 0:
+        raise ValueError(
+            f"The segments of pipe '{pipe.name}' must have the same number of start_positions,"
+            f" diameters and roughnesses, got {len(start_positions)}, {len(diameters)} and {len(roughnesses)}"
+        )
+    if (np.diff(start_positions) <= 0.0).any():
+        raise ValueError(
+            f"The start_positions of the segments of pipe '{pipe.name}' must be sorted"
+        )
+    wall_names = segments.wall_names
+    if wall_names is None:
+        wall_names = [None] * len(start_positions)
+    elif len(wall_names) != len(start_positions):
+        raise ValueError(
+            f"The segments of pipe '{pipe.name}' have {len(start_positions)} start_positions but {len(wall_names)} wall_names"
+        )
+
+    total_length = geometry.total_length
+    if total_length <= _MIN_INTERVAL_LENGTH:
+        raise ValueError(f"The profile of pipe '{pipe.name}' has no length")
+
+    # Faces required on the points of the profile and the start of each segment.
+    breakpoints = np.concatenate(
+        [geometry.measured_length, start_positions, [0.0, total_length]]
+    )
+    breakpoints = np.unique(np.clip(breakpoints, 0.0, total_length))
+    breakpoints = breakpoints[
+        np.concatenate([[True], np.diff(breakpoints) > _MIN_INTERVAL_LENGTH])
+    ]
+    breakpoints[-1] = total_length
+
+    # Divide each interval in the same number of cells, all done at once.
+    interval_lengths = np.diff(breakpoints)
+    cell_counts = np.maximum(
+        np.ceil(interval_lengths / target_cell_size - 1e-9).astype(np.intp), 1
+    )
+    interval_of_cell = np.repeat(np.arange(len(interval_lengths)), cell_counts)
+    first_cell_of_interval = np.cumsum(cell_counts) - cell_counts
+    index_in_interval = (
+        np.arange(len(interval_of_cell)) - first_cell_of_interval[interval_of_cell]
+    )
+    x_coord_face = np.empty(len(interval_of_cell) + 1)
+    x_coord_face[:-1] = (
+        breakpoints[interval_of_cell]
+        + index_in_interval * (interval_lengths / cell_counts)[interval_of_cell]
+    )
+    x_coord_face[-1] = total_length
+
+    cell_length = np.diff(x_coord_face)
+    x_coord_center = x_coord_face[:-1] + 0.5 * cell_length
+    x, y = geometry.get_coordinates(x_coord_center)
+    segment_index = np.searchsorted(start_positions, x_coord_center, side="right") - 1
+    np.clip(segment_index, 0, len(start_positions) - 1, out=segment_index)
+
+    return PipeMesh(
+        x_coord_face=x_coord_face,
+        x_coord_center=x_coord_center,
+        cell_length=cell_length,
+        x=x,
+        y=y,
+        inclination=geometry.get_inclination(x_coord_center),
+        diameter=diameters[segment_index],
+        roughness=roughnesses[segment_index],
+        segment_index=segment_index,
+        wall_names=tuple(wall_names),
+    )
+
+
+def build_pipe_meshes(
+    pipes: Iterable[case_description.PipeDescription],
+    target_cell_size: Union[Scalar, float],
+) -> Dict[str, PipeMesh]:
+    """
+    Create the cells of all given pipes (for instance, all pipes of a `CaseDescription`), by name.
+    """
+    return {pipe.name: build_pipe_mesh(pipe, target_cell_size) for pipe in pipes}
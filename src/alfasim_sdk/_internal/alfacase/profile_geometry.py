@@ -0,0 +1,203 @@
+"""
+Geometry of the profile of pipes (`XAndYDescription` and `LengthAndElevationDescription`) as numpy
+arrays in SI units.
+"""
+from typing import Tuple
+from typing import Union
+
+import attr
+import numpy as np
+
+from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase.object_cache import ObjectCache
+
+# Relative tolerance when checking if the elevation of a segment is not bigger than its length.
+_ELEVATION_TOLERANCE = 1e-9
+
+
+@attr.s(frozen=True, slots=True, eq=False)
+class ProfileGeometry:
+    """
+    The points of a pipe profile, with the properties of each segment (between two points).
+
+    :ivar x:
+        Horizontal coordinate of each point [m].
+    :ivar y:
+        Vertical coordinate of each point [m].
+    :ivar segment_lengths:
+        Length of each segment [m].
+    :ivar measured_length:
+        Length along the pipe from the first point to each point [m] (the cumulative length).
+    :ivar horizontal_distance:
+        Horizontal distance from the first point to each point, along the pipe [m].
+    :ivar inclination:
+        Angle of each segment with the horizontal [rad], positive when going up.
+    """
+
+    x: np.ndarray = attr.ib()
+    y: np.ndarray = attr.ib()
+    segment_lengths: np.ndarray = attr.ib()
+    measured_length: np.ndarray = attr.ib()
+    horizontal_distance: np.ndarray = attr.ib()
+    inclination: np.ndarray = attr.ib()
+
+    @classmethod
+    def from_coordinates(cls, x, y) -> "ProfileGeometry":
+        """
+        Create the geometry from the coordinates of the points [m].
+        """
+        x = np.array(x, dtype=np.float64)
+        y = np.array(y, dtype=np.float64)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError(
+                f"x and y must have the same size, got {x.size} and {y.size} values"
+            )
+        dx = np.abs(np.diff(x))
+        dy = np.diff(y)
+        return cls._create(x, y, dx, dy)
+
+    @classmethod
+    def from_length_and_elevation(cls, length, elevation) -> "ProfileGeometry":
+        """
+        Create the geometry from the length and elevation of each segment [m] (the first item
+        is the first point of the profile, usually ``(0, 0)``).
+        """
+        length = np.asarray(length, dtype=np.float64)
+        elevation = np.asarray(elevation, dtype=np.float64)
+        if length.shape != elevation.shape or length.ndim != 1:
+            raise ValueError(
+                f"length and elevation must have the same size, got {length.size} and {elevation.size} values"
+            )
+        if (length < 0.0).any():
+            raise ValueError("The length of the segments can't be negative")
+        horizontal = length ** 2 - elevation ** 2
+        invalid = horizontal < -_ELEVATION_TOLERANCE * length ** 2
+        if invalid.any():
+            index = int(np.flatnonzero(invalid)[0])
+            raise ValueError(
+                f"The elevation of a segment can't be bigger than its length, got length {length[index]} m"
+                f" and elevation {elevation[index]} m on segment {index}"
+            )
+        horizontal = np.sqrt(np.maximum(horizontal, 0.0))
+        x = np.cumsum(horizontal)
+        y = np.cumsum(elevation)
+        return cls._create(x, y, horizontal[1:], elevation[1:])
+
+    @classmethod
+    def _create(
+        cls, x: np.ndarray, y: np.ndarray, dx: np.ndarray, dy: np.ndarray
+    ) -> "ProfileGeometry":
+        segment_lengths = np.hypot(dx, dy)
+        measured_length = np.zeros_like(x)
+        np.cumsum(segment_lengths, out=measured_length[1:])
+        horizontal_distance = np.zeros_like(x)
+        np.cumsum(dx, out=horizontal_distance[1:])
+        arrays = (
+            x,
+            y,
+            segment_lengths,
+            measured_length,
+            horizontal_distance,
+            np.arctan2(dy, dx),
+        )
+        # Read-only, since the (cached) geometry is shared by all users of the description.
+        for array in arrays:
+            array.flags.writeable = False
+        return cls(*arrays)
+
+    @property
+    def total_length(self) -> float:
+        return float(self.measured_length[-1]) if len(self.measured_length) else 0.0
+
+    def get_coordinates(self, measured_length) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the coordinates (x, y) of the given positions along the pipe [m], clipped to the
+        length of the pipe.
+        """
+        measured_length = np.asarray(measured_length, dtype=np.float64)
+        return (
+            np.interp(measured_length, self.measured_length, self.x),
+            np.interp(measured_length, self.measured_length, self.y),
+        )
+
+    def get_inclination(self, measured_length) -> np.ndarray:
+        """
+        Return the inclination [rad] of the segments at the given positions along the pipe [m].
+        """
+        if len(self.inclination) == 0:
+            return np.zeros(np.shape(measured_length))
+        index = np.searchsorted(self.measured_length, measured_length, side="right") - 1
+        return self.inclination[np.clip(index, 0, len(self.inclination) - 1)]
+
+    def to_x_and_y(self) -> case_description.XAndYDescription:
+        from barril.units import Array
+
+        return case_description.XAndYDescription(
+            x=Array(self.x.copy(), "m"), y=Array(self.y.copy(), "m")
+        )
+
+    def to_length_and_elevation(
+        self,
+    ) -> case_description.LengthAndElevationDescription:
+        """
+        The profile as length and elevation, starting at ``(0, 0)`` (the position of the first
+        point is not kept).
+        """
+        from barril.units import Array
+
+        length = np.zeros_like(self.x)
+        length[1:] = self.segment_lengths
+        return case_description.LengthAndElevationDescription(
+            length=Array(length, "m"),
+            elevation=Array(np.diff(self.y, prepend=self.y[:1]), "m"),
+        )
+
+
+# Geometries already created for each description.
+_GEOMETRIES: ObjectCache[ProfileGeometry] = ObjectCache()
+
+
+def get_profile_geometry(
+    description: Union[
+        case_description.XAndYDescription,
+        case_description.LengthAndElevationDescription,
+    ]
+) -> ProfileGeometry:
+    """
+    Return the geometry of the given profile, which is only created once for each description
+    (while its arrays are the same).
+
+    :raises ValueError:
+        If the profile values are not defined or not consistent.
+    """
+    if isinstance(description, case_description.XAndYDescription):
+        token = (description.x, description.y)
+    elif isinstance(description, case_description.LengthAndElevationDescription):
+        token = (description.length, description.elevation)
+    else:
+        raise TypeError(f"Expected a profile description, got {description!r}")
+    return _GEOMETRIES.get(
+        description, token, lambda: _create_profile_geometry(description)
+    )
+
+
+def _create_profile_geometry(
+    description: Union[
+        case_description.XAndYDescription,
+        case_description.LengthAndElevationDescription,
+    ]
+) -> ProfileGeometry:
+    if isinstance(description, case_description.XAndYDescription):
+        if description.x is None or description.y is None:
+            raise ValueError("x and y must be defined to compute the profile geometry")
+        return ProfileGeometry.from_coordinates(
+            description.x.GetValues("m"), description.y.GetValues("m")
+        )
+    else:
+        if description.length is None or description.elevation is None:
+            raise ValueError(
+                "length and elevation must be defined to compute the profile geometry"
+            )
+        return ProfileGeometry.from_length_and_elevation(
+            description.length.GetValues("m"), description.elevation.GetValues("m")
+        )
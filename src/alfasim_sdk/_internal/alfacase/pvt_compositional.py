@@ -0,0 +1,191 @@
+"""
+Dense (numpy) view of a `PvtModelCompositionalDescription`, for vectorized calculations with the
+components and fluids of a compositional model.
+"""
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import attr
+import numpy as np
+
+from alfasim_sdk._internal.alfacase import case_description
+
+
+@attr.s(frozen=True, slots=True)
+class CompiledCompositionalModel:
+    """
+    The components and fluids of a compositional model as contiguous arrays.
+
+    Components are ordered as the light components, the heavy components and then the components
+    only referenced by the fluids (standard components from ALFAsim's library, which properties
+    are not part of the description and are `nan` here).
+
+    :ivar component_names:
+        The name of each component.
+    :ivar component_indexes:
+        The index of each component by name.
+    :ivar is_heavy:
+        Which components are heavy components.
+    :ivar is_declared:
+        Which components are declared on the model (light or heavy components).
+    :ivar critical_pressure:
+        Pc of each component [Pa] (`nan` for heavy and not declared components).
+    :ivar critical_temperature:
+        Tc of each component [K] (`nan` for heavy and not declared components).
+    :ivar critical_volume:
+        Vc of each component [m3/mol] (`nan` for heavy and not declared components).
+    :ivar acentric_factor:
+        omega of each component [-] (`nan` for heavy and not declared components).
+    :ivar molecular_weight:
+        MW of each component [kg/mol] (`nan` for not declared components).
+    :ivar fluid_names:
+        The name of each fluid.
+    :ivar molar_fractions:
+        The molar fraction of each component on each fluid (fluids x components) [mol/mol],
+        zero for components not in the composition of a fluid.
+    :ivar reference_enthalpies:
+        The reference enthalpy of each component on each fluid (fluids x components) [J/mol].
+    :ivar bip_matrices:
+        The symmetric matrix of binary interaction parameters of each fluid
+        (fluids x components x components), zero for pairs not given.
+    """
+
+    component_names: Tuple[str, ...] = attr.ib()
+    component_indexes: Dict[str, int] = attr.ib()
+    is_heavy: np.ndarray = attr.ib()
+    is_declared: np.ndarray = attr.ib()
+    critical_pressure: np.ndarray = attr.ib()
+    critical_temperature: np.ndarray = attr.ib()
+    critical_volume: np.ndarray = attr.ib()
+    acentric_factor: np.ndarray = attr.ib()
+    molecular_weight: np.ndarray = attr.ib()
+    fluid_names: Tuple[str, ...] = attr.ib()
+    molar_fractions: np.ndarray = attr.ib()
+    reference_enthalpies: np.ndarray = attr.ib()
+    bip_matrices: np.ndarray = attr.ib()
+
+    def get_component_indexes(self, component_names: List[str]) -> np.ndarray:
+        """
+        Return the indexes of the given components.
+
+        :raises ValueError:
+            If a component is not part of the model.
+        """
+        try:
+            return np.array(
+                [self.component_indexes[name] for name in component_names],
+                dtype=np.intp,
+            )
+        except KeyError as e:
+            raise ValueError(
+                f"Component {e.args[0]!r} is not part of the compositional model"
+            )
+
+    def get_fluid_index(self, fluid_name: str) -> int:
+        """
+        :raises ValueError:
+            If the fluid is not part of the model.
+        """
+        try:
+            return self.fluid_names.index(fluid_name)
+        except ValueError:
+            raise ValueError(
+                f"Fluid {fluid_name!r} is not part of the compositional model, expected one of: {', '.join(self.fluid_names)}"
+            )
+
+    def get_molar_fractions(self, fluid_name: str) -> np.ndarray:
+        return self.molar_fractions[self.get_fluid_index(fluid_name)]
+
+    def get_bip_matrix(self, fluid_name: str) -> np.ndarray:
+        return self.bip_matrices[self.get_fluid_index(fluid_name)]
+
+
+def compile_compositional_model(
+    description: case_description.PvtModelCompositionalDescription,
+) -> CompiledCompositionalModel:
+    """
+    Create the `CompiledCompositionalModel` of the given description.
+
+    When a component is repeated (on the components, the composition or the binary interaction
+    parameters of a fluid) the last definition is used.
+    """
+    component_indexes: Dict[str, int] = {}
+
+    def add_component(name: str) -> int:
+        return component_indexes.setdefault(name, len(component_indexes))
+
+    light_indexes = [add_component(c.name) for c in description.light_components]
+    heavy_indexes = [add_component(c.name) for c in description.heavy_components]
+    for fluid in description.fluids.values():
+        for composition in fluid.composition:
+            add_component(composition.component)
+        for bip in fluid.fraction_pairs:
+            add_component(bip.component_1)
+            add_component(bip.component_2)
+
+    count = len(component_indexes)
+
+    def component_values(indexes, components, attribute, unit) -> np.ndarray:
+        values = np.full(count, np.nan)
+        values[indexes] = [
+            getattr(component, attribute).GetValue(unit) for component in components
+        ]
+        return values
+
+    light_components = description.light_components
+    heavy_components = description.heavy_components
+    molecular_weight = component_values(light_indexes, light_components, "MW", "kg/mol")
+    molecular_weight[heavy_indexes] = [
+        c.MW.GetValue("kg/mol") for c in heavy_components
+    ]
+    is_heavy = np.zeros(count, dtype=bool)
+    is_heavy[heavy_indexes] = True
+    is_declared = np.zeros(count, dtype=bool)
+    is_declared[light_indexes] = True
+    is_declared[heavy_indexes] = True
+
+    fluid_names = tuple(description.fluids)
+    molar_fractions = np.zeros((len(fluid_names), count))
+    reference_enthalpies = np.zeros((len(fluid_names), count))
+    bip_matrices = np.zeros((len(fluid_names), count, count))
+    for fluid_index, fluid in enumerate(description.fluids.values()):
+        compositions = {component_indexes[c.component]: c for c in fluid.composition}
+        indexes = list(compositions)
+        molar_fractions[fluid_index, indexes] = [
+            c.molar_fraction.GetValue("mol/mol") for c in compositions.values()
+        ]
+        reference_enthalpies[fluid_index, indexes] = [
+            c.reference_enthalpy.GetValue("J/mol") for c in compositions.values()
+        ]
+
+        bips = {
+            frozenset((bip.component_1, bip.component_2)): bip
+            for bip in fluid.fraction_pairs
+        }
+        index_1 = [component_indexes[bip.component_1] for bip in bips.values()]
+        index_2 = [component_indexes[bip.component_2] for bip in bips.values()]
+        values = [bip.value for bip in bips.values()]
+        bip_matrices[fluid_index, index_1, index_2] = values
+        bip_matrices[fluid_index, index_2, index_1] = values
+
+    def light_values(attribute, unit) -> np.ndarray:
+        values = component_values(light_indexes, light_components, attribute, unit)
+        values[is_heavy] = np.nan
+        return values
+
+    return CompiledCompositionalModel(
+        component_names=tuple(component_indexes),
+        component_indexes=component_indexes,
+        is_heavy=is_heavy,
+        is_declared=is_declared,
+        critical_pressure=light_values("Pc", "Pa"),
+        critical_temperature=light_values("Tc", "K"),
+        critical_volume=light_values("Vc", "m3/mol"),
+        acentric_factor=light_values("omega", "-"),
+        molecular_weight=molecular_weight,
+        fluid_names=fluid_names,
+        molar_fractions=molar_fractions,
+        reference_enthalpies=reference_enthalpies,
+        bip_matrices=bip_matrices,
+    )
@@ -0,0 +1,371 @@
+"""
+Evaluation of the black-oil properties of a `PvtModelCorrelationDescription` over arrays of
+pressures and temperatures, for quick checks of a fluid without running the simulator.
+
+The correlations are defined in field units (psia, degF, scf/STB), the conversions are done
+here so all inputs and outputs are in SI units.
+
+- Solution gas-oil ratio, bubble point pressure and oil formation volume factor: the correlation
+  from the selected `CorrelationPackage` (Lasater uses Standing's formation volume factor).
+  Above the bubble point the oil is compressed using Vazquez and Beggs' compressibility.
+- Gas compressibility factor: Hall and Yarborough, with Sutton's pseudo-critical properties.
+- Oil viscosity: Beggs and Robinson (saturated) and Vazquez and Beggs (undersaturated).
+- Gas viscosity: Lee, Gonzalez and Eakin.
+"""
+from typing import Dict
+from typing import Tuple
+
+import numpy as np
+
+from alfasim_sdk._internal import constants
+from alfasim_sdk._internal.alfacase import case_description
+
+# Names of the properties computed by `BlackOilCorrelationEvaluator.evaluate`.
+SOLUTION_GAS_OIL_RATIO = "solution gas-oil ratio"  # sm3/sm3
+BUBBLE_POINT_PRESSURE = "bubble point pressure"  # Pa
+OIL_FORMATION_VOLUME_FACTOR = "oil formation volume factor"  # -
+GAS_COMPRESSIBILITY_FACTOR = "gas compressibility factor"  # -
+OIL_DENSITY = "oil density"  # kg/m3
+GAS_DENSITY = "gas density"  # kg/m3
+OIL_VISCOSITY = "oil viscosity"  # Pa.s
+GAS_VISCOSITY = "gas viscosity"  # Pa.s
+
+BLACK_OIL_PROPERTIES = (
+    SOLUTION_GAS_OIL_RATIO,
+    BUBBLE_POINT_PRESSURE,
+    OIL_FORMATION_VOLUME_FACTOR,
+    GAS_COMPRESSIBILITY_FACTOR,
+    OIL_DENSITY,
+    GAS_DENSITY,
+    OIL_VISCOSITY,
+    GAS_VISCOSITY,
+)
+
+_PA_PER_PSI = 6894.757293168
+_SCF_PER_STB_PER_SM3_PER_SM3 = 5.614583
+_WATER_DENSITY_STD = 999.016  # kg/m3, at 60 degF
+_AIR_DENSITY_STD = 1.2232  # kg/m3, at 60 degF and 14.696 psia
+_AIR_MOLECULAR_WEIGHT = 28.9625  # g/mol
+_STANDARD_PRESSURE = 14.696  # psia
+_GAS_CONSTANT = 8.314462618  # J/(mol.K)
+_HALL_YARBOROUGH_MAX_ITERATIONS = 100
+_HALL_YARBOROUGH_TOLERANCE = 1e-10
+
+
+def _to_psia(pressure: np.ndarray) -> np.ndarray:
+    return pressure / _PA_PER_PSI
+
+
+def _to_degF(temperature: np.ndarray) -> np.ndarray:
+    return (temperature - 273.15) * 1.8 + 32.0
+
+
+def _vazquez_beggs_coefficients(api: float) -> Tuple[float, float, float]:
+    return (0.0362, 1.0937, 25.724) if api <= 30 else (0.0178, 1.187, 23.931)
+
+
+def _hall_yarborough_compressibility_factor(
+    ppr: np.ndarray, tpr: np.ndarray
+) -> np.ndarray:
+    """
+    Solve Hall and Yarborough's equation for the reduced density with Newton iterations done on
+    all points at once (only the points not converged yet are updated on each iteration).
+    """
+    ppr, tpr = np.broadcast_arrays(ppr, tpr)
+    t = 1.0 / tpr.ravel()
+    a = 0.06125 * t * np.exp(-1.2 * (1.0 - t) ** 2)
+    b = t * (14.76 - 9.76 * t + 4.58 * t ** 2)
+    c = t * (90.7 - 242.2 * t + 42.4 * t ** 2)
+    d = 2.18 + 2.82 * t
+    ap = a * ppr.ravel()
+
+    # Start from the explicit correlation from Papay.
+    papay_z = (
+        1.0
+        - 3.52 * ppr.ravel() / 10.0 ** (0.9813 * tpr.ravel())
+        + 0.274 * ppr.ravel() ** 2 / 10.0 ** (0.8157 * tpr.ravel())
+    )
+    y = np.clip(ap / np.clip(papay_z, 0.3, 3.0), 1e-300, 0.9)
+    active = np.flatnonzero(ap > 0.0)
+    for _ in range(_HALL_YARBOROUGH_MAX_ITERATIONS):
+        if len(active) == 0:
+            break
+        ya = y[active]
+        y2 = ya * ya
+        y3 = y2 * ya
+        y4 = y3 * ya
+        cy = c[active] * ya ** (d[active] - 1.0)
+        f = (
+            -ap[active]
+            + (ya + y2 + y3 - y4) / (1.0 - ya) ** 3
+            - b[active] * y2
+            + cy * ya
+        )
+        df = (
+            (1.0 + 4.0 * ya + 4.0 * y2 - 4.0 * y3 + y4) / (1.0 - ya) ** 4
+            - 2.0 * b[active] * ya
+            + d[active] * cy
+        )
+        new_y = ya - f / df
+        # Keep the reduced density inside (0, 1), where the equation is defined.
+        out_of_range = (new_y <= 0.0) | (new_y >= 1.0)
+        new_y[out_of_range] = 0.5 * (
+            ya[out_of_range] + np.clip(new_y[out_of_range], 0.0, 0.99)
+        )
+        y[active] = new_y
+        active = active[np.abs(new_y - ya) > _HALL_YARBOROUGH_TOLERANCE * new_y]
+
+    z = np.ones_like(ap)
+    np.divide(ap, y, out=z, where=ap > 0.0)
+    return z.reshape(ppr.shape)
+
+
+class BlackOilCorrelationEvaluator:
+    """
+    Compute the black-oil properties of a `PvtModelCorrelationDescription` at any number of
+    pressures [Pa] and temperatures [K] with vectorized numpy operations.
+
+    ``rs_sat`` is taken as the solution gas-oil ratio at the bubble point, so the bubble point
+    pressure changes with the temperature.
+    """
+
+    def __init__(
+        self, description: case_description.PvtModelCorrelationDescription
+    ) -> None:
+        self.package = description.pvt_correlation_package
+        self.oil_density_std = description.oil_density_std.GetValue("kg/m3")
+        self.gas_density_std = description.gas_density_std.GetValue("kg/m3")
+        self.rs_sat = description.rs_sat.GetValue("sm3/sm3")
+        if self.oil_density_std <= 0.0 or self.gas_density_std <= 0.0:
+            raise ValueError("The standard densities must be positive")
+
+        self._oil_gravity = self.oil_density_std / _WATER_DENSITY_STD
+        self._gas_gravity = self.gas_density_std / _AIR_DENSITY_STD
+        self._api = 141.5 / self._oil_gravity - 131.5
+        self._rs_sat_field = self.rs_sat * _SCF_PER_STB_PER_SM3_PER_SM3
+
+    def evaluate(self, pressure, temperature) -> Dict[str, np.ndarray]:
+        """
+        Compute all `BLACK_OIL_PROPERTIES` at the given points.
+
+        ``pressure`` and ``temperature`` can be scalars or arrays (broadcast against each other).
+        """
+        pressure, temperature = np.broadcast_arrays(
+            np.asarray(pressure, dtype=np.float64),
+            np.asarray(temperature, dtype=np.float64),
+        )
+        p = _to_psia(pressure)
+        t = _to_degF(temperature)
+
+        # Correlations can give negative bubble points for small gas-oil ratios.
+        pb = np.maximum(self._bubble_point_pressure(t), 0.0)
+        p_saturated = np.minimum(p, pb)
+        rs = np.clip(
+            self._solution_gas_oil_ratio(p_saturated, t), 0.0, self._rs_sat_field
+        )
+        rs = np.where(p >= pb, self._rs_sat_field, rs)
+        bo = self._oil_formation_volume_factor(rs, t)
+
+        # Undersaturated oil: Vazquez and Beggs' compressibility (integrated from pb to p, but not
+        # from below the standard pressure), dead oil (without a bubble point) keeps the formation
+        # volume factor of the dead oil.
+        compression_start = np.maximum(pb, _STANDARD_PRESSURE)
+        undersaturated = (p > compression_start) & (pb > 0.0)
+        compressibility_coefficient = 1e-5 * (
+            -1433.0
+            + 5.0 * self._rs_sat_field
+            + 17.2 * t
+            - 1180.0 * self._gas_gravity
+            + 12.61 * self._api
+        )
+        bo = np.where(
+            undersaturated,
+            bo * (compression_start / p) ** compressibility_coefficient,
+            bo,
+        )
+
+        rs_si = rs / _SCF_PER_STB_PER_SM3_PER_SM3
+        oil_density = (self.oil_density_std + rs_si * self.gas_density_std) / bo
+
+        z = self._gas_compressibility_factor(p, t)
+        gas_molecular_weight = _AIR_MOLECULAR_WEIGHT * self._gas_gravity
+        gas_density = (
+            pressure * gas_molecular_weight * 1e-3 / (z * _GAS_CONSTANT * temperature)
+        )
+
+        oil_viscosity = self._oil_viscosity(p, t, rs, compression_start, undersaturated)
+        gas_viscosity = self._gas_viscosity(t, gas_density, gas_molecular_weight)
+
+        return {
+            SOLUTION_GAS_OIL_RATIO: rs_si,
+            BUBBLE_POINT_PRESSURE: pb * _PA_PER_PSI,
+            OIL_FORMATION_VOLUME_FACTOR: bo,
+            GAS_COMPRESSIBILITY_FACTOR: z,
+            OIL_DENSITY: oil_density,
+            GAS_DENSITY: gas_density,
+            OIL_VISCOSITY: oil_viscosity * 1e-3,
+            GAS_VISCOSITY: gas_viscosity * 1e-3,
+        }
+
+    def create_table(
+        self, pressure_values, temperature_values
+    ) -> case_description.PvtModelTableParametersDescription:
+        """
+        Create a PVT table with the properties evaluated on the grid of the given pressures [Pa]
+        and temperatures [K].
+        """
+        pressure_values = np.asarray(pressure_values, dtype=np.float64)
+        temperature_values = np.asarray(temperature_values, dtype=np.float64)
+        pressure, temperature = np.meshgrid(
+            pressure_values, temperature_values, indexing="ij"
+        )
+        properties = self.evaluate(pressure, temperature)
+
+        from barril.units import Scalar
+
+        return case_description.PvtModelTableParametersDescription(
+            pressure_values=pressure_values,
+            temperature_values=temperature_values,
+            table_variables=list(
+                np.stack([properties[name].ravel() for name in BLACK_OIL_PROPERTIES])
+            ),
+            variable_names=list(BLACK_OIL_PROPERTIES),
+            oil_density_std=Scalar(self.oil_density_std, "kg/m3"),
+            gas_density_std=Scalar(self.gas_density_std, "kg/m3"),
+            gas_oil_ratio=Scalar(self.rs_sat, "sm3/sm3"),
+            pressure_std=Scalar(14.696, "psi"),
+            temperature_std=Scalar(60.0, "degF"),
+            number_of_phases=2,
+        )
+
+    def _bubble_point_pressure(self, t: np.ndarray) -> np.ndarray:
+        rs = self._rs_sat_field
+        gg = self._gas_gravity
+        api = self._api
+        package = self.package
+
+        if rs <= 0.0:
+            # Dead oil.
+            return np.zeros_like(t)
+        if package == constants.CorrelationPackage.Standing:
+            return 18.2 * (
+                (rs / gg) ** 0.83 * 10.0 ** (0.00091 * t - 0.0125 * api) - 1.4
+            )
+        if package == constants.CorrelationPackage.VazquezBeggs:
+            c1, c2, c3 = _vazquez_beggs_coefficients(api)
+            return (rs / (c1 * gg * np.exp(c3 * api / (t + 460.0)))) ** (1.0 / c2)
+        if package == constants.CorrelationPackage.Glaso:
+            log_x = np.log10((rs / gg) ** 0.816 * t ** 0.172 / api ** 0.989)
+            return 10.0 ** (1.7669 + 1.7447 * log_x - 0.30218 * log_x ** 2)
+        if package == constants.CorrelationPackage.Lasater:
+            pf = self._lasater_pressure_factor(self._lasater_gas_mole_fraction(rs))
+            return pf * (t + 460.0) / gg
+        raise ValueError(f"Unknown correlation package: {package}")
+
+    def _solution_gas_oil_ratio(self, p: np.ndarray, t: np.ndarray) -> np.ndarray:
+        gg = self._gas_gravity
+        api = self._api
+        package = self.package
+
+        if package == constants.CorrelationPackage.Standing:
+            x = (p / 18.2 + 1.4) * 10.0 ** (0.0125 * api - 0.00091 * t)
+            return gg * x ** (1.0 / 0.83)
+        if package == constants.CorrelationPackage.VazquezBeggs:
+            c1, c2, c3 = _vazquez_beggs_coefficients(api)
+            return c1 * gg * p ** c2 * np.exp(c3 * api / (t + 460.0))
+        if package == constants.CorrelationPackage.Glaso:
+            # Glaso's correlation is only defined below ~19000 psia.
+            log_p = np.log10(np.clip(p, 1.0, 10.0 ** (14.1811 / 3.3093)))
+            x = 10.0 ** (2.8869 - np.sqrt(14.1811 - 3.3093 * log_p))
+            return gg * (x * api ** 0.989 / t ** 0.172) ** 1.2255
+        if package == constants.CorrelationPackage.Lasater:
+            pf = p * gg / (t + 460.0)
+            yg = np.where(
+                pf <= self._lasater_pressure_factor(0.6),
+                np.log(np.maximum(pf + 0.323, 0.679) / 0.679) / 2.786,
+                ((np.maximum(pf, 1.95) - 1.95) / 8.26) ** (1.0 / 3.56),
+            )
+            yg = np.minimum(yg, 0.999)
+            return (
+                132755.0
+                * self._oil_gravity
+                * yg
+                / (self._lasater_oil_molecular_weight() * (1.0 - yg))
+            )
+        raise ValueError(f"Unknown correlation package: {package}")
+
+    def _oil_formation_volume_factor(self, rs: np.ndarray, t: np.ndarray) -> np.ndarray:
+        gg = self._gas_gravity
+        go = self._oil_gravity
+        api = self._api
+        package = self.package
+
+        if package == constants.CorrelationPackage.VazquezBeggs:
+            if api <= 30:
+                c1, c2, c3 = 4.677e-4, 1.751e-5, -1.811e-8
+            else:
+                c1, c2, c3 = 4.670e-4, 1.100e-5, 1.337e-9
+            return 1.0 + c1 * rs + (t - 60.0) * (api / gg) * (c2 + c3 * rs)
+        if package == constants.CorrelationPackage.Glaso:
+            bob = rs * (gg / go) ** 0.526 + 0.968 * t
+            log_bob = np.log10(np.maximum(bob, 1e-12))
+            return 1.0 + 10.0 ** (-6.58511 + 2.91329 * log_bob - 0.27683 * log_bob ** 2)
+        # Standing (also used with Lasater).
+        return 0.9759 + 0.00012 * (rs * np.sqrt(gg / go) + 1.25 * t) ** 1.2
+
+    def _lasater_oil_molecular_weight(self) -> float:
+        # Cragoe's correlation.
+        return 6084.0 / (self._api - 5.9)
+
+    def _lasater_gas_mole_fraction(self, rs: float) -> float:
+        gas_moles = rs / 379.3
+        return gas_moles / (
+            gas_moles + 350.0 * self._oil_gravity / self._lasater_oil_molecular_weight()
+        )
+
+    @staticmethod
+    def _lasater_pressure_factor(yg):
+        return np.where(
+            yg <= 0.6, 0.679 * np.exp(2.786 * yg) - 0.323, 8.26 * yg ** 3.56 + 1.95
+        )
+
+    def _gas_compressibility_factor(self, p: np.ndarray, t: np.ndarray) -> np.ndarray:
+        gg = self._gas_gravity
+        pseudo_critical_temperature = 169.2 + 349.5 * gg - 74.0 * gg ** 2  # degR
+        pseudo_critical_pressure = 756.8 - 131.0 * gg - 3.6 * gg ** 2  # psia
+        ppr = p / pseudo_critical_pressure
+        tpr = (t + 460.0) / pseudo_critical_temperature
+        return _hall_yarborough_compressibility_factor(ppr, tpr)
+
+    def _oil_viscosity(
+        self,
+        p: np.ndarray,
+        t: np.ndarray,
+        rs: np.ndarray,
+        compression_start: np.ndarray,
+        undersaturated: np.ndarray,
+    ) -> np.ndarray:
+        x = np.maximum(t, 1.0) ** -1.163 * np.exp(6.9824 - 0.04658 * self._api)
+        dead_oil_viscosity = 10.0 ** x - 1.0
+        a = 10.715 * (rs + 100.0) ** -0.515
+        b = 5.44 * (rs + 150.0) ** -0.338
+        viscosity = a * dead_oil_viscosity ** b
+
+        m = 2.6 * p ** 1.187 * np.exp(-11.513 - 8.98e-5 * p)
+        return np.where(
+            undersaturated, viscosity * (p / compression_start) ** m, viscosity
+        )
+
+    @staticmethod
+    def _gas_viscosity(
+        t: np.ndarray, gas_density: np.ndarray, molecular_weight: float
+    ) -> np.ndarray:
+        t_rankine = t + 460.0
+        k = (
+            (9.4 + 0.02 * molecular_weight)
+            * t_rankine ** 1.5
+            / (209.0 + 19.0 * molecular_weight + t_rankine)
+        )
+        x = 3.5 + 986.0 / t_rankine + 0.01 * molecular_weight
+        y = 2.4 - 0.2 * x
+        return 1e-4 * k * np.exp(x * (gas_density * 1e-3) ** y)
@@ -0,0 +1,318 @@
+"""
+Support for PVT table files (``.tab``), which can declare several PVT models, each one starting
+with a ``PVTTABLE LABEL = "<name>", ...`` header followed by the values of the table.
+
+Only the keyword based format is supported: a header with ``KEY = value [unit]`` items, the
+``COLUMNS`` of the table and one ``PVTTABLE POINT = (...)`` line for each pressure and temperature.
+"""
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import attr
+import numpy as np
+
+from alfasim_sdk._internal.alfacase import case_description
+
+_LABEL_LINE_RE = re.compile(rb"PVTTABLE LABEL[^\r\n]*")
+_LABEL_RE = re.compile(rb"LABEL\s+=\s+([^,\r\n]+)")
+_HEADER_ITEM_RE = re.compile(
+    r"""(\w+)\s*=\s*(\([^)]*\)|"[^"]*"|'[^']*'|[^,\s]+)[ \t]*([^,]*?)\s*(?:,|$)"""
+)
+_LABEL_LINE_PREFIX = b"PVTTABLE LABEL"
+_POINT_LINE_PREFIX = b"PVTTABLE POINT"
+
+# Number of `PVTTABLE POINT` lines converted to numbers at once.
+_POINTS_CHUNK_SIZE = 4096
+
+# Units used on ``.tab`` files which have a different name on barril.
+_TAB_UNITS = {
+    "c": "degC",
+    "f": "degF",
+    "k": "K",
+    "pa": "Pa",
+    "atm": "atm",
+    "bara": "bar",
+    "sm3/sm3": "sm3/sm3",
+}
+
+# Standard properties of `PvtModelTableParametersDescription` (with the unit used on the
+# description) for each keyword of the header.
+_STD_PROPERTIES = {
+    "STDPRESSURE": ("pressure_std", "bar"),
+    "STDTEMPERATURE": ("temperature_std", "degC"),
+    "STDGASDENSITY": ("gas_density_std", "kg/m3"),
+    "STDOILDENSITY": ("oil_density_std", "kg/m3"),
+    "STDWATDENSITY": ("water_density_std", "kg/m3"),
+    "GOR": ("gas_oil_ratio", "sm3/sm3"),
+    "GLR": ("gas_liquid_ratio", "sm3/sm3"),
+    "WC": ("water_cut", "-"),
+    "TOTWATERFRACTION": ("total_water_fraction", "-"),
+}
+_NUMBER_OF_PHASES = {"TWO": 2, "THREE": 3}
+
+
+@attr.s(frozen=True)
+class PvtTabFileIndex:
+    """
+    The PVT models declared on a ``.tab`` file.
+
+    :ivar labels:
+        The label of each PVT model, with the position (in bytes) of the line with its header.
+    """
+
+    labels: Dict[str, int] = attr.ib()
+
+
+# Indexes already scanned, by the absolute path of the file (with its modification time and size).
+_INDEXES: Dict[Path, Tuple[Tuple[int, int], PvtTabFileIndex]] = {}
+
+
+def scan_pvt_tab_file(file_path: Path) -> PvtTabFileIndex:
+    """
+    Scan the given ``.tab`` file for the headers of the PVT models.
+
+    The file is memory-mapped and searched for the headers directly, so the values of the
+    tables (most of the file) are skipped without being parsed.
+    """
+    labels = {}
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return PvtTabFileIndex(labels)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for line_match in _LABEL_LINE_RE.finditer(content):
+                match = _LABEL_RE.search(line_match.group())
+                if match is None:
+                    continue
+                label = match.group(1).decode("UTF-8", errors="replace")
+                label = label.replace('"', "").replace("'", "")
+                line_start = content.rfind(b"\n", 0, line_match.start()) + 1
+                labels.setdefault(label, line_start)
+    return PvtTabFileIndex(labels)
+
+
+def get_pvt_tab_file_index(file_path: Path) -> PvtTabFileIndex:
+    """
+    Return the index of the given ``.tab`` file, which is only scanned again when the file changes
+    (its modification time or size).
+    """
+    file_path = Path(file_path).absolute()
+    stat = file_path.stat()
+    file_state = (stat.st_mtime_ns, stat.st_size)
+    cached = _INDEXES.get(file_path)
+    if cached is not None and cached[0] == file_state:
+        return cached[1]
+
+    index = scan_pvt_tab_file(file_path)
+    _INDEXES[file_path] = (file_state, index)
+    return index
+
+
+def read_pvt_tab_file(
+    file_path: Path, model_names: Optional[Iterable[str]] = None
+) -> Dict[str, case_description.PvtModelTableParametersDescription]:
+    """
+    Read the PVT models with the given names (all models by default) from a ``.tab`` file.
+
+    The headers are found with `get_pvt_tab_file_index`, so only the selected models are read,
+    each one in a single pass with the values converted directly into numpy arrays.
+
+    :raises ValueError:
+        If a model is not declared on the file or its content is not valid.
+    """
+    file_path = Path(file_path)
+    labels = get_pvt_tab_file_index(file_path).labels
+    model_names = list(labels) if model_names is None else list(model_names)
+    for model_name in model_names:
+        if model_name not in labels:
+            raise ValueError(
+                f"'{model_name}' could not be found on '{file_path.name}', available models are: '{', '.join(sorted(labels))}'"
+            )
+
+    tables = {}
+    with open(file_path, "rb") as file:
+        # Following the order of the file, so it is read sequentially.
+        for model_name in sorted(set(model_names), key=labels.__getitem__):
+            tables[model_name] = _read_pvt_table(file, labels[model_name], file_path)
+    return {model_name: tables[model_name] for model_name in model_names}
+
+
+def load_pvt_model_table_parameters_description_from_tab(
+    value: Union[str, Path]
+) -> case_description.PvtModelTableParametersDescription:
+    """
+    Read a PVT model from a ``.tab`` file, given as used on `PvtModelsDescription.tables`:
+    the path of the file with the name of the model (``"<file>|<model name>"``), or only the path
+    for files with a single model.
+    """
+    (
+        file_path,
+        model_name,
+    ) = case_description.PvtModelsDescription.get_pvt_file_and_model_name(value)
+    if model_name is None:
+        labels = get_pvt_tab_file_index(file_path).labels
+        if len(labels) != 1:
+            raise ValueError(
+                f"'{file_path.name}' declares {len(labels)} PVT models, select one of them using '<file>|<model name>'"
+            )
+        (model_name,) = labels
+    return read_pvt_tab_file(file_path, [model_name])[model_name]
+
+
+def _read_pvt_table(
+    file: BinaryIO, offset: int, file_path: Path
+) -> case_description.PvtModelTableParametersDescription:
+    """
+    Read the PVT model which header starts at the given offset.
+    """
+    file.seek(offset)
+    lines = iter(file)
+
+    header_lines = [next(lines)]
+    point_line = None
+    for line in lines:
+        line = line.strip()
+        if line.startswith(_POINT_LINE_PREFIX):
+            point_line = line
+            break
+        if line.startswith(_LABEL_LINE_PREFIX):
+            break
+        if line and not line.startswith(b"!"):
+            header_lines.append(line)
+
+    header = _parse_header(header_lines)
+    label = header["LABEL"][0].strip("\"'")
+
+    def error(message: str) -> ValueError:
+        return ValueError(
+            f"Invalid PVT model '{label}' on '{file_path.name}': {message}"
+        )
+
+    for key in ("PRESSURE", "TEMPERATURE", "COLUMNS"):
+        if key not in header:
+            raise error(f"missing {key}")
+    pressure_values = _convert_values(
+        _parse_values(header["PRESSURE"][0]), header["PRESSURE"][1] or "Pa", "Pa"
+    )
+    temperature_values = _convert_values(
+        _parse_values(header["TEMPERATURE"][0]), header["TEMPERATURE"][1] or "C", "K"
+    )
+    columns = [i.strip() for i in header["COLUMNS"][0].strip("()").split(",")]
+
+    points_count = len(pressure_values) * len(temperature_values)
+    points = np.empty((points_count, len(columns)))
+    chunk: List[bytes] = []
+    read_count = 0
+
+    def flush_chunk() -> None:
+        nonlocal read_count
+        values = np.fromstring(b",".join(chunk).decode("ASCII"), sep=",")
+        if len(values) != len(chunk) * len(columns):
+            raise error(
+                f"expected {len(columns)} values on each point, got {len(values)} values on {len(chunk)} points"
+            )
+        if read_count + len(chunk) > points_count:
+            raise error(f"expected {points_count} points, got more")
+        points[read_count : read_count + len(chunk)] = values.reshape(-1, len(columns))
+        read_count += len(chunk)
+        chunk.clear()
+
+    while point_line is not None:
+        while point_line.endswith(b"\\"):
+            point_line = point_line[:-1] + next(lines, b"").strip()
+        chunk.append(point_line[point_line.index(b"(") + 1 : point_line.rindex(b")")])
+        if len(chunk) == _POINTS_CHUNK_SIZE:
+            flush_chunk()
+
+        point_line = None
+        for line in lines:
+            line = line.strip()
+            if line.startswith(_POINT_LINE_PREFIX):
+                point_line = line
+                break
+            if line.startswith(_LABEL_LINE_PREFIX):
+                break
+            if line and not line.startswith(b"!"):
+                raise error(f"unexpected content {line.decode('UTF-8', 'replace')!r}")
+    if chunk:
+        flush_chunk()
+    if read_count != points_count:
+        raise error(f"expected {points_count} points, got {read_count}")
+
+    if "PT" in columns and "TM" in columns:
+        # The values of each variable must be ordered by pressure and then by temperature.
+        order = np.lexsort(
+            (points[:, columns.index("TM")], points[:, columns.index("PT")])
+        )
+        if (order != np.arange(points_count)).any():
+            points = points[order]
+    variable_columns = [i for i, name in enumerate(columns) if name not in ("PT", "TM")]
+    table = np.ascontiguousarray(points[:, variable_columns].T)
+
+    # Properties not declared on the file are set to `nan` (see `PvtModelTableParametersDescription`).
+    std_properties = {name: None for name, _ in _STD_PROPERTIES.values()}
+    for key, (name, unit) in _STD_PROPERTIES.items():
+        if key in header:
+            value, tab_unit = header[key]
+            converted = _convert_values(_parse_values(value), tab_unit or unit, unit)
+            std_properties[name] = _to_scalar(converted[0], unit)
+
+    return case_description.PvtModelTableParametersDescription(
+        pressure_values=pressure_values,
+        temperature_values=temperature_values,
+        table_variables=list(table),
+        variable_names=[columns[i] for i in variable_columns],
+        label=label,
+        number_of_phases=_NUMBER_OF_PHASES.get(
+            header.get("PHASE", ("",))[0].upper(), 2
+        ),
+        **std_properties,
+    )
+
+
+def _parse_header(lines: List[bytes]) -> Dict[str, Tuple[str, str]]:
+    """
+    Return the value and unit for each ``KEY = value [unit]`` item of the header.
+    """
+    text = " ".join(
+        line.decode("UTF-8", errors="replace").strip().rstrip("\\") for line in lines
+    )
+    return {
+        match.group(1).upper(): (match.group(2), match.group(3))
+        for match in _HEADER_ITEM_RE.finditer(text)
+    }
+
+
+def _parse_values(value: str) -> np.ndarray:
+    return np.fromstring(value.strip("()"), sep=",")
+
+
+def _convert_values(values: np.ndarray, from_unit: str, to_unit: str) -> np.ndarray:
+    from barril.units import UnitDatabase
+
+    from_unit = _TAB_UNITS.get(from_unit.lower(), from_unit)
+    if from_unit == to_unit or to_unit == "-":
+        return values
+    return UnitDatabase.GetSingleton().Convert(
+        _get_category(to_unit), from_unit, to_unit, values
+    )
+
+
+def _get_category(unit: str) -> str:
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import get_category_for
+
+    return get_category_for(unit)
+
+
+def _to_scalar(value: float, unit: str):
+    from barril.units import Scalar
+
+    return Scalar(_get_category(unit), float(value), unit)
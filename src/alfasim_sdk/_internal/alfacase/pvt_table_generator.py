@@ -0,0 +1,168 @@
+"""
+Generation of synthetic PVT tables of any size, used to measure the performance of the code
+handling `PvtModelTableParametersDescription` (loaders, exporters and interpolators) with tables
+as big as the ones used in production.
+"""
+from pathlib import Path
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from alfasim_sdk._internal.alfacase import case_description
+
+# Variables of the tables (the same ones from `PvtModelTableParametersDescription.create_constant`)
+# with the value at the lowest pressure and temperature, and the relative change of the value
+# from the lowest to the highest pressure and from the lowest to the highest temperature.
+_OIL_AND_GAS_VARIABLES = [
+    ("gas density", 1.0, 150.0, -0.5),
+    ("gas density derivative pressure", 1e-5, 0.5, -0.5),
+    ("gas density derivative temperature", -1e-2, 150.0, -0.8),
+    ("oil density", 850.0, 0.05, -0.15),
+    ("oil density derivative pressure", 1e-6, -0.3, 0.5),
+    ("oil density derivative temperature", -0.7, 0.2, 0.3),
+    ("gas viscosity", 1e-5, 2.0, 0.5),
+    ("oil viscosity", 5e-2, 0.5, -0.9),
+    ("gas-oil surface tension", 3e-2, -0.9, -0.5),
+    ("gas mass fraction", 0.5, -0.9, 0.5),
+    ("gas specific heat", 2000.0, 0.5, 0.3),
+    ("oil specific heat", 1900.0, 0.05, 0.4),
+    ("gas specific enthalpy", 5e5, -0.2, 1.5),
+    ("oil specific enthalpy", 1e5, 0.1, 4.0),
+    ("gas thermal conductivity", 2.5e-2, 1.0, 0.6),
+    ("oil thermal conductivity", 0.13, 0.1, -0.2),
+]
+_WATER_VARIABLES = [
+    ("water density", 1000.0, 0.03, -0.08),
+    ("water density derivative pressure", 4.5e-7, -0.2, 0.3),
+    ("water density derivative temperature", -0.3, 0.2, 1.5),
+    ("water viscosity", 1e-3, 0.05, -0.8),
+    ("water mass fraction", 0.01, -0.5, 5.0),
+    ("water specific heat", 4180.0, -0.02, 0.05),
+    ("water specific enthalpy", 1e5, 0.1, 6.0),
+    ("water thermal conductivity", 0.6, 0.05, 0.15),
+    ("gas_water_surface_tension", 7e-2, -0.5, -0.3),
+    ("oil_water_surface_tension", 3e-2, -0.1, -0.3),
+]
+
+
+def generate_pvt_table(
+    pressure_count: int = 500,
+    temperature_count: int = 500,
+    variable_count: Optional[int] = None,
+    *,
+    has_water: bool = False,
+    seed: int = 0,
+    pressure_range: Tuple[float, float] = (1e5, 1e8),
+    temperature_range: Tuple[float, float] = (250.0, 500.0),
+    uniform_grid: bool = True,
+) -> case_description.PvtModelTableParametersDescription:
+    """
+    Create a synthetic PVT table, with values which change monotonically with the pressure and
+    temperature (at different rates, randomly chosen for each variable).
+
+    The same arguments (including the ``seed``) always create the same table.
+
+    :param variable_count:
+        The number of variables of the table, by default the variables from `create_constant`
+        (which are used first, additional variables are named ``"synthetic variable <n>"``).
+    :param has_water:
+        Include the variables of the water phase (a three phase table).
+    :param pressure_range:
+        Minimum and maximum pressures [Pa].
+    :param temperature_range:
+        Minimum and maximum temperatures [K].
+    :param uniform_grid:
+        If the pressures and temperatures are evenly spaced, otherwise the pressures are spaced
+        geometrically (more points at low pressures) and the temperatures slightly perturbed.
+    """
+    if pressure_count < 2 or temperature_count < 2:
+        raise ValueError("A PVT table needs at least 2 pressures and 2 temperatures")
+
+    rng = np.random.default_rng(seed)
+    if uniform_grid:
+        pressure_values = np.linspace(*pressure_range, pressure_count)
+        temperature_values = np.linspace(*temperature_range, temperature_count)
+    else:
+        pressure_values = np.geomspace(*pressure_range, pressure_count)
+        temperature_values = np.linspace(*temperature_range, temperature_count)
+        temperature_step = temperature_values[1] - temperature_values[0]
+        temperature_values[1:-1] += rng.uniform(
+            -0.25 * temperature_step, 0.25 * temperature_step, temperature_count - 2
+        )
+
+    variables = list(_OIL_AND_GAS_VARIABLES)
+    if has_water:
+        variables += _WATER_VARIABLES
+    if variable_count is None:
+        variable_count = len(variables)
+    for index in range(len(variables), variable_count):
+        variables.append(
+            (
+                f"synthetic variable {index}",
+                10.0 ** rng.uniform(-6, 6),
+                rng.uniform(-0.9, 10.0),
+                rng.uniform(-0.9, 10.0),
+            )
+        )
+    variables = variables[:variable_count]
+
+    # Normalized pressures and temperatures (0 to 1), broadcast on the (P x T) grid.
+    pn = ((pressure_values - pressure_values[0]) / np.ptp(pressure_values))[:, None]
+    tn = ((temperature_values - temperature_values[0]) / np.ptp(temperature_values))[
+        None, :
+    ]
+
+    # The values of all variables in a single block (see `PvtModelTableParametersDescription.table_values`).
+    table = np.empty((variable_count, pressure_count, temperature_count))
+    for values, (_, base, pressure_change, temperature_change) in zip(table, variables):
+        # Random curvature of each axis, keeping the values monotonic.
+        pressure_shape = pn ** rng.uniform(0.3, 1.5)
+        temperature_shape = tn ** rng.uniform(0.7, 1.3)
+        np.multiply(
+            base * (1.0 + pressure_change * pressure_shape),
+            1.0 + temperature_change * temperature_shape,
+            out=values,
+        )
+
+    from barril.units import Scalar
+
+    oil_density_std = _OIL_AND_GAS_VARIABLES[3][1]
+    return case_description.PvtModelTableParametersDescription(
+        pressure_values=pressure_values,
+        temperature_values=temperature_values,
+        table_variables=list(table.reshape(variable_count, -1)),
+        variable_names=[name for name, *_ in variables],
+        pressure_std=Scalar(1e5, "Pa"),
+        temperature_std=Scalar(15, "degC"),
+        gas_density_std=Scalar(1.0, "kg/m3"),
+        oil_density_std=Scalar(oil_density_std, "kg/m3"),
+        water_density_std=Scalar(1000.0, "kg/m3"),
+        gas_oil_ratio=Scalar(100.0, "sm3/sm3"),
+        gas_liquid_ratio=Scalar(100.0, "sm3/sm3"),
+        water_cut=Scalar(0.3 if has_water else 0.0, "-"),
+        total_water_fraction=Scalar(0.1 if has_water else 0.0, "-"),
+        label=f"synthetic {pressure_count}x{temperature_count}x{variable_count}",
+        number_of_phases=3 if has_water else 2,
+    )
+
+
+def generate_pvt_table_file(
+    alfacase_file: Path,
+    alfatable_filename: str,
+    *args,
+    binary: bool = False,
+    **kwargs,
+) -> Path:
+    """
+    Create a synthetic PVT table with `generate_pvt_table` (receiving the same arguments) and write
+    it with `generate_alfatable_file`, returning the path of the ``.alfatable`` file.
+    """
+    from alfasim_sdk._internal.alfacase.alfatable import generate_alfatable_file
+
+    return generate_alfatable_file(
+        Path(alfacase_file),
+        alfatable_filename,
+        generate_pvt_table(*args, **kwargs),
+        binary=binary,
+    )
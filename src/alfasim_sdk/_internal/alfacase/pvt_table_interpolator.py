@@ -0,0 +1,251 @@
+"""
+Evaluation of the properties from PVT tables (`PvtModelTableParametersDescription`) at arbitrary
+pressures and temperatures, using bilinear interpolation.
+"""
+import warnings
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import attr
+import numpy as np
+
+from alfasim_sdk._internal.alfacase import case_description
+
+
+class PvtTableOutOfRangeWarning(UserWarning):
+    """
+    Issued when a PVT table is evaluated outside of its pressure and temperature range and the
+    table has ``warn_when_outside`` enabled.
+    """
+
+
+@attr.s(frozen=True, slots=True)
+class PvtTableGridLocation:
+    """
+    Position of a set of points on the grid of a PVT table, which can be reused to evaluate
+    several variables at the same points.
+
+    :ivar pressure_index:
+        Index of the pressure value just before each point (the cell of the grid).
+    :ivar temperature_index:
+        Index of the temperature value just before each point.
+    :ivar pressure_weight:
+        Relative position of each point inside the cell on the pressure axis, from 0 to 1.
+    :ivar temperature_weight:
+        Relative position of each point inside the cell on the temperature axis, from 0 to 1.
+    :ivar outside:
+        Which points are outside the range of the table (those are evaluated at the closest
+        boundary of the table).
+    """
+
+    pressure_index: np.ndarray = attr.ib()
+    temperature_index: np.ndarray = attr.ib()
+    pressure_weight: np.ndarray = attr.ib()
+    temperature_weight: np.ndarray = attr.ib()
+    outside: np.ndarray = attr.ib()
+
+
+class _GridAxis:
+    """
+    One axis of the grid, computing the cell of each value directly when the values are evenly
+    spaced (usual for generated tables) or with a binary search otherwise.
+    """
+
+    def __init__(self, values: np.ndarray, name: str) -> None:
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if values.ndim != 1 or len(values) == 0:
+            raise ValueError(f"The {name} values of a PVT table can't be empty")
+        steps = np.diff(values)
+        if not (steps > 0).all():
+            raise ValueError(f"The {name} values of a PVT table must be sorted")
+
+        self.values = values
+        self.lower = values[0]
+        self.upper = values[-1]
+        self.step: Optional[float] = None
+        if len(steps) > 0 and np.allclose(steps, steps[0], rtol=1e-9, atol=0.0):
+            self.step = (self.upper - self.lower) / len(steps)
+
+    def locate(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the index of the cell, the weight inside the cell and if each value is outside the axis.
+        """
+        outside = (x < self.lower) | (x > self.upper)
+        last_cell = max(len(self.values) - 2, 0)
+        clipped = np.clip(x, self.lower, self.upper)
+        if len(self.values) == 1:
+            return (
+                np.zeros(x.shape, dtype=np.intp),
+                np.zeros(x.shape, dtype=np.float64),
+                outside,
+            )
+
+        if self.step is not None:
+            position = (clipped - self.lower) / self.step
+            index = np.clip(np.floor(position), 0, last_cell)
+            weight = position - index
+            index = index.astype(np.intp)
+        else:
+            index = np.searchsorted(self.values, clipped, side="right") - 1
+            index = np.clip(index, 0, last_cell)
+            lower = self.values[index]
+            weight = (clipped - lower) / (self.values[index + 1] - lower)
+        return index, weight, outside
+
+
+class PvtTableInterpolator:
+    """
+    Evaluate the variables of a PVT table at arbitrary pressures and temperatures using
+    bilinear interpolation on the grid of the table.
+
+    The table variables are used as a single ``(variables, pressures, temperatures)`` array, so
+    evaluating any number of variables on any number of points is done with a few numpy operations.
+
+    Pressures are given in ``Pa`` and temperatures in ``K`` (the units of the table values). Points
+    outside the range of the table are evaluated at the closest boundary of the table, and are
+    reported with a `PvtTableOutOfRangeWarning` when ``warn_when_outside`` is enabled on the table.
+    """
+
+    def __init__(
+        self, description: case_description.PvtModelTableParametersDescription
+    ) -> None:
+        self._pressure_axis = _GridAxis(description.pressure_values, "pressure")
+        self._temperature_axis = _GridAxis(
+            description.temperature_values, "temperature"
+        )
+        if len(description.variable_names) != len(description.table_variables):
+            raise ValueError(
+                f"The PVT table has {len(description.table_variables)} variables but {len(description.variable_names)} names"
+            )
+
+        self._variable_indexes = {
+            name: index for index, name in enumerate(description.variable_names)
+        }
+        self._table = np.ascontiguousarray(description.table_values, dtype=np.float64)
+
+        self.label = description.label
+        self.warn_when_outside = description.warn_when_outside
+
+    @property
+    def variable_names(self) -> Tuple[str, ...]:
+        return tuple(self._variable_indexes)
+
+    @property
+    def pressure_range(self) -> Tuple[float, float]:
+        """
+        Minimum and maximum pressure of the table [Pa].
+        """
+        return self._pressure_axis.lower, self._pressure_axis.upper
+
+    @property
+    def temperature_range(self) -> Tuple[float, float]:
+        """
+        Minimum and maximum temperature of the table [K].
+        """
+        return self._temperature_axis.lower, self._temperature_axis.upper
+
+    def locate(self, pressure, temperature) -> PvtTableGridLocation:
+        """
+        Find the position of the given points on the grid of the table.
+
+        ``pressure`` and ``temperature`` can be scalars or arrays (broadcast against each other).
+        """
+        pressure, temperature = np.broadcast_arrays(
+            np.asarray(pressure, dtype=np.float64),
+            np.asarray(temperature, dtype=np.float64),
+        )
+        pressure_index, pressure_weight, pressure_outside = self._pressure_axis.locate(
+            pressure
+        )
+        (
+            temperature_index,
+            temperature_weight,
+            temperature_outside,
+        ) = self._temperature_axis.locate(temperature)
+        return PvtTableGridLocation(
+            pressure_index=pressure_index,
+            temperature_index=temperature_index,
+            pressure_weight=pressure_weight,
+            temperature_weight=temperature_weight,
+            outside=pressure_outside | temperature_outside,
+        )
+
+    def is_outside(self, pressure, temperature) -> np.ndarray:
+        """
+        Return which of the given points are outside the range of the table.
+        """
+        return self.locate(pressure, temperature).outside
+
+    def evaluate(
+        self,
+        pressure,
+        temperature,
+        variable_names: Optional[Sequence[str]] = None,
+        *,
+        location: Optional[PvtTableGridLocation] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Evaluate the given variables (all variables by default) at the given points.
+
+        :param location:
+            The result of `locate` for the same points, to avoid searching the grid again.
+        :return:
+            The values of each variable, with the (broadcast) shape of the given points.
+        """
+        if variable_names is None:
+            variable_names = self.variable_names
+        elif isinstance(variable_names, str):
+            raise TypeError("variable_names must be a sequence of names, not a str")
+        indexes = [self._get_variable_index(name) for name in variable_names]
+
+        if location is None:
+            location = self.locate(pressure, temperature)
+        self._check_outside(location.outside)
+
+        p0 = location.pressure_index
+        t0 = location.temperature_index
+        p1 = np.minimum(p0 + 1, self._table.shape[1] - 1)
+        t1 = np.minimum(t0 + 1, self._table.shape[2] - 1)
+        wp = location.pressure_weight
+        wt = location.temperature_weight
+
+        table = self._table[indexes]
+        values = (
+            table[:, p0, t0] * ((1.0 - wp) * (1.0 - wt))
+            + table[:, p0, t1] * ((1.0 - wp) * wt)
+            + table[:, p1, t0] * (wp * (1.0 - wt))
+            + table[:, p1, t1] * (wp * wt)
+        )
+        return dict(zip(variable_names, values))
+
+    def evaluate_variable(
+        self, variable_name: str, pressure, temperature
+    ) -> np.ndarray:
+        """
+        Evaluate a single variable at the given points.
+        """
+        return self.evaluate(pressure, temperature, [variable_name])[variable_name]
+
+    def _get_variable_index(self, name: str) -> int:
+        try:
+            return self._variable_indexes[name]
+        except KeyError:
+            raise ValueError(
+                f"The PVT table has no variable {name!r}, expected one of: {', '.join(self.variable_names)}"
+            )
+
+    def _check_outside(self, outside: np.ndarray) -> None:
+        if not self.warn_when_outside:
+            return
+        outside_count = np.count_nonzero(outside)
+        if outside_count:
+            table = f"PVT table {self.label!r}" if self.label else "PVT table"
+            warnings.warn(
+                PvtTableOutOfRangeWarning(
+                    f"{outside_count} of {outside.size} points are outside the range of the {table}"
+                    f" (pressure: {self.pressure_range} Pa, temperature: {self.temperature_range} K)"
+                ),
+                stacklevel=3,
+            )
@@ -0,0 +1,270 @@
+"""
+Reduction of the grid of PVT tables (`PvtModelTableParametersDescription`), removing the
+pressures and temperatures which can be obtained by interpolation of the remaining ones.
+"""
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+import attr
+import numpy as np
+
+from alfasim_sdk._internal.alfacase import case_description
+
+# Values are compared relative to their magnitude, but not less than this fraction of the maximum
+# magnitude of the variable (so values close to zero don't require an exact match).
+_RELATIVE_ERROR_FLOOR = 1e-6
+
+# Relative errors below this are considered rounding errors (a tolerance of zero keeps the values).
+_ROUNDING_TOLERANCE = 1e-12
+
+# Relative error of rounding values to float32.
+_FLOAT32_ROUNDING_ERROR = 2.0 ** -24
+
+# How many times the points are selected again (with a tighter tolerance) when the combined error
+# of both axes is above the tolerance, before keeping the whole grid.
+_MAX_SELECTION_ATTEMPTS = 4
+
+
+@attr.s(frozen=True)
+class PvtTableResamplingReport:
+    """
+    Result of `resample_pvt_table`.
+
+    :ivar original_shape:
+        Number of pressures and temperatures of the original table.
+    :ivar resampled_shape:
+        Number of pressures and temperatures of the resampled table.
+    :ivar tolerances:
+        The relative tolerance of each variable.
+    :ivar max_relative_errors:
+        The maximum relative error of each variable, evaluating the resampled table (with bilinear
+        interpolation) on all points of the original grid.
+    """
+
+    original_shape: Tuple[int, int] = attr.ib()
+    resampled_shape: Tuple[int, int] = attr.ib()
+    tolerances: Dict[str, float] = attr.ib()
+    max_relative_errors: Dict[str, float] = attr.ib()
+
+    @property
+    def compression_ratio(self) -> float:
+        """
+        Number of points of the original grid for each point of the resampled grid.
+        """
+        return np.prod(self.original_shape) / np.prod(self.resampled_shape)
+
+    @property
+    def within_tolerance(self) -> bool:
+        return all(
+            self.max_relative_errors[name] <= max(tolerance, _ROUNDING_TOLERANCE)
+            for name, tolerance in self.tolerances.items()
+        )
+
+
+def resample_pvt_table(
+    description: case_description.PvtModelTableParametersDescription,
+    relative_tolerance: Union[float, Dict[str, float]] = 1e-3,
+    *,
+    float32: bool = False,
+) -> Tuple[
+    case_description.PvtModelTableParametersDescription, PvtTableResamplingReport
+]:
+    """
+    Create a copy of the given table on a reduced (usually non-uniform) grid, keeping only the
+    pressures and temperatures needed to obtain all values of the original table within the given
+    tolerance by bilinear interpolation.
+
+    The points are selected greedily along each axis (keeping the longest intervals where linear
+    interpolation is within the tolerance), and the result is checked on the whole original grid.
+
+    :param relative_tolerance:
+        The maximum relative error, for all variables or for each variable by name (variables
+        without a tolerance are kept, except for rounding errors).
+    :param float32:
+        Store the values of the variables as float32 (the rounding error is considered as part of
+        the tolerance). The pressures and temperatures are always float64.
+    :return:
+        The resampled table and a report with the errors of each variable.
+    """
+    table = np.asarray(description.table_values, dtype=np.float64)
+    names = list(description.variable_names)
+    if isinstance(relative_tolerance, dict):
+        unknown_names = set(relative_tolerance) - set(names)
+        if unknown_names:
+            raise ValueError(
+                f"The PVT table has no variables named: {', '.join(sorted(unknown_names))}"
+            )
+        tolerances = {name: float(relative_tolerance.get(name, 0.0)) for name in names}
+    else:
+        tolerances = dict.fromkeys(names, float(relative_tolerance))
+    if any(tolerance < 0.0 for tolerance in tolerances.values()):
+        raise ValueError("The tolerances must be positive")
+
+    pressure_values = np.asarray(description.pressure_values, dtype=np.float64)
+    temperature_values = np.asarray(description.temperature_values, dtype=np.float64)
+    tolerance = np.maximum(
+        np.array(list(tolerances.values())), _ROUNDING_TOLERANCE
+    ).reshape(-1, 1, 1)
+    scale = _get_error_scale(table)
+
+    # The error of the resampled table is (about) the sum of the error of each axis.
+    rounding_error = _FLOAT32_ROUNDING_ERROR if float32 else 0.0
+    axis_tolerance = np.maximum(tolerance - 2.0 * rounding_error, 0.0) / 2.0
+    axis_tolerance = np.maximum(axis_tolerance, _ROUNDING_TOLERANCE / 4.0)
+    for _ in range(_MAX_SELECTION_ATTEMPTS):
+        pressure_indexes = _select_axis_points(
+            pressure_values, table, axis_tolerance * scale
+        )
+        reduced_table = table[:, pressure_indexes]
+        temperature_indexes = _select_axis_points(
+            temperature_values,
+            reduced_table.transpose(0, 2, 1),
+            (axis_tolerance * scale[:, pressure_indexes]).transpose(0, 2, 1),
+        )
+        resampled = _create_resampled_table(
+            description,
+            pressure_indexes,
+            temperature_indexes,
+            reduced_table[:, :, temperature_indexes],
+            float32,
+        )
+        errors = _get_relative_errors(
+            resampled, pressure_values, temperature_values, table, scale
+        )
+        if (errors <= tolerance.ravel()).all():
+            break
+        axis_tolerance /= 4.0
+    else:
+        resampled = _create_resampled_table(
+            description,
+            np.arange(len(pressure_values)),
+            np.arange(len(temperature_values)),
+            table,
+            float32,
+        )
+        errors = _get_relative_errors(
+            resampled, pressure_values, temperature_values, table, scale
+        )
+
+    report = PvtTableResamplingReport(
+        original_shape=(len(pressure_values), len(temperature_values)),
+        resampled_shape=(
+            len(resampled.pressure_values),
+            len(resampled.temperature_values),
+        ),
+        tolerances=tolerances,
+        max_relative_errors=dict(zip(names, errors.tolist())),
+    )
+    return resampled, report
+
+
+def _get_error_scale(table: np.ndarray) -> np.ndarray:
+    magnitude = np.abs(table)
+    floor = _RELATIVE_ERROR_FLOOR * magnitude.max(axis=(1, 2), keepdims=True)
+    return np.maximum(magnitude, np.maximum(floor, np.finfo(np.float64).tiny))
+
+
+def _select_axis_points(
+    axis_values: np.ndarray, values: np.ndarray, max_error: np.ndarray
+) -> np.ndarray:
+    """
+    Select the points of the axis (the second dimension of `values`) to keep, so the values of
+    the removed points are obtained by linear interpolation within `max_error`.
+    """
+    count = len(axis_values)
+    if count <= 2:
+        return np.arange(count)
+
+    def is_valid_interval(start: int, end: int) -> bool:
+        x = axis_values[start : end + 1]
+        weight = ((x - x[0]) / (x[-1] - x[0]))[None, :, None]
+        interpolated = values[:, start : start + 1] * (1.0 - weight)
+        interpolated += values[:, end : end + 1] * weight
+        error = np.abs(interpolated - values[:, start : end + 1])
+        return bool((error <= max_error[:, start : end + 1]).all())
+
+    indexes = [0]
+    start = 0
+    while start < count - 1:
+        # Grow the interval exponentially until it is not valid, then find the longest valid
+        # interval with a binary search.
+        valid = start + 1
+        step = 1
+        invalid = None
+        while valid < count - 1:
+            end = min(start + 2 * step, count - 1)
+            if not is_valid_interval(start, end):
+                invalid = end
+                break
+            valid = end
+            step *= 2
+        if invalid is not None:
+            while invalid - valid > 1:
+                middle = (valid + invalid) // 2
+                if is_valid_interval(start, middle):
+                    valid = middle
+                else:
+                    invalid = middle
+        indexes.append(valid)
+        start = valid
+    return np.array(indexes)
+
+
+def _create_resampled_table(
+    description: case_description.PvtModelTableParametersDescription,
+    pressure_indexes: np.ndarray,
+    temperature_indexes: np.ndarray,
+    table: np.ndarray,
+    float32: bool,
+) -> case_description.PvtModelTableParametersDescription:
+    table = np.ascontiguousarray(table, dtype=np.float32 if float32 else np.float64)
+    return attr.evolve(
+        description,
+        pressure_values=np.asarray(description.pressure_values, dtype=np.float64)[
+            pressure_indexes
+        ],
+        temperature_values=np.asarray(description.temperature_values, dtype=np.float64)[
+            temperature_indexes
+        ],
+        table_variables=list(table.reshape(len(table), -1)),
+    )
+
+
+def _get_relative_errors(
+    resampled: case_description.PvtModelTableParametersDescription,
+    pressure_values: np.ndarray,
+    temperature_values: np.ndarray,
+    table: np.ndarray,
+    scale: np.ndarray,
+) -> np.ndarray:
+    """
+    The maximum relative error of each variable of the resampled table, on the original grid.
+    """
+    from alfasim_sdk._internal.alfacase.pvt_table_interpolator import (
+        PvtTableInterpolator,
+    )
+
+    if table.size == 0:
+        return np.zeros(len(table))
+    location = PvtTableInterpolator(resampled).locate(
+        pressure_values[:, None], temperature_values[None, :]
+    )
+    p0 = location.pressure_index
+    t0 = location.temperature_index
+    p1 = np.minimum(p0 + 1, len(resampled.pressure_values) - 1)
+    t1 = np.minimum(t0 + 1, len(resampled.temperature_values) - 1)
+    wp = location.pressure_weight
+    wt = location.temperature_weight
+
+    errors = np.empty(len(table))
+    for index, values in enumerate(resampled.table_values):
+        values = values.astype(np.float64)
+        interpolated = (
+            values[p0, t0] * ((1.0 - wp) * (1.0 - wt))
+            + values[p0, t1] * ((1.0 - wp) * wt)
+            + values[p1, t0] * (wp * (1.0 - wt))
+            + values[p1, t1] * (wp * wt)
+        )
+        errors[index] = (np.abs(interpolated - table[index]) / scale[index]).max()
+    return errors
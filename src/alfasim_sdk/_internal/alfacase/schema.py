@@ -45,16 +45,16 @@ composition_description_schema = Map(
 )
 compressor_pressure_table_description_schema = Map(
     {
-        Optional("speed_entries"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("corrected_mass_flow_rate_entries"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("pressure_ratio_table"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("isentropic_efficiency_table"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("speed_entries"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("corrected_mass_flow_rate_entries"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("pressure_ratio_table"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("isentropic_efficiency_table"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 cv_table_description_schema = Map(
     {
-        Optional("opening"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("flow_coefficient"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("opening"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("flow_coefficient"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 environment_property_description_schema = Map(
@@ -100,8 +100,8 @@ heavy_component_description_schema = Map(
 )
 ipr_curve_description_schema = Map(
     {
-        Optional("pressure_difference"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("flow_rate"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("pressure_difference"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("flow_rate"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 internal_node_properties_description_schema = Map(
@@ -111,8 +111,8 @@ internal_node_properties_description_schema = Map(
 )
 length_and_elevation_description_schema = Map(
     {
-        Optional("length"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("elevation"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("length"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("elevation"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 light_component_description_schema = Map(
@@ -142,7 +142,7 @@ linear_ipr_description_schema = Map(
 mass_source_equipment_description_schema = Map(
     {
         Optional("fluid"): Str(),
-        Optional("tracer_mass_fraction"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("tracer_mass_fraction"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
         Optional("temperature"): Map({"value": Float(), "unit": Str()}),
         Optional("source_type"): Enum(['mass_source_type_mass_flow_rates', 'mass_source_type_all_volumetric_flow_rates', 'mass_source_type_flow_rate_oil_gor_wc', 'mass_source_type_flow_rate_gas_gor_wc', 'mass_source_type_flow_rate_water_gor_wc', 'mass_source_type_total_mass_flow_rate_pvt_split']),
         Optional("volumetric_flow_rates_std"): MapPattern(Str(), Map({"value": Float(), "unit": Str()})),
@@ -156,7 +156,7 @@ mass_source_equipment_description_schema = Map(
 mass_source_node_properties_description_schema = Map(
     {
         Optional("fluid"): Str(),
-        Optional("tracer_mass_fraction"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("tracer_mass_fraction"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
         Optional("temperature"): Map({"value": Float(), "unit": Str()}),
         Optional("source_type"): Enum(['mass_source_type_mass_flow_rates', 'mass_source_type_all_volumetric_flow_rates', 'mass_source_type_flow_rate_oil_gor_wc', 'mass_source_type_flow_rate_gas_gor_wc', 'mass_source_type_flow_rate_water_gor_wc', 'mass_source_type_total_mass_flow_rate_pvt_split']),
         Optional("volumetric_flow_rates_std"): MapPattern(Str(), Map({"value": Float(), "unit": Str()})),
@@ -206,8 +206,8 @@ open_hole_description_schema = Map(
 )
 opening_curve_description_schema = Map(
     {
-        Optional("time"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("opening"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("time"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("opening"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 packer_description_schema = Map(
@@ -233,16 +233,16 @@ physics_description_schema = Map(
 )
 pipe_segments_description_schema = Map(
     {
-        "start_positions": Map({"values": Seq(Float()), "unit": Str()}),
-        "diameters": Map({"values": Seq(Float()), "unit": Str()}),
-        "roughnesses": Map({"values": Seq(Float()), "unit": Str()}),
+        "start_positions": Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        "diameters": Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        "roughnesses": Map({"values": Seq(Float()) | Str(), "unit": Str()}),
         Optional("wall_names"): Seq(Str()),
     }
 )
 pressure_container_description_schema = Map(
     {
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("pressures"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("pressures"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 pressure_node_properties_description_schema = Map(
@@ -250,7 +250,7 @@ pressure_node_properties_description_schema = Map(
         Optional("pressure"): Map({"value": Float(), "unit": Str()}),
         Optional("temperature"): Map({"value": Float(), "unit": Str()}),
         Optional("fluid"): Str(),
-        Optional("tracer_mass_fraction"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("tracer_mass_fraction"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
         Optional("split_type"): Enum(['mass_inflow_split_type_constant_volume_fraction', 'mass_inflow_split_type_constant_mass_fraction', 'mass_inflow_split_type_pvt', 'mass_inflow_split_type_pvt_user_gor_wc', 'mass_inflow_split_type_pvt_user_glr_wc']),
         Optional("mass_fractions"): MapPattern(Str(), Map({"value": Float(), "unit": Str()})),
         Optional("volume_fractions"): MapPattern(Str(), Map({"value": Float(), "unit": Str()})),
@@ -277,36 +277,36 @@ pvt_model_correlation_description_schema = Map(
 referenced_pressure_container_description_schema = Map(
     {
         Optional("reference_coordinate"): Map({"value": Float(), "unit": Str()}),
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("pressures"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("pressures"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 referenced_temperatures_container_description_schema = Map(
     {
         Optional("reference_coordinate"): Map({"value": Float(), "unit": Str()}),
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("temperatures"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("temperatures"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 referenced_tracers_mass_fractions_container_description_schema = Map(
     {
         Optional("reference_coordinate"): Map({"value": Float(), "unit": Str()}),
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("tracers_mass_fractions"): Seq(Map({"values": Seq(Float()), "unit": Str()})),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("tracers_mass_fractions"): Seq(Map({"values": Seq(Float()) | Str(), "unit": Str()})),
     }
 )
 referenced_velocities_container_description_schema = Map(
     {
         Optional("reference_coordinate"): Map({"value": Float(), "unit": Str()}),
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("velocities"): MapPattern(Str(), Map({"values": Seq(Float()), "unit": Str()})),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("velocities"): MapPattern(Str(), Map({"values": Seq(Float()) | Str(), "unit": Str()})),
     }
 )
 referenced_volume_fractions_container_description_schema = Map(
     {
         Optional("reference_coordinate"): Map({"value": Float(), "unit": Str()}),
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("fractions"): MapPattern(Str(), Map({"values": Seq(Float()), "unit": Str()})),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("fractions"): MapPattern(Str(), Map({"values": Seq(Float()) | Str(), "unit": Str()})),
     }
 )
 reservoir_inflow_equipment_description_schema = Map(
@@ -314,7 +314,7 @@ reservoir_inflow_equipment_description_schema = Map(
         Optional("pressure"): Map({"value": Float(), "unit": Str()}),
         Optional("temperature"): Map({"value": Float(), "unit": Str()}),
         Optional("fluid"): Str(),
-        Optional("tracer_mass_fraction"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("tracer_mass_fraction"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
         Optional("split_type"): Enum(['mass_inflow_split_type_constant_volume_fraction', 'mass_inflow_split_type_constant_mass_fraction', 'mass_inflow_split_type_pvt', 'mass_inflow_split_type_pvt_user_gor_wc', 'mass_inflow_split_type_pvt_user_glr_wc']),
         Optional("mass_fractions"): MapPattern(Str(), Map({"value": Float(), "unit": Str()})),
         Optional("volume_fractions"): MapPattern(Str(), Map({"value": Float(), "unit": Str()})),
@@ -340,22 +340,22 @@ separator_node_properties_description_schema = Map(
 )
 speed_curve_description_schema = Map(
     {
-        Optional("time"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("speed"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("time"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("speed"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 table_pump_description_schema = Map(
     {
-        Optional("speeds"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("void_fractions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("flow_rates"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("pressure_boosts"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("speeds"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("void_fractions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("flow_rates"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("pressure_boosts"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 temperatures_container_description_schema = Map(
     {
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("temperatures"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("temperatures"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 time_options_description_schema = Map(
@@ -378,8 +378,8 @@ tracer_model_constant_coefficients_description_schema = Map(
 )
 tracers_mass_fractions_container_description_schema = Map(
     {
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("tracers_mass_fractions"): Seq(Map({"values": Seq(Float()), "unit": Str()})),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("tracers_mass_fractions"): Seq(Map({"values": Seq(Float()) | Str(), "unit": Str()})),
     }
 )
 trend_output_description_schema = Map(
@@ -402,14 +402,14 @@ tubing_description_schema = Map(
 )
 velocities_container_description_schema = Map(
     {
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("velocities"): MapPattern(Str(), Map({"values": Seq(Float()), "unit": Str()})),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("velocities"): MapPattern(Str(), Map({"values": Seq(Float()) | Str(), "unit": Str()})),
     }
 )
 volume_fractions_container_description_schema = Map(
     {
-        Optional("positions"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("fractions"): MapPattern(Str(), Map({"values": Seq(Float()), "unit": Str()})),
+        Optional("positions"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("fractions"): MapPattern(Str(), Map({"values": Seq(Float()) | Str(), "unit": Str()})),
     }
 )
 wall_layer_description_schema = Map(
@@ -421,8 +421,8 @@ wall_layer_description_schema = Map(
 )
 x_and_y_description_schema = Map(
     {
-        Optional("x"): Map({"values": Seq(Float()), "unit": Str()}),
-        Optional("y"): Map({"values": Seq(Float()), "unit": Str()}),
+        Optional("x"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+        Optional("y"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
     }
 )
 case_output_description_schema = Map(
@@ -678,5 +678,5 @@ case_description_schema = Map(
         Optional("walls"): Seq(wall_description_schema),
     }
 )
-# [[[end]]] (checksum: 246db83b8565903de6db4af4b62191c7)
+# [[[end]]] (checksum: 866025a1d17aa1e76823863325adde9f)
 # fmt: on
@@ -2,6 +2,7 @@ import shutil
 from pathlib import Path
 
 import attr
+import numpy as np
 import pytest
 import strictyaml
 from barril.units import Array
@@ -28,6 +29,7 @@ from alfasim_sdk._internal.alfacase.alfacase_to_case import (
 from alfasim_sdk._internal.alfacase.case_description_attributes import (
     DescriptionError,
 )
+from alfasim_sdk._internal.alfacase.compiled_schema import CompiledYAML
 from alfasim_sdk._internal.alfacase.generate_schema import convert_to_snake_case
 from alfasim_sdk._internal.alfacase.generate_schema import (
     get_all_classes_that_needs_schema,
@@ -635,6 +637,20 @@ def test_get_array_loader():
         "length", [1.0, 2.0], "m"
     )
 
+    # Values are always stored as contiguous float64 arrays, without copying the ones already
+    # converted by the fast loader.
+    array = array_loader(key="foo", alfacase_content=description_document)
+    assert isinstance(array.values, np.ndarray)
+    assert array.values.dtype == np.float64
+
+    values = np.array([1.0, 2.0])
+    fast_content = CompiledYAML({"foo": {"values": values, "unit": "m"}})
+    array = array_loader(
+        key="foo",
+        alfacase_content=DescriptionDocument(content=fast_content, file_path=Path()),
+    )
+    assert array.values is values
+
     expected_msg = "Either 'category' or 'from_unit' parameter must be defined"
     with pytest.raises(ValueError, match=expected_msg):
         get_array_loader()
@@ -737,3 +753,59 @@ def test_invalid_yaml_contents_parsing(tmp_path):
 
     with pytest.raises(DescriptionError, match=re.escape(expected_msg)):
         DescriptionDocument.from_file(alfacase_file)
+
+
+def test_loader_plan():
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import compile_loader_plan
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import load_value
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import (
+        load_pipe_segments_description,
+    )
+    from alfasim_sdk._internal.alfacase.alfacase_to_case import loader_plan
+
+    plan = compile_loader_plan(
+        {
+            "name": load_value,
+            "length": get_scalar_loader(from_unit="m"),
+            "segments": load_pipe_segments_description,
+        }
+    )
+    assert [(i.key, i.is_description_loader) for i in plan] == [
+        ("name", False),
+        ("length", False),
+        ("segments", True),
+    ]
+
+    calls = []
+
+    @loader_plan
+    def get_plan():
+        calls.append(1)
+        return {"name": load_value}
+
+    assert get_plan() is get_plan()
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("fast_loader", [False, True])
+def test_convert_alfacase_to_description_with_workers(tmp_path, fast_loader):
+    from alfasim_sdk import convert_alfacase_to_description
+
+    pipes = [
+        attr.evolve(filled_case_descriptions.PIPE_DESCRIPTION, name=f"pipe {i}")
+        for i in range(5)
+    ]
+    case = attr.evolve(filled_case_descriptions.CASE, pipes=pipes)
+    alfacase_file = tmp_path / "case.alfacase"
+    alfacase_file.write_text(convert_description_to_alfacase(case), encoding="UTF-8")
+
+    expected = convert_alfacase_to_description(alfacase_file)
+    obtained = convert_alfacase_to_description(
+        alfacase_file, fast_loader=fast_loader, workers=2
+    )
+    assert [pipe.name for pipe in obtained.pipes] == [pipe.name for pipe in pipes]
+    ensure_descriptions_are_equal(
+        expected_case_description_dict=attr.asdict(expected),
+        obtained_description_dict=attr.asdict(obtained),
+        ignored_properties=IGNORED_PROPERTIES,
+    )
@@ -1,6 +1,7 @@
 from textwrap import dedent
 
 import numpy as np
+import pytest
 
 from alfasim_sdk import convert_alfacase_to_description
 from alfasim_sdk import generate_alfacase_file
@@ -113,3 +114,243 @@ def test_alfacase_file_load(tmp_path):
         load_pvt_model_table_parameters_description_from_alfatable(alfatable_file)
         == pvt_table_parameters_description
     )
+
+
+def test_binary_alfatable(tmp_path):
+    import attr
+    from barril.units import Scalar
+
+    from alfasim_sdk import load_pvt_model_table_parameters_description_from_alfatable
+    from alfasim_sdk._internal.alfacase.alfatable import is_binary_alfatable
+
+    description = attr.evolve(
+        PvtModelTableParametersDescription.create_constant(has_water=True),
+        label="PVT1",
+        warn_when_outside=False,
+        gas_oil_ratio=Scalar("standard volume per standard volume", np.nan, "sm3/sm3"),
+    )
+    alfatable_file = generate_alfatable_file(
+        tmp_path / "mycase.alfacase", "FLUID-A 1", description, binary=True
+    )
+    assert alfatable_file == tmp_path / "mycase.fluid_a_1.alfatable"
+    assert is_binary_alfatable(alfatable_file)
+
+    obtained = load_pvt_model_table_parameters_description_from_alfatable(
+        alfatable_file
+    )
+    assert isinstance(obtained.pressure_values.base, np.memmap)
+    assert not obtained.pressure_values.flags.writeable
+    assert all(
+        isinstance(values.base, np.memmap) for values in obtained.table_variables
+    )
+    # The memory-mapped values are used directly as the contiguous table.
+    assert np.shares_memory(obtained.table_values, obtained.table_variables[-1])
+    assert not obtained.table_values.flags.writeable
+    np.testing.assert_array_equal(obtained.pressure_values, description.pressure_values)
+    np.testing.assert_array_equal(
+        obtained.temperature_values, description.temperature_values
+    )
+    np.testing.assert_array_equal(obtained.table_variables, description.table_variables)
+    assert obtained.variable_names == description.variable_names
+    assert obtained.label == "PVT1"
+    assert obtained.number_of_phases == 3
+    assert obtained.warn_when_outside is False
+    assert obtained.water_density_std == description.water_density_std
+    assert np.isnan(obtained.gas_oil_ratio.GetValue())
+    assert obtained.gas_oil_ratio.GetUnit() == "sm3/sm3"
+
+
+def test_binary_alfatable_version(tmp_path):
+    import attr
+
+    from alfasim_sdk import load_pvt_model_table_parameters_description_from_alfatable
+    from alfasim_sdk._internal.alfacase.alfatable import BINARY_ALFATABLE_SIGNATURE
+
+    def get_version(alfatable_file):
+        return alfatable_file.read_bytes()[len(BINARY_ALFATABLE_SIGNATURE)]
+
+    description = PvtModelTableParametersDescription.create_constant()
+    float64_file = generate_alfatable_file(
+        tmp_path / "case.alfacase", "float64", description, binary=True
+    )
+    float32_file = generate_alfatable_file(
+        tmp_path / "case.alfacase",
+        "float32",
+        attr.evolve(
+            description,
+            table_variables=[i.astype(np.float32) for i in description.table_variables],
+        ),
+        binary=True,
+    )
+    # Files with float32 values use the version 2, unknown to readers of the version 1 only.
+    assert get_version(float64_file) == 1
+    assert b"variables_dtype" not in float64_file.read_bytes()
+    assert get_version(float32_file) == 2
+
+    for alfatable_file, dtype in [
+        (float64_file, np.float64),
+        (float32_file, np.float32),
+    ]:
+        obtained = load_pvt_model_table_parameters_description_from_alfatable(
+            alfatable_file
+        )
+        assert obtained.table_values.dtype == dtype
+        np.testing.assert_allclose(
+            obtained.table_values, description.table_values, rtol=1e-6
+        )
+
+    content = bytearray(float32_file.read_bytes())
+    content[len(BINARY_ALFATABLE_SIGNATURE)] = 3
+    float32_file.write_bytes(bytes(content))
+    with pytest.raises(RuntimeError, match="Unsupported binary alfatable version 3"):
+        load_pvt_model_table_parameters_description_from_alfatable(float32_file)
+
+
+def test_load_binary_alfatable_content_invalid_signature(tmp_path):
+    from alfasim_sdk._internal.alfacase.alfatable import _load_binary_alfatable_content
+
+    invalid_file = tmp_path / "invalid.alfatable"
+    invalid_file.write_bytes(b"\x93NOTATABLE" + bytes(64))
+    with pytest.raises(RuntimeError, match="Not a binary alfatable file: .*invalid"):
+        _load_binary_alfatable_content(invalid_file)
+
+
+def test_binary_alfatable_from_alfacase_file(tmp_path):
+    from alfasim_sdk._internal.alfacase import case_description
+    from alfasim_sdk._internal.alfacase.alfatable import is_binary_alfatable
+
+    alfacase_file = tmp_path / "mycase.alfacase"
+    alfatable_file = tmp_path / "mycase.fluid_a_1.alfatable"
+    pvt_table_parameters_description = (
+        case_description.PvtModelTableParametersDescription.create_constant()
+    )
+    description = case_description.CaseDescription(
+        pvt_models=case_description.PvtModelsDescription(
+            table_parameters={"FLUID-A 1": pvt_table_parameters_description}
+        )
+    )
+
+    generate_alfacase_file(description, alfacase_file, binary_alfatable=True)
+    assert is_binary_alfatable(alfatable_file)
+
+    case = convert_alfacase_to_description(alfacase_file)
+    assert case.pvt_models.tables == {"FLUID-A 1": alfatable_file}
+
+    from alfasim_sdk import load_pvt_model_table_parameters_description_from_alfatable
+
+    assert (
+        load_pvt_model_table_parameters_description_from_alfatable(alfatable_file)
+        == pvt_table_parameters_description
+    )
+
+
+def test_alfacase_file_export_shared_tables(tmp_path):
+    """
+    PvtModels with the same table share a single alfatable file.
+    """
+    import attr
+
+    from alfasim_sdk._internal.alfacase import case_description
+
+    alfacase_file = tmp_path / "mycase.alfacase"
+    table = PvtModelTableParametersDescription.create_constant()
+    description = case_description.CaseDescription(
+        pvt_models=case_description.PvtModelsDescription(
+            table_parameters={
+                "PVT1": table,
+                "PVT2": PvtModelTableParametersDescription.create_constant(),
+                "PVT3": attr.evolve(table, label="other"),
+            }
+        )
+    )
+
+    generate_alfacase_file(description, alfacase_file)
+    assert sorted(i.name for i in tmp_path.glob("*.alfatable")) == [
+        "mycase.pvt1.alfatable",
+        "mycase.pvt3.alfatable",
+    ]
+    case = convert_alfacase_to_description(alfacase_file)
+    assert case.pvt_models.tables == {
+        "PVT1": tmp_path / "mycase.pvt1.alfatable",
+        "PVT2": tmp_path / "mycase.pvt1.alfatable",
+        "PVT3": tmp_path / "mycase.pvt3.alfatable",
+    }
+
+
+def test_pvt_table_handles(tmp_path):
+    from alfasim_sdk import PvtTableHandle
+    from alfasim_sdk._internal.alfacase import case_description
+    from alfasim_sdk._internal.alfacase.case_description_attributes import (
+        InvalidReferenceError,
+    )
+
+    alfacase_file = tmp_path / "mycase.alfacase"
+    tables = {
+        f"PVT{i}": PvtModelTableParametersDescription.create_constant(
+            rho_l_ref=1000.0 + i
+        )
+        for i in range(3)
+    }
+    generate_alfacase_file(
+        case_description.CaseDescription(
+            pvt_models=case_description.PvtModelsDescription(
+                table_parameters=dict(tables)
+            )
+        ),
+        alfacase_file,
+        binary_alfatable=True,
+    )
+
+    case = convert_alfacase_to_description(alfacase_file)
+    pvt_models = case.pvt_models
+    handles = pvt_models.table_parameters
+    assert handles == {
+        name: PvtTableHandle(tmp_path / f"mycase.{name.lower()}.alfatable")
+        for name in tables
+    }
+    # Validation only checks the files.
+    case.ensure_valid_references()
+    assert not any(handle.is_loaded() for handle in handles.values())
+
+    assert pvt_models.get_table_parameters("PVT1") == tables["PVT1"]
+    assert [handle.is_loaded() for handle in handles.values()] == [False, True, False]
+    assert pvt_models.get_table_parameters("PVT1") is handles["PVT1"].load()
+
+    handles["PVT3"] = PvtTableHandle(tmp_path / "missing.alfatable")
+    with pytest.raises(InvalidReferenceError, match="'PVT3'.*is not a valid PVT table"):
+        case.ensure_valid_references()
+    case.reset_invalid_references()
+    assert "PVT3" not in handles
+
+    # Exporting keeps the references to the files on `tables`, loading the other handles.
+    handles["PVT3"] = PvtTableHandle(tmp_path / "mycase.pvt0.alfatable")
+    assert [pvt_models.is_table_handle(name) for name in handles] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+    pvt2_handle = handles["PVT2"]
+    other_alfacase_file = tmp_path / "other.alfacase"
+    generate_alfacase_file(case, other_alfacase_file)
+    assert not pvt2_handle.is_loaded()
+    other_case = convert_alfacase_to_description(other_alfacase_file)
+    assert other_case.pvt_models.tables["PVT2"] == tmp_path / "mycase.pvt2.alfatable"
+    assert other_case.pvt_models.tables["PVT3"] == tmp_path / "other.pvt3.alfatable"
+    assert other_case.pvt_models.get_table_parameters("PVT3") == tables["PVT0"]
+
+
+def test_pvt_table_handle_tab_file():
+    from alfasim_sdk import load_pvt_model_table_parameters_description_from_tab
+    from alfasim_sdk import PvtTableHandle
+
+    from ..common_testing.alfasim_sdk_common_testing import get_acme_tab_file_path
+
+    handle = PvtTableHandle.from_value(f"{get_acme_tab_file_path()}|SOMELABEL")
+    assert handle.model_name == "SOMELABEL"
+    assert str(handle) == f"{get_acme_tab_file_path()}|SOMELABEL"
+    assert handle.exists()
+    assert not PvtTableHandle(get_acme_tab_file_path(), "Foo").exists()
+    assert handle.load() == load_pvt_model_table_parameters_description_from_tab(
+        get_acme_tab_file_path()
+    )
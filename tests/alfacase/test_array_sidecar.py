@@ -0,0 +1,125 @@
+import attr
+import numpy as np
+import pytest
+from barril.units import Array
+
+from ..common_testing.alfasim_sdk_common_testing import filled_case_descriptions
+from ..common_testing.alfasim_sdk_common_testing.filled_case_descriptions import (
+    ensure_descriptions_are_equal,
+)
+from alfasim_sdk import convert_alfacase_to_description
+from alfasim_sdk import generate_alfacase_file
+from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase.array_sidecar import ArraySidecarWriter
+from alfasim_sdk._internal.alfacase.array_sidecar import get_array_sidecar_file
+from alfasim_sdk._internal.alfacase.array_sidecar import load_array_sidecar
+from alfasim_sdk._internal.alfacase.generate_schema import IGNORED_PROPERTIES
+
+
+@pytest.mark.parametrize("fast_loader", [False, True])
+def test_generate_alfacase_file_with_array_sidecars(tmp_path, fast_loader):
+    case = case_description.CaseDescription(
+        name="case", pipes=[filled_case_descriptions.PIPE_DESCRIPTION]
+    )
+    alfacase_file = tmp_path / "mycase.alfacase"
+    generate_alfacase_file(case, alfacase_file, array_sidecar_threshold=2)
+
+    sidecar_files = sorted(tmp_path.glob("mycase.*.npy"))
+    assert sidecar_files
+    contents = alfacase_file.read_text(encoding="UTF-8")
+    for sidecar_file in sidecar_files:
+        assert f"values: {sidecar_file.name}\n" in contents
+
+    obtained = convert_alfacase_to_description(alfacase_file, fast_loader=fast_loader)
+    ensure_descriptions_are_equal(
+        expected_case_description_dict=attr.asdict(case),
+        obtained_description_dict=attr.asdict(obtained),
+        ignored_properties=IGNORED_PROPERTIES,
+    )
+    x_values = obtained.pipes[0].profile.x_and_y.x.values
+    assert isinstance(x_values, np.memmap)
+    assert x_values.dtype == np.float64
+
+
+def test_array_sidecar_writer(tmp_path):
+    alfacase_file = tmp_path / "mycase.alfacase"
+    writer = ArraySidecarWriter(alfacase_file, threshold=3)
+    assert writer(np.array([1.0, 2.0])) is None
+
+    name = writer(np.array([1.0, 2.0, 3.0]))
+    assert name.startswith("mycase.") and name.endswith(".npy")
+    assert writer(Array([1.0, 2.0, 3.0], "m").values) == name
+    assert writer(np.array([1.0, 2.0, 4.0])) != name
+    assert load_array_sidecar(tmp_path / name).tolist() == [1.0, 2.0, 3.0]
+
+    # Other types are converted to float64 when loading.
+    np.save(str(tmp_path / "ints.npy"), np.array([1, 2]))
+    assert load_array_sidecar(tmp_path / "ints.npy").dtype == np.float64
+
+    np.save(str(tmp_path / "2d.npy"), np.ones((2, 2)))
+    with pytest.raises(RuntimeError, match="must contain a 1-dimensional array"):
+        load_array_sidecar(tmp_path / "2d.npy")
+
+    with pytest.raises(RuntimeError, match="The array file missing.npy must be placed"):
+        load_array_sidecar(tmp_path / "missing.npy")
+
+
+def test_get_array_sidecar_file(tmp_path):
+    import os
+
+    directory = tmp_path / "case"
+    directory.mkdir()
+    assert get_array_sidecar_file(directory, "mycase.npy") == directory / "mycase.npy"
+
+    outside_file = tmp_path / "outside.npy"
+    np.save(str(outside_file), np.ones(3))
+    for name in [
+        str(outside_file),
+        "../outside.npy",
+        "sub/mycase.npy",
+        "sub\\mycase.npy",
+        "mycase.txt",
+        "..",
+        "",
+    ]:
+        with pytest.raises(RuntimeError, match="Invalid array file"):
+            get_array_sidecar_file(directory, name)
+
+    # Links to files outside of the directory.
+    link = directory / "link.npy"
+    try:
+        os.symlink(str(outside_file), str(link))
+    except OSError:  # pragma: no cover
+        pytest.skip("Symbolic links not supported")
+    with pytest.raises(RuntimeError, match="must be placed on"):
+        get_array_sidecar_file(directory, "link.npy")
+
+
+@pytest.mark.parametrize("fast_loader", [False, True])
+def test_array_sidecar_outside_of_alfacase_directory(tmp_path, fast_loader):
+    from alfasim_sdk._internal.alfacase.case_description_attributes import (
+        DescriptionError,
+    )
+
+    np.save(str(tmp_path / "outside.npy"), np.array([0.0, 1.0]))
+    case_directory = tmp_path / "case"
+    case_directory.mkdir()
+    alfacase_file = case_directory / "mycase.alfacase"
+    alfacase_file.write_text(
+        "name: case\n"
+        "pipes:\n"
+        "- name: pipe\n"
+        "  source: in\n"
+        "  target: out\n"
+        "  profile:\n"
+        "    x_and_y:\n"
+        "      x:\n"
+        "        values: ../outside.npy\n"
+        "        unit: m\n"
+        "      y:\n"
+        "        values: [0.0, 0.0]\n"
+        "        unit: m\n",
+        encoding="UTF-8",
+    )
+    with pytest.raises((RuntimeError, DescriptionError), match="Invalid array file"):
+        convert_alfacase_to_description(alfacase_file, fast_loader=fast_loader)
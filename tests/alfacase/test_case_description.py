@@ -745,6 +745,135 @@ def test_pvt_model_table_parameters_description_equal():
     assert table_params_3 != table_params_2
 
 
+def test_pvt_model_table_parameters_description_fingerprint():
+    import numpy as np
+    from barril.units import Scalar
+
+    table_params = case_description.PvtModelTableParametersDescription.create_constant()
+    fingerprint = table_params.fingerprint()
+    assert len(fingerprint) == 64
+    assert table_params.fingerprint() is fingerprint  # Cached.
+
+    # Same content, different objects (and dtype of the values).
+    other = case_description.PvtModelTableParametersDescription.create_constant()
+    other.pressure_values = other.pressure_values.astype(np.float32).astype(np.int64)
+    assert other != table_params
+    other.pressure_values = table_params.pressure_values.copy()
+    other.table_variables = [i.copy() for i in table_params.table_variables]
+    assert other.fingerprint() == fingerprint
+    assert other == table_params
+    # Mutable, so not hashable (use the fingerprint as key instead).
+    with pytest.raises(TypeError):
+        hash(table_params)
+
+    # Any attribute changes the fingerprint.
+    for changes in [
+        dict(label="PVT1"),
+        dict(warn_when_outside=False),
+        dict(variable_names=table_params.variable_names[:-1] + ["x"]),
+        dict(water_cut=Scalar(0.5, "-")),
+        dict(temperature_values=table_params.temperature_values + 1.0),
+        dict(table_variables=table_params.table_variables[:-1]),
+    ]:
+        assert attr.evolve(table_params, **changes).fingerprint() != fingerprint
+
+    # Not computed again for tables with many variables.
+    many_variables = attr.evolve(
+        table_params,
+        table_variables=[table_params.table_variables[0]] * 300,
+        variable_names=[f"v{i}" for i in range(300)],
+    )
+    assert many_variables.fingerprint() is many_variables.fingerprint()
+
+    # Replacing an attribute after computing the fingerprint.
+    other.table_variables[0] = other.table_variables[0] * 2
+    assert other.fingerprint() != fingerprint
+    assert other != table_params
+
+    with_nan = attr.evolve(table_params, gas_oil_ratio=None)
+    assert with_nan == attr.evolve(table_params, gas_oil_ratio=None)
+
+
+def test_pvt_model_table_parameters_description_eq_after_in_place_changes():
+    create_constant = (
+        case_description.PvtModelTableParametersDescription.create_constant
+    )
+    table_params = create_constant()
+    other = create_constant()
+    assert table_params.fingerprint() == other.fingerprint()
+    assert table_params == other
+
+    # Equality compares the values, even when the (cached) fingerprint is outdated.
+    original_value = table_params.table_variables[0][0]
+    table_params.table_variables[0][0] += 1
+    assert table_params.fingerprint() == other.fingerprint()
+    assert table_params != other
+    table_params.table_variables[0][0] = original_value
+    assert table_params == other
+
+    # Not contiguous tables.
+    other.table_variables = [i.copy() for i in other.table_variables]
+    assert table_params == other
+    other.table_variables[-1][-1] += 1
+    assert table_params != other
+
+    # The label and the other standard properties are not part of the equality.
+    assert attr.evolve(create_constant(), label="PVT1") == create_constant()
+
+
+def test_pvt_model_table_parameters_description_contiguous_table():
+    import numpy as np
+
+    pressure_values = np.array([1e5, 2e5, 3e5])
+    temperature_values = np.array([300.0, 400.0])
+    variables = [np.arange(6.0), np.arange(6.0) * 2, np.arange(6.0) * 3]
+    table_params = case_description.PvtModelTableParametersDescription(
+        pressure_values=pressure_values,
+        temperature_values=temperature_values,
+        table_variables=variables,
+        variable_names=["a", "b", "c"],
+    )
+    assert type(table_params.table_variables) is list
+    for obtained, expected in zip(table_params.table_variables, variables):
+        np.testing.assert_array_equal(obtained, expected)
+
+    table_values = table_params.table_values
+    assert table_values.shape == (3, 3, 2)
+    assert table_values.flags.c_contiguous
+    np.testing.assert_array_equal(table_values[1], variables[1].reshape(3, 2))
+    # The elements of `table_variables` are views of the same block.
+    assert all(
+        np.shares_memory(table_values, values)
+        for values in table_params.table_variables
+    )
+    table_values[0, 0, 0] = 42.0
+    assert table_params.table_variables[0][0] == 42.0
+
+    # Already contiguous tables are not copied again.
+    copy = attr.evolve(table_params)
+    assert copy.table_variables[0] is table_params.table_variables[0]
+    assert copy == table_params
+
+    # Replacing the table variables after creation: the values are copied, without changing the
+    # table variables.
+    replaced_variables = [np.ones(6), np.zeros(6)]
+    table_params.table_variables = replaced_variables
+    assert not np.shares_memory(table_params.table_values, table_values)
+    np.testing.assert_array_equal(table_params.table_values[0], np.ones((3, 2)))
+    assert table_params.table_variables is replaced_variables
+    assert not any(
+        np.shares_memory(table_params.table_values, values)
+        for values in replaced_variables
+    )
+
+    table_params.table_variables = [np.ones(6), np.zeros(5)]
+    with pytest.raises(ValueError, match="same size and dtype"):
+        table_params.table_values
+    table_params.table_variables = [np.ones(5), np.zeros(5)]
+    with pytest.raises(ValueError, match=re.escape("(3x2), got 5 values")):
+        table_params.table_values
+
+
 def test_pvt_model_table_parameters_description_post_init():
     """
     Check that standard properties that have not been informed (None) is converted to np.nan
@@ -1,12 +1,51 @@
+import io
+
+import attr
+import numpy as np
+import pytest
 from barril.units import Array
+from strictyaml import YAML
 
+from ..common_testing.alfasim_sdk_common_testing import filled_case_descriptions
 from ..common_testing.alfasim_sdk_common_testing.case_builders import (
     build_simple_segment,
 )
 from alfasim_sdk import convert_description_to_alfacase
+from alfasim_sdk import generate_alfacase_file
 from alfasim_sdk import NumericalOptionsDescription
+from alfasim_sdk import PvtModelTableParametersDescription
 from alfasim_sdk._internal.alfacase import case_description
 from alfasim_sdk._internal.alfacase.alfacase_to_case import DescriptionDocument
+from alfasim_sdk._internal.alfacase.case_to_alfacase import (
+    convert_dict_to_valid_alfacase_format,
+)
+from alfasim_sdk._internal.alfacase.case_to_alfacase import format_float_array
+
+
+def _get_values_with_all_kinds_of_floats(size):
+    random = np.random.RandomState(0)
+    values = random.random_sample(size) * 10.0 ** random.randint(-10, 25, size)
+    values[1::7] *= -1
+    values[2] = np.nan
+    values[3] = np.inf
+    values[4] = -np.inf
+    return values
+
+
+_NUMERIC_VALUES = _get_values_with_all_kinds_of_floats(1000)
+_NUMERIC_PIPE = attr.evolve(
+    filled_case_descriptions.PIPE_DESCRIPTION,
+    profile=case_description.ProfileDescription(
+        x_and_y=case_description.XAndYDescription(
+            x=Array(_NUMERIC_VALUES, "m"), y=Array(list(range(20)), "m")
+        )
+    ),
+)
+_NUMERIC_PVT_TABLE = attr.evolve(
+    PvtModelTableParametersDescription.create_constant(),
+    pressure_values=_NUMERIC_VALUES,
+    table_variables=[_NUMERIC_VALUES[:1], _NUMERIC_VALUES.astype(np.float32)],
+)
 
 
 def test_convert_description_to_alfacase_with_empty_dict(tmp_path):
@@ -67,3 +106,142 @@ def test_convert_description_to_alfacase_with_nan_float():
     simple_case_alfacase_content = convert_description_to_alfacase(simple_case)
     assert "tolerance: .inf" in simple_case_alfacase_content
     assert "relaxed_tolerance: -.inf" in simple_case_alfacase_content
+
+
+@pytest.mark.parametrize(
+    "description, enable_flow_style_on_numpy",
+    [
+        (filled_case_descriptions.CASE, False),
+        (case_description.CaseDescription(), False),
+        (case_description.XAndYDescription(), False),
+        (PvtModelTableParametersDescription.create_constant(), True),
+        (_NUMERIC_PVT_TABLE, True),
+        (_NUMERIC_PVT_TABLE, False),
+        (attr.evolve(filled_case_descriptions.CASE, pipes=[_NUMERIC_PIPE]), False),
+    ],
+)
+def test_convert_description_to_alfacase_is_the_same_as_strictyaml(
+    description, enable_flow_style_on_numpy
+):
+    """
+    The content is written while traversing the description, the result must be exactly the same
+    obtained by converting the whole description to a dict and dumping it with strictyaml.
+    """
+    expected = YAML(
+        convert_dict_to_valid_alfacase_format(
+            attr.asdict(description, recurse=False),
+            enable_flow_style_on_numpy=enable_flow_style_on_numpy,
+        )
+    ).as_yaml()
+    obtained = convert_description_to_alfacase(
+        description, enable_flow_style_on_numpy=enable_flow_style_on_numpy
+    )
+    assert obtained == expected
+
+
+def test_stream_writer_uses_the_yaml_package_of_strictyaml():
+    """
+    Depending on its version, strictyaml is built on the standalone ``ruamel.yaml`` or on its own
+    copy of it, the events must come from the same package as the emitter of the dumper.
+    """
+    from strictyaml.dumper import StrictYAMLDumper
+
+    from alfasim_sdk._internal.alfacase.case_to_alfacase import AlfacaseStreamWriter
+
+    (emitter_module,) = {
+        cls.__module__ for cls in StrictYAMLDumper.__mro__ if cls.__name__ == "Emitter"
+    }
+    writer = AlfacaseStreamWriter(io.StringIO())
+    assert writer._events.__name__ == emitter_module.replace(".emitter", ".events")
+
+    assert convert_description_to_alfacase(
+        case_description.PhysicsDescription()
+    ).startswith("hydrodynamic_model: ")
+    assert "pressure_values: [" in convert_description_to_alfacase(
+        PvtModelTableParametersDescription.create_constant(),
+        enable_flow_style_on_numpy=True,
+    )
+
+
+@pytest.mark.parametrize("enable_flow_style_on_numpy", [True, False])
+def test_write_large_array_round_trip(enable_flow_style_on_numpy):
+    """
+    Arrays are written item by item while streaming, loading them back must give the same values.
+    """
+    from ruamel.yaml import YAML as RuamelYAML
+
+    from alfasim_sdk._internal.alfacase.alfacase import write_description_as_alfacase
+
+    def write_and_load(description):
+        stream = io.StringIO()
+        write_description_as_alfacase(
+            description, stream, enable_flow_style_on_numpy=enable_flow_style_on_numpy
+        )
+        return RuamelYAML(typ="safe").load(stream.getvalue())
+
+    values = np.random.RandomState(0).uniform(-1e6, 1e6, 10000)
+    content = write_and_load(
+        case_description.XAndYDescription(
+            x=Array(values, "m"), y=Array(np.arange(len(values), dtype=float), "m")
+        )
+    )
+    assert content["x"]["unit"] == "m"
+    np.testing.assert_array_equal(content["x"]["values"], values)
+    np.testing.assert_array_equal(content["y"]["values"], np.arange(len(values)))
+
+    # Numpy arrays (written in flow style when enabled).
+    content = write_and_load(
+        attr.evolve(
+            PvtModelTableParametersDescription.create_constant(),
+            pressure_values=values,
+        )
+    )
+    np.testing.assert_array_equal(content["pressure_values"], values)
+
+
+def test_generate_alfacase_file_is_atomic(tmp_path, mocker):
+    from alfasim_sdk._internal.alfacase import alfacase
+
+    alfacase_file = tmp_path / "case.alfacase"
+    alfacase_file.write_text("previous", encoding="utf-8")
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("failed")
+
+    mocker.patch.object(alfacase, "write_description_as_alfacase", side_effect=fail)
+    with pytest.raises(RuntimeError, match="failed"):
+        generate_alfacase_file(filled_case_descriptions.CASE, alfacase_file)
+    # The previous file is kept and no temporary file is left behind.
+    assert alfacase_file.read_text(encoding="utf-8") == "previous"
+    assert [i.name for i in tmp_path.iterdir()] == ["case.alfacase"]
+
+
+def test_generate_alfacase_file_is_the_same_as_convert(tmp_path):
+    case = attr.evolve(
+        filled_case_descriptions.CASE,
+        pvt_models=case_description.PvtModelsDescription(default_model="PVT1"),
+    )
+    alfacase_file = tmp_path / "case.alfacase"
+    generate_alfacase_file(case, alfacase_file)
+    assert alfacase_file.read_bytes() == convert_description_to_alfacase(case).encode(
+        "utf-8"
+    )
+
+
+def test_format_float_array():
+    values = np.array([0.1, 1.0, -2.5, 1e20, 1e-05, np.nan, np.inf, -np.inf])
+    expected = ["0.1", "1.0", "-2.5", "1e+20", "1e-05", ".nan", ".inf", "-.inf"]
+    assert format_float_array(values) == expected
+    assert format_float_array(values.tolist()) == expected
+    assert format_float_array([]) == []
+
+    # Other types are kept as given.
+    assert format_float_array([0, 1.5, float("nan")]) == ["0", "1.5", ".nan"]
+    assert format_float_array(np.array([1, 2])) == ["1", "2"]
+
+    values = _get_values_with_all_kinds_of_floats(10000)
+    values = values[np.isfinite(values)]
+    assert format_float_array(values) == [str(i) for i in values]
+    assert format_float_array(values.astype(np.float32)) == [
+        str(i) for i in values.astype(np.float32)
+    ]
@@ -0,0 +1,140 @@
+import re
+
+import attr
+import numpy as np
+import pytest
+import strictyaml
+
+from ..common_testing.alfasim_sdk_common_testing import filled_case_descriptions
+from ..common_testing.alfasim_sdk_common_testing.filled_case_descriptions import (
+    ensure_descriptions_are_equal,
+)
+from alfasim_sdk import convert_alfacase_to_description
+from alfasim_sdk import convert_description_to_alfacase
+from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase import compiled_schema
+from alfasim_sdk._internal.alfacase import schema
+from alfasim_sdk._internal.alfacase.alfacase_to_case import DescriptionDocument
+from alfasim_sdk._internal.alfacase.compiled_schema import compile_schema
+from alfasim_sdk._internal.alfacase.compiled_schema import FastPathNotApplicable
+from alfasim_sdk._internal.alfacase.generate_schema import IGNORED_PROPERTIES
+
+
+def _arrays_to_lists(data):
+    if isinstance(data, dict):
+        return {k: _arrays_to_lists(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_arrays_to_lists(v) for v in data]
+    if isinstance(data, np.ndarray):
+        return data.tolist()
+    return data
+
+
+@pytest.fixture
+def case_alfacase_file(tmp_path):
+    alfacase_file = tmp_path / "case.alfacase"
+    alfacase_file.write_text(
+        convert_description_to_alfacase(filled_case_descriptions.CASE),
+        encoding="UTF-8",
+    )
+    return alfacase_file
+
+
+def test_compiled_schema_data_matches_strictyaml(case_alfacase_file):
+    yaml_string = case_alfacase_file.read_text(encoding="UTF-8")
+    expected = strictyaml.dirty_load(
+        yaml_string, schema=schema.case_description_schema, allow_flow_style=True
+    ).data
+
+    obtained = compiled_schema.load_content(
+        yaml_string, case_description.CaseDescription
+    )
+    assert _arrays_to_lists(obtained.data) == expected
+
+
+def test_fast_loader_round_trip(case_alfacase_file):
+    expected = convert_alfacase_to_description(case_alfacase_file)
+    obtained = convert_alfacase_to_description(case_alfacase_file, fast_loader=True)
+
+    ensure_descriptions_are_equal(
+        expected_case_description_dict=attr.asdict(expected),
+        obtained_description_dict=attr.asdict(obtained),
+        ignored_properties=IGNORED_PROPERTIES,
+    )
+
+
+@pytest.mark.parametrize(
+    "yaml_string",
+    [
+        "name: [a, b]",
+        "physics:\n  hydrodynamic_model: unknown_model",
+        "time_options:\n  stop_on_steady_state: maybe",
+        "unknown_key: 1",
+        "nodes:\n- name: node &anchor",
+        "name: a\nname: b",
+        "Invalid YAML contents",
+    ],
+)
+def test_fast_loader_errors_are_the_same(tmp_path, yaml_string):
+    alfacase_file = tmp_path / "invalid.alfacase"
+    alfacase_file.write_text(yaml_string, encoding="UTF-8")
+
+    with pytest.raises(FastPathNotApplicable):
+        compiled_schema.load_content(yaml_string, case_description.CaseDescription)
+
+    with pytest.raises(Exception) as strict_error:
+        DescriptionDocument.from_file(alfacase_file)
+
+    with pytest.raises(
+        type(strict_error.value), match=re.escape(str(strict_error.value))
+    ):
+        DescriptionDocument.from_file(alfacase_file, fast_loader=True)
+
+
+def test_compiled_schema_values():
+    validate = compile_schema(case_description.TimeOptionsDescription)
+    obtained = validate(
+        {
+            "stop_on_steady_state": "Yes",
+            "initial_time": {"value": ".inf", "unit": "s"},
+            "final_time": {"value": "-.Inf", "unit": "s"},
+            "minimum_timestep": {"value": "1_000.5", "unit": "s"},
+        }
+    )
+    assert obtained["stop_on_steady_state"] is True
+    assert obtained["initial_time"]["value"] == float("inf")
+    assert obtained["final_time"]["value"] == float("-inf")
+    assert obtained["minimum_timestep"]["value"] == 1000.5
+
+    with pytest.raises(FastPathNotApplicable):
+        validate({"initial_time": {"value": "1"}})
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (["1", "-2.5", "+1e3", "1_000.5"], [1.0, -2.5, 1000.0, 1000.5]),
+        (["1.0", ".inf", "-.Inf", "2"], [1.0, float("inf"), float("-inf"), 2.0]),
+        (["1__0", "2"], [10.0, 2.0]),
+        ([], []),
+    ],
+)
+def test_compiled_schema_arrays(values, expected):
+    validate = compile_schema(case_description.XAndYDescription)
+    obtained = validate({"x": {"values": values, "unit": "m"}})["x"]["values"]
+    assert isinstance(obtained, np.ndarray)
+    assert obtained.dtype == np.float64
+    assert obtained.flags.c_contiguous
+    assert obtained.tolist() == expected
+
+    nan_values = validate({"x": {"values": [".nan", "1"], "unit": "m"}})["x"]["values"]
+    assert np.isnan(nan_values[0]) and nan_values[1] == 1.0
+
+
+@pytest.mark.parametrize(
+    "values", [["1", "a"], ["1", "infinity"], ["1", ["2"]], ["."], {"a": "1"}]
+)
+def test_compiled_schema_invalid_arrays(values):
+    validate = compile_schema(case_description.XAndYDescription)
+    with pytest.raises(FastPathNotApplicable):
+        validate({"x": {"values": values, "unit": "m"}})
@@ -0,0 +1,219 @@
+from pathlib import Path
+
+import attr
+import pytest
+
+from ..common_testing.alfasim_sdk_common_testing import filled_case_descriptions
+from ..common_testing.alfasim_sdk_common_testing.filled_case_descriptions import (
+    ensure_descriptions_are_equal,
+)
+from alfasim_sdk import CaseDescriptionCache
+from alfasim_sdk import convert_alfacase_to_description
+from alfasim_sdk import convert_description_to_alfacase
+from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase.description_cache import CACHE_ENTRY_SUFFIX
+from alfasim_sdk._internal.alfacase.generate_schema import IGNORED_PROPERTIES
+
+
+@pytest.fixture
+def alfacase_file(tmp_path):
+    alfacase_file = tmp_path / "case.alfacase"
+    alfacase_file.write_text(
+        convert_description_to_alfacase(filled_case_descriptions.CASE),
+        encoding="UTF-8",
+    )
+    return alfacase_file
+
+
+def test_cache_hit(alfacase_file, tmp_path, mocker):
+    cache = CaseDescriptionCache(tmp_path / "cache")
+    expected = convert_alfacase_to_description(alfacase_file)
+
+    obtained = convert_alfacase_to_description(alfacase_file, cache=cache)
+    assert len(list(cache.directory.glob(f"*{CACHE_ENTRY_SUFFIX}"))) == 1
+
+    from alfasim_sdk._internal.alfacase import alfacase_to_case
+
+    load_spy = mocker.spy(alfacase_to_case, "load_case_description")
+    cached = convert_alfacase_to_description(alfacase_file, cache=cache)
+    assert load_spy.call_count == 0
+
+    for description in (obtained, cached):
+        ensure_descriptions_are_equal(
+            expected_case_description_dict=attr.asdict(expected),
+            obtained_description_dict=attr.asdict(description),
+            ignored_properties=IGNORED_PROPERTIES,
+        )
+
+
+def test_cache_invalidation(alfacase_file, tmp_path):
+    cache = CaseDescriptionCache(tmp_path / "cache")
+    pvt_file = tmp_path / "acme.tab"
+    pvt_file.write_text("first", encoding="UTF-8")
+    description = case_description.CaseDescription(
+        name="first",
+        pvt_models=case_description.PvtModelsDescription(tables={"acme": "acme.tab"}),
+    )
+    alfacase_file.write_text(convert_description_to_alfacase(description))
+    key = cache.get_key(alfacase_file)
+
+    assert convert_alfacase_to_description(alfacase_file, cache=cache).name == "first"
+    assert cache.get(key) is not None
+
+    # Changing a referenced file invalidates the entry.
+    pvt_file.write_text("second", encoding="UTF-8")
+    assert cache.get(key) is None
+
+    # Changing the alfacase contents changes the key.
+    description = attr.evolve(description, name="second")
+    alfacase_file.write_text(convert_description_to_alfacase(description))
+    assert cache.get_key(alfacase_file) != key
+    assert convert_alfacase_to_description(alfacase_file, cache=cache).name == "second"
+
+
+def test_cache_eviction(tmp_path):
+    import os
+
+    cache = CaseDescriptionCache(tmp_path / "cache")
+    for index in range(3):
+        cache.put(f"key_{index}", case_description.CaseDescription(name=str(index)))
+        entry_file = cache.directory / f"key_{index}{CACHE_ENTRY_SUFFIX}"
+        os.utime(str(entry_file), (index, index))
+
+    # Using an entry makes it the most recently used one.
+    assert cache.get("key_0").name == "0"
+    entry_size = entry_file.stat().st_size
+
+    cache = attr.evolve(cache, max_size=entry_size * 2)
+    cache.evict()
+    assert cache.get("key_1") is None
+    assert cache.get("key_0").name == "0"
+    assert cache.get("key_2").name == "2"
+
+    cache.clear()
+    assert cache.get("key_0") is None
+    assert not (cache.directory / "cache.lock").exists()
+
+
+def test_cache_corrupted_entry(tmp_path):
+    cache = CaseDescriptionCache(tmp_path / "cache")
+    cache.put("key", case_description.CaseDescription(name="case"))
+    entry_file = cache.directory / f"key{CACHE_ENTRY_SUFFIX}"
+    entry_file.write_bytes(b"invalid")
+
+    assert cache.get("key") is None
+    assert not entry_file.exists()
+
+
+def test_cache_referenced_files_hashed_only_when_changed(tmp_path, mocker):
+    import os
+
+    from alfasim_sdk._internal.alfacase import description_cache
+
+    cache = CaseDescriptionCache(tmp_path / "cache")
+    pvt_file = tmp_path / "acme.tab"
+    pvt_file.write_text("first", encoding="UTF-8")
+    os.utime(str(pvt_file), (1000, 1000))
+    description = case_description.CaseDescription(
+        name="case",
+        pvt_models=case_description.PvtModelsDescription(
+            tables={"acme": str(pvt_file)}
+        ),
+    )
+    cache.put("key", description)
+
+    hash_spy = mocker.spy(description_cache, "_hash_file")
+    assert cache.get("key").name == "case"
+    assert hash_spy.call_count == 0
+
+    # Only the modification time changed: hashed again, but still valid.
+    os.utime(str(pvt_file), (2000, 2000))
+    assert cache.get("key").name == "case"
+    assert hash_spy.call_count == 1
+
+    # Same size, different contents.
+    pvt_file.write_text("other", encoding="UTF-8")
+    os.utime(str(pvt_file), (3000, 3000))
+    assert cache.get("key") is None
+    assert hash_spy.call_count == 2
+
+
+def test_cache_array_sidecars_are_referenced_files(tmp_path):
+    import numpy as np
+    from barril.units import Array
+
+    from alfasim_sdk import generate_alfacase_file
+    from alfasim_sdk._internal.alfacase.description_cache import get_referenced_files
+
+    case = case_description.CaseDescription(
+        name="case",
+        pipes=[
+            attr.evolve(
+                filled_case_descriptions.PIPE_DESCRIPTION,
+                profile=case_description.ProfileDescription(
+                    x_and_y=case_description.XAndYDescription(
+                        x=Array([0.0, 1.0, 2.0], "m"), y=Array([0.0, 0.0, 0.0], "m")
+                    )
+                ),
+            )
+        ],
+    )
+    alfacase_file = tmp_path / "case.alfacase"
+    generate_alfacase_file(case, alfacase_file, array_sidecar_threshold=3)
+    sidecar_files = sorted(tmp_path.glob("case.*.npy"))
+    assert sidecar_files
+
+    cache = CaseDescriptionCache(tmp_path / "cache")
+    description = convert_alfacase_to_description(alfacase_file, cache=cache)
+    assert sorted(get_referenced_files(description)) == sidecar_files
+    key = cache.get_key(alfacase_file)
+    assert cache.get(key) is not None
+
+    # Overwriting a sidecar in place invalidates the entry.
+    x_file = Path(description.pipes[0].profile.x_and_y.x.values.filename)
+    del description
+    np.save(str(x_file), np.array([0.0, 1.0, 3.0]))
+    assert cache.get(key) is None
+    obtained = convert_alfacase_to_description(alfacase_file, cache=cache)
+    assert obtained.pipes[0].profile.x_and_y.x.values.tolist() == [0.0, 1.0, 3.0]
+
+
+def test_cache_stale_lock(tmp_path):
+    import os
+
+    cache = CaseDescriptionCache(tmp_path / "cache", lock_timeout=10.0)
+    cache.directory.mkdir()
+    lock_file = cache.directory / "cache.lock"
+    lock_file.touch()
+    # Older than the lock timeout: broken without waiting.
+    os.utime(str(lock_file), (0, 0))
+
+    cache.put("key", case_description.CaseDescription(name="case"))
+    assert cache.get("key").name == "case"
+    assert not lock_file.exists()
+
+
+def test_cache_lock_waits_for_holder(tmp_path):
+    import threading
+    import time
+
+    cache = CaseDescriptionCache(tmp_path / "cache", lock_timeout=0.1)
+    lock_file = cache.directory / "cache.lock"
+    events = []
+    acquired = threading.Event()
+
+    # Holds the lock for much longer than the lock timeout.
+    def hold_lock():
+        with cache._lock():
+            acquired.set()
+            time.sleep(0.5)
+            events.append("released")
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    acquired.wait()
+    with cache._lock():
+        events.append("acquired")
+    holder.join()
+    assert events == ["released", "acquired"]
+    assert not lock_file.exists()
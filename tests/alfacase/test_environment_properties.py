@@ -0,0 +1,173 @@
+import numpy as np
+import pytest
+from barril.units import Array
+from barril.units import Scalar
+
+from ..common_testing.alfasim_sdk_common_testing import filled_case_descriptions
+from alfasim_sdk import build_pipe_mesh
+from alfasim_sdk import EnvironmentDescription
+from alfasim_sdk import EnvironmentPropertyDescription
+from alfasim_sdk import EnvironmentPropertyTable
+from alfasim_sdk import PipeDescription
+from alfasim_sdk import PipeEnvironmentHeatTransferCoefficientModelType
+from alfasim_sdk import PipeSegmentsDescription
+from alfasim_sdk import PipeThermalPositionInput
+from alfasim_sdk import ProfileDescription
+from alfasim_sdk import XAndYDescription
+
+
+def _make_property(position, temperature, htc_type, **kwargs):
+    return EnvironmentPropertyDescription(
+        position=Scalar(position, "m"),
+        temperature=Scalar(temperature, "degC"),
+        type=htc_type,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def environment():
+    WallsAndWater = PipeEnvironmentHeatTransferCoefficientModelType.WallsAndWater
+    Overall = PipeEnvironmentHeatTransferCoefficientModelType.Overall
+    # Rows not sorted by position.
+    properties = [
+        _make_property(
+            1000.0,
+            4.0,
+            Overall,
+            overall_heat_transfer_coefficient=Scalar(10.0, "W/m2.K"),
+        ),
+        _make_property(
+            0.0,
+            24.0,
+            WallsAndWater,
+            heat_transfer_coefficient=Scalar(100.0, "W/m2.K"),
+            fluid_velocity=Scalar(1.0, "m/s"),
+        ),
+    ]
+    return EnvironmentDescription(
+        position_input_mode=PipeThermalPositionInput.Md,
+        reference_y_coordinate=Scalar(10.0, "m"),
+        md_properties_table=properties,
+        tvd_properties_table=[_make_property(0.0, 20.0, Overall), properties[0]],
+    )
+
+
+def test_environment_property_table(environment):
+    table = environment.get_property_table()
+    assert table is environment.get_property_table()
+    assert isinstance(table, EnvironmentPropertyTable)
+    assert len(table) == 2
+    assert table.position.tolist() == [0.0, 1000.0]
+    assert table.temperature == pytest.approx([297.15, 277.15])
+    assert not table.temperature.flags.writeable
+    assert table.type == (
+        PipeEnvironmentHeatTransferCoefficientModelType.WallsAndWater,
+        PipeEnvironmentHeatTransferCoefficientModelType.Overall,
+    )
+
+    values = table.evaluate([-10.0, 250.0, 500.0, 2000.0])
+    assert list(values) == [
+        "temperature",
+        "heat_transfer_coefficient",
+        "overall_heat_transfer_coefficient",
+        "fluid_velocity",
+    ]
+    assert values["temperature"] == pytest.approx([297.15, 292.15, 287.15, 277.15])
+    assert values["heat_transfer_coefficient"] == pytest.approx(
+        [100.0, 75.0, 50.0, 0.0]
+    )
+    assert values["overall_heat_transfer_coefficient"] == pytest.approx(
+        [0.0, 2.5, 5.0, 10.0]
+    )
+    assert values["fluid_velocity"] == pytest.approx([1.0, 0.75, 0.5, 0.0])
+    assert list(table.evaluate(np.zeros(3), ["fluid_velocity"])) == ["fluid_velocity"]
+
+    assert table.get_types([-10.0, 999.0, 1000.0]).tolist() == [
+        PipeEnvironmentHeatTransferCoefficientModelType.WallsAndWater,
+        PipeEnvironmentHeatTransferCoefficientModelType.WallsAndWater,
+        PipeEnvironmentHeatTransferCoefficientModelType.Overall,
+    ]
+
+    with pytest.raises(ValueError, match="Unknown environment property 'pressure'"):
+        table.evaluate([0.0], ["pressure"])
+    with pytest.raises(ValueError, match="has no properties"):
+        EnvironmentDescription().get_property_table().evaluate([0.0])
+
+
+def test_environment_property_table_changed_rows(environment):
+    table = environment.get_property_table()
+
+    # The lists of rows are mutable, changing them creates the table again.
+    environment.md_properties_table.append(
+        _make_property(
+            2000.0, 0.0, PipeEnvironmentHeatTransferCoefficientModelType.Overall
+        )
+    )
+    changed_table = environment.get_property_table()
+    assert changed_table is not table
+    assert changed_table.position.tolist() == [0.0, 1000.0, 2000.0]
+    assert environment.get_property_table() is changed_table
+
+    environment.md_properties_table[0] = _make_property(
+        500.0, 4.0, PipeEnvironmentHeatTransferCoefficientModelType.Overall
+    )
+    assert environment.get_property_table().position.tolist() == [0.0, 500.0, 2000.0]
+
+
+def test_environment_property_table_many_rows():
+    # Large enough for the number of rows to not be a cached int object.
+    properties = [
+        _make_property(
+            float(i), 20.0, PipeEnvironmentHeatTransferCoefficientModelType.Overall
+        )
+        for i in range(1000)
+    ]
+    environment = EnvironmentDescription(md_properties_table=properties)
+    table = environment.get_property_table()
+    assert len(table) == 1000
+    assert environment.get_property_table() is table
+
+
+def test_environment_property_table_on_mesh(environment):
+    pipe = PipeDescription(
+        name="pipe",
+        source="in",
+        target="out",
+        profile=ProfileDescription(
+            x_and_y=XAndYDescription(
+                x=Array([0.0, 0.0], "m"), y=Array([10.0, -990.0], "m")
+            )
+        ),
+        segments=PipeSegmentsDescription(
+            start_positions=Array([0.0], "m"),
+            diameters=Array([0.1], "m"),
+            roughnesses=Array([1e-5], "m"),
+        ),
+        environment=environment,
+    )
+    mesh = build_pipe_mesh(pipe, 250.0)
+    values = environment.get_property_table().evaluate_on_mesh(mesh, ["temperature"])
+    assert values["temperature"] == pytest.approx([294.65, 289.65, 284.65, 279.65])
+
+    # By true vertical depth, below the reference y coordinate.
+    tvd_environment = EnvironmentDescription(
+        position_input_mode=PipeThermalPositionInput.Tvd,
+        reference_y_coordinate=Scalar(10.0, "m"),
+        md_properties_table=environment.md_properties_table,
+        tvd_properties_table=environment.tvd_properties_table,
+    )
+    table = tvd_environment.get_property_table()
+    assert table.get_mesh_positions(mesh) == pytest.approx(mesh.x_coord_center)
+    values = table.evaluate_on_mesh(mesh, ["temperature"])
+    assert values["temperature"] == pytest.approx([291.15, 287.15, 283.15, 279.15])
+
+
+def test_environment_property_table_filled_description():
+    environment = filled_case_descriptions.ENVIRONMENT_DESCRIPTION
+    table = environment.get_property_table()
+    assert table.position_input_mode == PipeThermalPositionInput.Tvd
+    assert table.reference_y_coordinate == 5.0
+    values = table.evaluate([0.0, 2.0])
+    assert values["temperature"] == pytest.approx([274.15, 274.15])
+    assert values["heat_transfer_coefficient"] == pytest.approx([1.0e50, 1.0e50])
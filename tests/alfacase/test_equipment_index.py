@@ -0,0 +1,138 @@
+import attr
+import pytest
+from barril.units import Array
+from barril.units import Scalar
+
+from ..common_testing.alfasim_sdk_common_testing import filled_case_descriptions
+from alfasim_sdk import build_case_equipment_index
+from alfasim_sdk import build_equipment_index
+from alfasim_sdk import build_pipe_mesh
+from alfasim_sdk import EquipmentDescription
+from alfasim_sdk import EquipmentIndex
+from alfasim_sdk import HeatSourceEquipmentDescription
+from alfasim_sdk import PipeDescription
+from alfasim_sdk import PipeSegmentsDescription
+from alfasim_sdk import ProfileDescription
+from alfasim_sdk import XAndYDescription
+
+
+def test_build_equipment_index():
+    index = build_equipment_index(filled_case_descriptions.EQUIPMENT_DESCRIPTION)
+    assert isinstance(index, EquipmentIndex)
+    assert len(index) == 7
+    assert index.pipe_names == ("",)
+    assert index.pipe_offsets.tolist() == [0, 7]
+    assert index.name.tolist() == [
+        "MASS SOURCE",
+        "RESERVOIR",
+        "VALVE",
+        "VALVE CONSTANT OPENING",
+        "HEAT",
+        "PUMP",
+        "COMPRESSOR",
+    ]
+    assert index.equipment_type.tolist() == [
+        "mass_sources",
+        "reservoir_inflows",
+        "valves",
+        "valves",
+        "heat_sources",
+        "pumps",
+        "compressors",
+    ]
+    assert index.position.tolist() == [10.0, 50.0, 100.0, 100.0, 200.0, 350.0, 500.0]
+    assert index.end_position.tolist() == [
+        10.0,
+        200.0,
+        100.0,
+        100.0,
+        750.0,
+        350.0,
+        500.0,
+    ]
+
+    # The heat source (200 m to 750 m) is on the range, the reservoir (50 m to 200 m) isn't.
+    result = index.query(300.0, 500.0)
+    assert result.name.tolist() == ["HEAT", "PUMP", "COMPRESSOR"]
+    assert index.query(100.0, 100.0).name.tolist() == [
+        "RESERVOIR",
+        "VALVE",
+        "VALVE CONSTANT OPENING",
+    ]
+    assert len(index.query(800.0, 1000.0)) == 0
+
+
+def test_build_case_equipment_index():
+    case = filled_case_descriptions.CASE
+    index = build_case_equipment_index(case)
+    assert index.pipe_names == ("pipe 1", "Wellbore")
+    assert index.pipe_offsets.tolist() == [0, 7, 14]
+    assert index.pipe_name.tolist() == ["pipe 1"] * 7 + ["Wellbore"] * 7
+    assert index.get_pipe("Wellbore").pipe_offsets.tolist() == [0, 0, 7]
+
+    result = index.query(0.0, 60.0)
+    assert result.pipe_name.tolist() == ["pipe 1", "pipe 1", "Wellbore", "Wellbore"]
+    assert result.name.tolist() == ["MASS SOURCE", "RESERVOIR"] * 2
+    result = index.query(0.0, 60.0, pipe_name="Wellbore")
+    assert result.pipe_offsets.tolist() == [0, 0, 2]
+    assert result.name.tolist() == ["MASS SOURCE", "RESERVOIR"]
+
+    with pytest.raises(ValueError, match="no pipe named 'pipe 2'"):
+        index.get_pipe("pipe 2")
+
+
+def test_equipment_index_get_cells():
+    equipment = attr.evolve(
+        filled_case_descriptions.EQUIPMENT_DESCRIPTION,
+        heat_sources={
+            "HEAT": HeatSourceEquipmentDescription(
+                start=Scalar(200.0, "m"),
+                length=Scalar(100.0, "m"),
+                power=Scalar(1.0, "W"),
+            ),
+        },
+    )
+    pipe = PipeDescription(
+        name="pipe",
+        source="in",
+        target="out",
+        profile=ProfileDescription(
+            x_and_y=XAndYDescription(
+                x=Array([0.0, 400.0], "m"), y=Array([0.0, 0.0], "m")
+            )
+        ),
+        segments=PipeSegmentsDescription(
+            start_positions=Array([0.0], "m"),
+            diameters=Array([0.1], "m"),
+            roughnesses=Array([1e-5], "m"),
+        ),
+        equipment=equipment,
+    )
+    mesh = build_pipe_mesh(pipe, 50.0)
+    index = build_equipment_index([(pipe.name, pipe.equipment)])
+    first_cell, last_cell = index.get_cells({"pipe": mesh})
+    assert index.name.tolist() == [
+        "MASS SOURCE",
+        "RESERVOIR",
+        "VALVE",
+        "VALVE CONSTANT OPENING",
+        "HEAT",
+        "PUMP",
+        "COMPRESSOR",
+    ]
+    # Equipment on faces are on the cell after the face, the compressor is after the end of the pipe.
+    assert first_cell.tolist() == [0, 1, 2, 2, 4, 7, 7]
+    assert last_cell.tolist() == [0, 3, 2, 2, 5, 7, 7]
+    assert [c.tolist() for c in index.get_cells(mesh)] == [
+        first_cell.tolist(),
+        last_cell.tolist(),
+    ]
+
+    with pytest.raises(ValueError, match="mesh of pipe 'pipe' is missing"):
+        index.get_cells({})
+    index = build_equipment_index(
+        [("pipe", pipe.equipment), ("empty", EquipmentDescription())]
+    )
+    with pytest.raises(ValueError, match="mesh of each pipe is required"):
+        index.get_cells(mesh)
+    assert index.get_cells({"pipe": mesh})[0].tolist() == first_cell.tolist()
@@ -92,9 +92,9 @@ class TestGenerateStrictYaml:
             """\
                 foo_schema = Map(
                     {
-                        "array_1": Map({"values": Seq(Float()), "unit": Str()}),
-                        Optional("array_2"): Map({"values": Seq(Float()), "unit": Str()}),
-                        Optional("array_3"): Map({"values": Seq(Float()), "unit": Str()}),
+                        "array_1": Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+                        Optional("array_2"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
+                        Optional("array_3"): Map({"values": Seq(Float()) | Str(), "unit": Str()}),
                     }
                 )
             """
@@ -206,7 +206,7 @@ class TestGenerateStrictYaml:
                 foo_schema = Map(
                     {
                         "x_1": MapPattern(Str(), Float()),
-                        "x_2": MapPattern(Str(), Map({"values": Seq(Float()), "unit": Str()})),
+                        "x_2": MapPattern(Str(), Map({"values": Seq(Float()) | Str(), "unit": Str()})),
                         Optional("x_3"): MapPattern(Str(), Map({"value": Float(), "unit": Str()})),
                     }
                 )
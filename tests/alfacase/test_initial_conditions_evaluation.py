@@ -0,0 +1,216 @@
+import numpy as np
+import pytest
+from barril.units import Array
+from barril.units import Scalar
+
+from ..common_testing.alfasim_sdk_common_testing import filled_case_descriptions
+from alfasim_sdk import build_pipe_mesh
+from alfasim_sdk import evaluate_initial_conditions
+from alfasim_sdk import evaluate_initial_conditions_on_mesh
+from alfasim_sdk import evaluate_initial_tracers_mass_fractions
+from alfasim_sdk import InitialConditionsDescription
+from alfasim_sdk import InitialPressuresDescription
+from alfasim_sdk import InitialTemperaturesDescription
+from alfasim_sdk import InitialTracersMassFractionsDescription
+from alfasim_sdk import InitialVelocitiesDescription
+from alfasim_sdk import InitialVolumeFractionsDescription
+from alfasim_sdk import PipeDescription
+from alfasim_sdk import PipeSegmentsDescription
+from alfasim_sdk import PressureContainerDescription
+from alfasim_sdk import ProfileDescription
+from alfasim_sdk import ReferencedPressureContainerDescription
+from alfasim_sdk import ReferencedTemperaturesContainerDescription
+from alfasim_sdk import ReferencedTracersMassFractionsContainerDescription
+from alfasim_sdk import TableInputType
+from alfasim_sdk import TracersMassFractionsContainerDescription
+from alfasim_sdk import VelocitiesContainerDescription
+from alfasim_sdk import VolumeFractionsContainerDescription
+from alfasim_sdk import XAndYDescription
+
+
+def test_evaluate_initial_conditions():
+    initial_conditions = InitialConditionsDescription(
+        pressures=InitialPressuresDescription(
+            position_input_type=TableInputType.length,
+            table_length=PressureContainerDescription(
+                positions=Array([0.0, 100.0], "m"),
+                pressures=Array([10.0, 5.0], "bar"),
+            ),
+        ),
+        volume_fractions=InitialVolumeFractionsDescription(
+            table_length=VolumeFractionsContainerDescription(
+                positions=Array([50.0], "m"),
+                fractions={
+                    "gas": Array([0.2], "-"),
+                    "oil": Array([0.8], "-"),
+                },
+            )
+        ),
+        velocities=InitialVelocitiesDescription(
+            table_length=VelocitiesContainerDescription(
+                positions=Array([0.0, 0.1], "km"),
+                velocities={
+                    "gas": Array([1.0, 2.0], "m/s"),
+                    "oil": Array([0.0, 0.0], "m/s"),
+                },
+            )
+        ),
+        # Positions by depth: relative to the top of the well (the reference coordinate) and
+        # not sorted.
+        temperatures=InitialTemperaturesDescription(
+            position_input_type=TableInputType.vertical_position,
+            table_y=ReferencedTemperaturesContainerDescription(
+                reference_coordinate=Scalar(-20.0, "m"),
+                positions=Array([0.0, -80.0], "m"),
+                temperatures=Array([300.0, 380.0], "K"),
+            ),
+        ),
+    )
+    x_coord_center = np.array([-10.0, 25.0, 50.0, 200.0])
+    y = np.array([-10.0, -20.0, -60.0, -200.0])
+    arrays = evaluate_initial_conditions(
+        initial_conditions,
+        x_coord_center,
+        y=y,
+        x_coord_face=[0.0, 30.0, 70.0, 150.0, 250.0],
+    )
+
+    assert arrays.pressure.GetValues("bar") == pytest.approx([10.0, 8.75, 7.5, 5.0])
+    assert list(arrays.volume_fractions) == ["gas", "oil"]
+    assert arrays.volume_fractions["gas"].GetValues("-") == pytest.approx([0.2] * 4)
+    assert arrays.velocity["gas"].GetValues("m/s") == pytest.approx(
+        [1.0, 1.25, 1.5, 2.0]
+    )
+    assert list(arrays.temperature) == ["gas", "oil"]
+    assert arrays.temperature["oil"].GetValues("K") == pytest.approx(
+        [300.0, 300.0, 340.0, 380.0]
+    )
+    assert arrays.x_coord_center.GetValues("m") == pytest.approx(x_coord_center)
+    assert arrays.x_coord_face.GetValues("m") == pytest.approx(
+        [0.0, 30.0, 70.0, 150.0, 250.0]
+    )
+
+    arrays = evaluate_initial_conditions(
+        initial_conditions, x_coord_center, y=y, temperature_keys=["mixture"]
+    )
+    assert list(arrays.temperature) == ["mixture"]
+    assert arrays.x_coord_face is None
+
+
+def test_evaluate_initial_conditions_on_mesh():
+    pipe = PipeDescription(
+        name="pipe",
+        source="in",
+        target="out",
+        profile=ProfileDescription(
+            x_and_y=XAndYDescription(
+                x=Array([0.0, 100.0], "m"), y=Array([0.0, 0.0], "m")
+            )
+        ),
+        segments=PipeSegmentsDescription(
+            start_positions=Array([0.0], "m"),
+            diameters=Array([0.1], "m"),
+            roughnesses=Array([1e-5], "m"),
+        ),
+    )
+    mesh = build_pipe_mesh(pipe, 10.0)
+    initial_conditions = filled_case_descriptions.INITIAL_CONDITIONS_DESCRIPTION
+    initial_conditions = InitialConditionsDescription(
+        pressures=InitialPressuresDescription(
+            position_input_type=TableInputType.horizontal_position,
+            table_x=ReferencedPressureContainerDescription(
+                reference_coordinate=Scalar(50.0, "m"),
+                positions=Array([0.0, 10.0], "m"),
+                pressures=Array([2e5, 1e5], "Pa"),
+            ),
+        ),
+        volume_fractions=initial_conditions.volume_fractions,
+        velocities=initial_conditions.velocities,
+        temperatures=initial_conditions.temperatures,
+    )
+    arrays = evaluate_initial_conditions_on_mesh(initial_conditions, mesh)
+
+    assert arrays.pressure.GetValues("Pa") == pytest.approx(
+        [2e5] * 5 + [1.5e5] + [1e5] * 4
+    )
+    assert list(arrays.volume_fractions) == ["gas", "oil", "water"]
+    assert arrays.volume_fractions["gas"].GetValues("-") == pytest.approx([0.999] * 10)
+    assert arrays.temperature["water"].GetValues("K") == pytest.approx([123.4] * 10)
+    assert arrays.x_coord_center.GetValues("m") == pytest.approx(mesh.x_coord_center)
+    assert arrays.x_coord_face.GetValues("m") == pytest.approx(mesh.x_coord_face)
+
+
+def test_evaluate_initial_tracers_mass_fractions():
+    tracers = InitialTracersMassFractionsDescription(
+        position_input_type=TableInputType.horizontal_position,
+        table_x=ReferencedTracersMassFractionsContainerDescription(
+            reference_coordinate=Scalar(1.0, "m"),
+            positions=Array([0.0, 2.0], "m"),
+            # The mass fractions of both tracers on each position.
+            tracers_mass_fractions=[Array([0.0, 1.0], "-"), Array([1.0, 0.0], "-")],
+        ),
+    )
+    fractions = evaluate_initial_tracers_mass_fractions(
+        tracers, [0.0, 1.0, 2.0], x=[1.0, 2.0, 3.0]
+    )
+    assert fractions.shape == (2, 3)
+    assert fractions[0] == pytest.approx([0.0, 0.5, 1.0])
+    assert fractions[1] == pytest.approx([1.0, 0.5, 0.0])
+
+    with pytest.raises(ValueError, match="different number of tracers"):
+        evaluate_initial_tracers_mass_fractions(
+            InitialTracersMassFractionsDescription(
+                table_length=TracersMassFractionsContainerDescription(
+                    positions=Array([0.0, 1.0], "m"),
+                    tracers_mass_fractions=[Array([1.0], "-"), Array([0.5, 0.5], "-")],
+                )
+            ),
+            [0.0],
+        )
+
+    fractions = evaluate_initial_tracers_mass_fractions(
+        filled_case_descriptions.INITIAL_CONDITIONS_DESCRIPTION.tracers_mass_fractions,
+        [0.0, 1.0],
+    )
+    assert fractions.tolist() == [[0.0, 0.0], [1.0, 1.0]]
+    assert evaluate_initial_tracers_mass_fractions(
+        InitialTracersMassFractionsDescription(), [0.0, 1.0]
+    ).shape == (0, 2)
+
+
+def test_evaluate_initial_conditions_errors():
+    with pytest.raises(ValueError, match="y coordinate of the cells is required"):
+        evaluate_initial_conditions(
+            InitialConditionsDescription(
+                pressures=InitialPressuresDescription(
+                    position_input_type=TableInputType.vertical_position
+                )
+            ),
+            [0.0, 1.0],
+        )
+    with pytest.raises(
+        ValueError, match="table by horizontal_position has no positions"
+    ):
+        evaluate_initial_conditions(
+            InitialConditionsDescription(
+                temperatures=InitialTemperaturesDescription(
+                    position_input_type=TableInputType.horizontal_position
+                )
+            ),
+            [0.0, 1.0],
+            x=[0.0, 1.0],
+        )
+    with pytest.raises(ValueError, match="has 2 positions but 1 values"):
+        evaluate_initial_conditions(
+            InitialConditionsDescription(
+                pressures=InitialPressuresDescription(
+                    table_length=PressureContainerDescription(
+                        positions=Array([0.0, 1.0], "m"),
+                        pressures=Array([1e5], "Pa"),
+                    )
+                )
+            ),
+            [0.0, 1.0],
+        )
+    with pytest.raises(ValueError, match="Expected 2 coordinates for horizontal"):
+        evaluate_initial_conditions(InitialConditionsDescription(), [0.0, 1.0], x=[0.0])
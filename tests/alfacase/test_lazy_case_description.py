@@ -0,0 +1,145 @@
+import re
+
+import attr
+import pytest
+
+from ..common_testing.alfasim_sdk_common_testing import filled_case_descriptions
+from ..common_testing.alfasim_sdk_common_testing.filled_case_descriptions import (
+    ensure_descriptions_are_equal,
+)
+from alfasim_sdk import convert_alfacase_to_description
+from alfasim_sdk import convert_alfacase_to_lazy_description
+from alfasim_sdk import convert_description_to_alfacase
+from alfasim_sdk._internal.alfacase.case_description_attributes import (
+    DescriptionError,
+)
+from alfasim_sdk._internal.alfacase.compiled_schema import FastPathNotApplicable
+from alfasim_sdk._internal.alfacase.generate_schema import IGNORED_PROPERTIES
+from alfasim_sdk._internal.alfacase.lazy_case_description import (
+    split_sequence_items,
+)
+from alfasim_sdk._internal.alfacase.lazy_case_description import (
+    split_top_level_sections,
+)
+
+
+@pytest.fixture
+def alfacase_file(tmp_path):
+    pipes = [
+        attr.evolve(filled_case_descriptions.PIPE_DESCRIPTION, name=f"pipe {i}")
+        for i in range(3)
+    ]
+    case = attr.evolve(filled_case_descriptions.CASE, pipes=pipes)
+    alfacase_file = tmp_path / "case.alfacase"
+    alfacase_file.write_text(convert_description_to_alfacase(case), encoding="UTF-8")
+    return alfacase_file
+
+
+def test_lazy_case_description(alfacase_file):
+    expected = convert_alfacase_to_description(alfacase_file)
+    lazy = convert_alfacase_to_lazy_description(alfacase_file)
+    assert not lazy.is_loaded("physics")
+
+    assert lazy.physics == expected.physics
+    assert lazy.is_loaded("physics")
+    assert not lazy.is_loaded("pipes")
+
+    assert len(lazy.pipes) == 3
+    assert not lazy.pipes.is_loaded(1)
+    assert lazy.pipes[1] == expected.pipes[1]
+    assert lazy.pipes[1] is lazy.pipes[-2]
+    assert not lazy.pipes.is_loaded(0)
+    assert [pipe.name for pipe in lazy.pipes] == ["pipe 0", "pipe 1", "pipe 2"]
+
+    # Sections not defined on the file have the default value.
+    assert lazy.walls == expected.walls
+
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        lazy.name = "other"
+    with pytest.raises(AttributeError):
+        lazy.unknown_attribute
+
+    ensure_descriptions_are_equal(
+        expected_case_description_dict=attr.asdict(expected),
+        obtained_description_dict=attr.asdict(lazy.materialize()),
+        ignored_properties=IGNORED_PROPERTIES,
+    )
+
+
+def test_lazy_case_description_errors(alfacase_file):
+    """
+    Invalid contents are only detected when the section is accessed,
+    and the error message is the same reported by the regular loader.
+    """
+    contents = alfacase_file.read_text(encoding="UTF-8")
+    contents = contents.replace(
+        "- name: pipe 1\n", "- name: pipe 1\n  invalid_key: 1\n"
+    )
+    alfacase_file.write_text(contents, encoding="UTF-8")
+
+    with pytest.raises(DescriptionError) as expected_error:
+        convert_alfacase_to_description(alfacase_file)
+
+    lazy = convert_alfacase_to_lazy_description(alfacase_file)
+    assert lazy.pipes[0].name == "pipe 0"
+    with pytest.raises(DescriptionError, match=re.escape(str(expected_error.value))):
+        lazy.pipes[1]
+
+    # Invalid top level keys are detected when opening the file.
+    alfacase_file.write_text(contents + "invalid_key: 1\n", encoding="UTF-8")
+    with pytest.raises(DescriptionError, match="unexpected key not in schema"):
+        convert_alfacase_to_lazy_description(alfacase_file)
+
+
+@pytest.mark.parametrize(
+    "original, replacement",
+    [
+        # YAML characters not handled by the compiled schema, but valid for strictyaml.
+        ("name: divergent_pipes\n", "name: A & B\n"),
+        ("- name: pipe 1\n", "- name: pipe & 1\n"),
+        # Contents which can't be split in sections.
+        ("name: divergent_pipes\n", "---\nname: divergent_pipes\n"),
+    ],
+)
+def test_lazy_case_description_strictyaml_fallback(
+    alfacase_file, original, replacement
+):
+    """
+    Valid files which are not handled by the fast path are loaded like the regular loader does.
+    """
+    contents = alfacase_file.read_text(encoding="UTF-8")
+    assert original in contents
+    alfacase_file.write_text(contents.replace(original, replacement), encoding="UTF-8")
+    expected = convert_alfacase_to_description(alfacase_file)
+
+    lazy = convert_alfacase_to_lazy_description(alfacase_file)
+    assert lazy.name == expected.name
+    assert [pipe.name for pipe in lazy.pipes] == [pipe.name for pipe in expected.pipes]
+    ensure_descriptions_are_equal(
+        expected_case_description_dict=attr.asdict(expected),
+        obtained_description_dict=attr.asdict(lazy.materialize()),
+        ignored_properties=IGNORED_PROPERTIES,
+    )
+
+
+def test_split_top_level_sections():
+    contents = "# comment\nname: case\npipes:\n- name: a\n  # comment\n- name: b\n"
+    assert split_top_level_sections(contents) == {
+        "name": "name: case\n",
+        "pipes": "pipes:\n- name: a\n  # comment\n- name: b\n",
+    }
+    with pytest.raises(FastPathNotApplicable):
+        split_top_level_sections("name: a\nname: b\n")
+    with pytest.raises(FastPathNotApplicable):
+        split_top_level_sections("- name: a\n")
+
+
+def test_split_sequence_items():
+    contents = "pipes:\n  - name: a\n    segments:\n    - 1\n\n  - name: b\n"
+    assert split_sequence_items(contents) == [
+        "- name: a\n  segments:\n  - 1\n\n",
+        "- name: b\n",
+    ]
+    assert split_sequence_items("pipes:\n") == []
+    with pytest.raises(FastPathNotApplicable):
+        split_sequence_items("pipes: []\n")
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+from barril.units import Array
+from barril.units import Scalar
+
+from alfasim_sdk import build_pipe_mesh
+from alfasim_sdk import build_pipe_meshes
+from alfasim_sdk import LengthAndElevationDescription
+from alfasim_sdk import PipeDescription
+from alfasim_sdk import PipeSegmentsDescription
+from alfasim_sdk import ProfileDescription
+from alfasim_sdk import XAndYDescription
+
+
+def _make_pipe(profile, segments, name="pipe"):
+    return PipeDescription(
+        name=name, source="in", target="out", profile=profile, segments=segments
+    )
+
+
+def test_build_pipe_mesh():
+    pipe = _make_pipe(
+        ProfileDescription(
+            x_and_y=XAndYDescription(
+                x=Array([0.0, 10.0, 10.0], "m"), y=Array([0.0, 0.0, 5.0], "m")
+            )
+        ),
+        PipeSegmentsDescription(
+            start_positions=Array([0.0, 400.0], "cm"),
+            diameters=Array([0.1, 0.2], "m"),
+            roughnesses=Array([1e-5, 2e-5], "m"),
+            wall_names=["wall 1", "wall 2"],
+        ),
+    )
+    mesh = build_pipe_mesh(pipe, Scalar(3.0, "m"))
+
+    # Faces on the start of the segment (4 m) and on the point of the profile (10 m).
+    assert mesh.x_coord_face == pytest.approx([0.0, 2.0, 4.0, 7.0, 10.0, 12.5, 15.0])
+    assert mesh.cell_count == 6
+    assert mesh.x_coord_center == pytest.approx([1.0, 3.0, 5.5, 8.5, 11.25, 13.75])
+    assert mesh.cell_length == pytest.approx([2.0, 2.0, 3.0, 3.0, 2.5, 2.5])
+    assert mesh.x == pytest.approx([1.0, 3.0, 5.5, 8.5, 10.0, 10.0])
+    assert mesh.y == pytest.approx([0.0, 0.0, 0.0, 0.0, 1.25, 3.75])
+    assert mesh.inclination == pytest.approx([0.0] * 4 + [np.pi / 2] * 2)
+    assert mesh.diameter.tolist() == [0.1, 0.1, 0.2, 0.2, 0.2, 0.2]
+    assert mesh.roughness.tolist() == [1e-5, 1e-5, 2e-5, 2e-5, 2e-5, 2e-5]
+    assert mesh.segment_index.tolist() == [0, 0, 1, 1, 1, 1]
+    assert mesh.cell_wall_names.tolist() == ["wall 1"] * 2 + ["wall 2"] * 4
+
+
+def test_build_pipe_meshes():
+    pipes = [
+        _make_pipe(
+            ProfileDescription(
+                length_and_elevation=LengthAndElevationDescription(
+                    length=Array([0.0, 1000.0 * (i + 1)], "m"),
+                    elevation=Array([0.0, -10.0], "m"),
+                )
+            ),
+            PipeSegmentsDescription(
+                start_positions=Array([0.0], "m"),
+                diameters=Array([0.1], "m"),
+                roughnesses=Array([1e-5], "m"),
+            ),
+            name=f"pipe {i}",
+        )
+        for i in range(3)
+    ]
+    meshes = build_pipe_meshes(pipes, 0.1)
+    assert list(meshes) == ["pipe 0", "pipe 1", "pipe 2"]
+    assert [mesh.cell_count for mesh in meshes.values()] == [10000, 20000, 30000]
+
+    mesh = meshes["pipe 2"]
+    assert mesh.x_coord_face[[0, -1]].tolist() == [0.0, 3000.0]
+    assert mesh.cell_length == pytest.approx(0.1)
+    assert mesh.inclination == pytest.approx(np.arcsin(-10.0 / 3000.0))
+    assert mesh.cell_wall_names.tolist() == [None] * 30000
+
+
+def test_build_pipe_mesh_errors():
+    profile = ProfileDescription(
+        x_and_y=XAndYDescription(x=Array([0.0, 10.0], "m"), y=Array([0.0, 0.0], "m"))
+    )
+    segments = PipeSegmentsDescription(
+        start_positions=Array([0.0, 5.0], "m"),
+        diameters=Array([0.1, 0.1], "m"),
+        roughnesses=Array([1e-5, 1e-5], "m"),
+    )
+    with pytest.raises(ValueError, match="target cell size must be positive"):
+        build_pipe_mesh(_make_pipe(profile, segments), 0.0)
+    with pytest.raises(ValueError, match="same number of start_positions"):
+        build_pipe_mesh(
+            _make_pipe(
+                profile,
+                PipeSegmentsDescription(
+                    start_positions=Array([0.0, 5.0], "m"),
+                    diameters=Array([0.1], "m"),
+                    roughnesses=Array([1e-5, 1e-5], "m"),
+                ),
+            ),
+            1.0,
+        )
+    with pytest.raises(ValueError, match="must be sorted"):
+        build_pipe_mesh(
+            _make_pipe(
+                profile,
+                PipeSegmentsDescription(
+                    start_positions=Array([5.0, 0.0], "m"),
+                    diameters=Array([0.1, 0.1], "m"),
+                    roughnesses=Array([1e-5, 1e-5], "m"),
+                ),
+            ),
+            1.0,
+        )
+    with pytest.raises(ValueError, match="has no length"):
+        build_pipe_mesh(
+            _make_pipe(
+                ProfileDescription(
+                    x_and_y=XAndYDescription(x=Array([0.0], "m"), y=Array([0.0], "m"))
+                ),
+                segments,
+            ),
+            1.0,
+        )
@@ -0,0 +1,110 @@
+import gc
+
+import numpy as np
+import pytest
+from barril.units import Array
+
+from alfasim_sdk import LengthAndElevationDescription
+from alfasim_sdk import ProfileDescription
+from alfasim_sdk import ProfileGeometry
+from alfasim_sdk import XAndYDescription
+from alfasim_sdk._internal.alfacase import profile_geometry
+
+
+def test_x_and_y_geometry():
+    x_and_y = XAndYDescription(
+        x=Array([0.0, 3.0, 3.0, 500.0, 1000.0], "cm"),
+        y=Array([0.0, 4.0, 10.0, 10.0, 10.0], "cm"),
+    )
+    geometry = x_and_y.get_geometry()
+    assert geometry.x.tolist() == [0.0, 0.03, 0.03, 5.0, 10.0]
+    assert geometry.y.tolist() == [0.0, 0.04, 0.1, 0.1, 0.1]
+    assert geometry.segment_lengths == pytest.approx([0.05, 0.06, 4.97, 5.0])
+    assert geometry.measured_length == pytest.approx([0.0, 0.05, 0.11, 5.08, 10.08])
+    assert geometry.horizontal_distance == pytest.approx([0.0, 0.03, 0.03, 5.0, 10.0])
+    assert geometry.inclination == pytest.approx(
+        [np.arctan2(4, 3), np.pi / 2, 0.0, 0.0]
+    )
+    assert geometry.total_length == pytest.approx(10.08)
+
+    # Created once for each description, and shared (so it is read-only).
+    assert x_and_y.get_geometry() is geometry
+    assert ProfileDescription(x_and_y=x_and_y).get_geometry() is geometry
+    with pytest.raises(ValueError, match="read-only"):
+        geometry.x[0] = 1.0
+
+
+def test_length_and_elevation_geometry():
+    length_and_elevation = LengthAndElevationDescription(
+        length=Array([0.0, 15.0, 30.0, 30.0, 15.0], "m"),
+        elevation=Array([0.0, 15.0, 30.0, 30.0, 15.0], "m"),
+    )
+    geometry = ProfileDescription(
+        length_and_elevation=length_and_elevation
+    ).get_geometry()
+    assert geometry.x.tolist() == [0.0] * 5
+    assert geometry.y.tolist() == [0.0, 15.0, 45.0, 75.0, 90.0]
+    assert geometry.measured_length.tolist() == [0.0, 15.0, 45.0, 75.0, 90.0]
+    assert geometry.inclination.tolist() == [np.pi / 2] * 4
+
+    length_and_elevation = LengthAndElevationDescription(
+        length=Array([0.0, 5.0, 10.0], "m"), elevation=Array([0.0, -3.0, 0.0], "m")
+    )
+    geometry = length_and_elevation.get_geometry()
+    assert geometry.x.tolist() == [0.0, 4.0, 14.0]
+    assert geometry.y.tolist() == [0.0, -3.0, -3.0]
+    assert geometry.inclination == pytest.approx([np.arctan2(-3, 4), 0.0])
+
+
+def test_conversion():
+    x_and_y = XAndYDescription(
+        x=Array([0.0, 3.0, 6.0, 10.0], "m"), y=Array([0.0, 4.0, 4.0, 1.0], "m")
+    )
+    length_and_elevation = x_and_y.get_geometry().to_length_and_elevation()
+    assert length_and_elevation.length.GetValues("m").tolist() == [0.0, 5.0, 3.0, 5.0]
+    assert length_and_elevation.elevation.GetValues("m").tolist() == [
+        0.0,
+        4.0,
+        0.0,
+        -3.0,
+    ]
+    converted = length_and_elevation.get_geometry().to_x_and_y()
+    assert converted.x.GetValues("m") == pytest.approx([0.0, 3.0, 6.0, 10.0])
+    assert converted.y.GetValues("m") == pytest.approx([0.0, 4.0, 4.0, 1.0])
+
+
+def test_get_coordinates_and_inclination():
+    geometry = ProfileGeometry.from_coordinates([0.0, 3.0, 6.0], [0.0, 4.0, 4.0])
+    x, y = geometry.get_coordinates([0.0, 2.5, 5.0, 6.5, 100.0])
+    assert x.tolist() == pytest.approx([0.0, 1.5, 3.0, 4.5, 6.0])
+    assert y.tolist() == pytest.approx([0.0, 2.0, 4.0, 4.0, 4.0])
+    assert geometry.get_inclination([0.0, 2.5, 5.0, 7.0, 100.0]) == pytest.approx(
+        [np.arctan2(4, 3)] * 2 + [0.0] * 3
+    )
+
+
+def test_invalid_profiles():
+    with pytest.raises(ValueError, match="can't be bigger than its length"):
+        LengthAndElevationDescription(
+            length=Array([0.0, 1.0], "m"), elevation=Array([0.0, 2.0], "m")
+        ).get_geometry()
+    with pytest.raises(ValueError, match="can't be negative"):
+        LengthAndElevationDescription(
+            length=Array([0.0, -1.0], "m"), elevation=Array([0.0, 0.0], "m")
+        ).get_geometry()
+    with pytest.raises(ValueError, match="same size"):
+        XAndYDescription(x=Array([0.0, 1.0], "m"), y=Array([0.0], "m")).get_geometry()
+    with pytest.raises(ValueError, match="x and y must be defined"):
+        XAndYDescription().get_geometry()
+    with pytest.raises(ValueError, match="neither x_and_y nor length_and_elevation"):
+        ProfileDescription().get_geometry()
+
+
+def test_geometry_cache_is_released():
+    x_and_y = XAndYDescription(x=Array([0.0, 1.0], "m"), y=Array([0.0, 1.0], "m"))
+    x_and_y.get_geometry()
+    key = id(x_and_y)
+    assert key in profile_geometry._GEOMETRIES._entries
+    del x_and_y
+    gc.collect()
+    assert key not in profile_geometry._GEOMETRIES._entries
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+from barril.units import Scalar
+
+from ..common_testing.alfasim_sdk_common_testing import filled_case_descriptions
+from alfasim_sdk import BipDescription
+from alfasim_sdk import compile_compositional_model
+from alfasim_sdk import CompositionDescription
+from alfasim_sdk import FluidDescription
+from alfasim_sdk import HeavyComponentDescription
+from alfasim_sdk import LightComponentDescription
+from alfasim_sdk import PvtModelCompositionalDescription
+
+
+def test_compile_compositional_model():
+    model = compile_compositional_model(
+        filled_case_descriptions.PVT_MODEL_COMPOSITIONAL_DEFINITION
+    )
+    assert model.component_names == ("Component X", "C3", "C7", "C1", "C2")
+    assert model.component_indexes == {
+        "Component X": 0,
+        "C3": 1,
+        "C7": 2,
+        "C1": 3,
+        "C2": 4,
+    }
+    assert model.is_heavy.tolist() == [False, False, True, False, False]
+    assert model.is_declared.tolist() == [True, True, True, False, False]
+    assert np.array_equal(
+        model.critical_pressure, [1.0, 42.0, np.nan, np.nan, np.nan], equal_nan=True
+    )
+    assert np.array_equal(
+        model.critical_temperature, [2.0, 0.0, np.nan, np.nan, np.nan], equal_nan=True
+    )
+    assert np.array_equal(
+        model.critical_volume, [3.0, 0.0, np.nan, np.nan, np.nan], equal_nan=True
+    )
+    assert np.array_equal(
+        model.acentric_factor, [5.0, 0.0, np.nan, np.nan, np.nan], equal_nan=True
+    )
+    assert np.array_equal(
+        model.molecular_weight, [6.0, 0.0, 0.100204, np.nan, np.nan], equal_nan=True
+    )
+
+    assert model.fluid_names == ("fluid_1",)
+    assert model.molar_fractions.tolist() == [[0.0, 0.0, 0.0, 5.0, 15.0]]
+    assert model.reference_enthalpies.tolist() == [[0.0, 0.0, 0.0, 10.0, 20.0]]
+    bip_matrix = model.get_bip_matrix("fluid_1")
+    assert bip_matrix[3, 4] == bip_matrix[4, 3] == 0.5
+    assert np.count_nonzero(bip_matrix) == 2
+
+
+def test_compile_compositional_model_units_and_repeated_values():
+    description = PvtModelCompositionalDescription(
+        light_components=[
+            LightComponentDescription(
+                name="A",
+                Pc=Scalar("pressure", 10.0, "bar"),
+                Tc=Scalar("temperature", 100.0, "degC"),
+                MW=Scalar("mass per mol", 16.0, "g/mol"),
+            ),
+            LightComponentDescription(name="B", Pc=Scalar("pressure", 1.0, "bar")),
+        ],
+        heavy_components=[
+            HeavyComponentDescription(name="C10", scn=10, MW=Scalar(0.134, "kg/mol"))
+        ],
+        fluids={
+            "f1": FluidDescription(
+                composition=[
+                    CompositionDescription(
+                        component="A", molar_fraction=Scalar(0.1, "mol/mol")
+                    ),
+                    CompositionDescription(
+                        component="A", molar_fraction=Scalar(0.3, "mol/mol")
+                    ),
+                    CompositionDescription(
+                        component="C10", molar_fraction=Scalar(0.7, "mol/mol")
+                    ),
+                ],
+                fraction_pairs=[
+                    BipDescription(component_1="A", component_2="B", value=0.1),
+                    BipDescription(component_1="B", component_2="A", value=0.2),
+                    BipDescription(component_1="C10", component_2="A", value=0.3),
+                ],
+            ),
+            "f2": FluidDescription(
+                composition=[
+                    CompositionDescription(
+                        component="B", molar_fraction=Scalar(1.0, "mol/mol")
+                    )
+                ]
+            ),
+        },
+    )
+    model = compile_compositional_model(description)
+
+    assert model.component_names == ("A", "B", "C10")
+    assert model.critical_pressure[:2].tolist() == [1e6, 1e5]
+    assert model.critical_temperature[0] == pytest.approx(373.15)
+    assert model.molecular_weight.tolist() == pytest.approx([0.016, 0.0, 0.134])
+
+    assert model.molar_fractions.tolist() == [[0.3, 0.0, 0.7], [0.0, 1.0, 0.0]]
+    assert model.get_molar_fractions("f2").tolist() == [0.0, 1.0, 0.0]
+    assert model.bip_matrices.shape == (2, 3, 3)
+    assert model.get_bip_matrix("f1").tolist() == [
+        [0.0, 0.2, 0.3],
+        [0.2, 0.0, 0.0],
+        [0.3, 0.0, 0.0],
+    ]
+    assert not model.get_bip_matrix("f2").any()
+
+    assert model.get_component_indexes(["C10", "A"]).tolist() == [2, 0]
+    with pytest.raises(ValueError, match="'D' is not part of the compositional model"):
+        model.get_component_indexes(["D"])
+    with pytest.raises(ValueError, match="Fluid 'f3' is not part"):
+        model.get_fluid_index("f3")
+
+
+def test_compile_empty_compositional_model():
+    model = compile_compositional_model(PvtModelCompositionalDescription())
+    assert model.component_names == ()
+    assert model.critical_pressure.shape == (0,)
+    assert model.molar_fractions.shape == (0, 0)
+    assert model.bip_matrices.shape == (0, 0, 0)
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from barril.units import Scalar
+
+from alfasim_sdk import BlackOilCorrelationEvaluator
+from alfasim_sdk import CorrelationPackage
+from alfasim_sdk import PvtModelCorrelationDescription
+from alfasim_sdk import PvtTableInterpolator
+from alfasim_sdk._internal.alfacase.pvt_correlations import BLACK_OIL_PROPERTIES
+
+
+@pytest.mark.parametrize("rs_sat", [0.0, 0.1, 5.0, 150.0])
+@pytest.mark.parametrize("package", list(CorrelationPackage))
+def test_evaluate(package, rs_sat):
+    description = PvtModelCorrelationDescription(
+        oil_density_std=Scalar(850.0, "kg/m3"),
+        gas_density_std=Scalar(0.9, "kg/m3"),
+        rs_sat=Scalar(rs_sat, "sm3/sm3"),
+        pvt_correlation_package=package,
+    )
+    evaluator = BlackOilCorrelationEvaluator(description)
+    pressure = np.linspace(1e5, 5e7, 200)
+    temperature = 350.0
+    properties = evaluator.evaluate(pressure, temperature)
+
+    assert set(properties) == set(BLACK_OIL_PROPERTIES)
+    for name, values in properties.items():
+        assert values.shape == pressure.shape
+        assert np.isfinite(values).all()
+        if name in ("solution gas-oil ratio", "bubble point pressure"):
+            assert (values >= 0.0).all()
+        else:
+            assert (values > 0.0).all()
+    assert (properties["solution gas-oil ratio"] <= rs_sat).all()
+
+    if rs_sat == 0.0:
+        # Dead oil: no dissolved gas and no compression of the oil.
+        assert (properties["solution gas-oil ratio"] == 0.0).all()
+        assert (properties["bubble point pressure"] == 0.0).all()
+        for name in ("oil formation volume factor", "oil density", "oil viscosity"):
+            assert np.all(properties[name] == properties[name][0])
+        return
+    if rs_sat < 150.0:
+        return
+
+    bubble_point_pressure = properties["bubble point pressure"][0]
+    assert 1e6 < bubble_point_pressure < 4e7
+    assert np.all(properties["bubble point pressure"] == bubble_point_pressure)
+
+    rs = properties["solution gas-oil ratio"]
+    saturated = pressure < bubble_point_pressure
+    assert (np.diff(rs[saturated]) >= 0.0).all()
+    assert 0.0 <= rs.min() < rs[saturated].max() <= 150.0
+    assert np.all(rs[~saturated] == 150.0)
+
+    # The bubble point is consistent with the gas-oil ratio of the package.
+    at_bubble_point = evaluator.evaluate(
+        bubble_point_pressure * (1 - 1e-9), temperature
+    )
+    assert at_bubble_point["solution gas-oil ratio"] == pytest.approx(150.0, rel=1e-5)
+
+    # Oil swells with the dissolved gas and is compressed above the bubble point.
+    bo = properties["oil formation volume factor"]
+    assert (np.diff(bo[saturated]) >= 0.0).all()
+    assert (np.diff(bo[~saturated]) < 0.0).all()
+    assert (np.diff(properties["gas density"]) > 0.0).all()
+    assert properties["oil density"][0] == pytest.approx(850.0, rel=0.1)
+    assert properties["gas density"][0] == pytest.approx(0.9 * 288.7 / 350.0, rel=0.1)
+
+
+def test_evaluate_broadcast():
+    evaluator = BlackOilCorrelationEvaluator(PvtModelCorrelationDescription())
+    pressure = np.array([[1e6], [2e6]])
+    temperature = np.array([300.0, 350.0, 400.0])
+    properties = evaluator.evaluate(pressure, temperature)
+    assert properties["oil viscosity"].shape == (2, 3)
+
+    expected = evaluator.evaluate(2e6, 350.0)
+    for name, values in properties.items():
+        assert values[1, 1] == pytest.approx(expected[name])
+
+    # Oil and gas get more viscous with pressure, oil gets less viscous with temperature.
+    assert (properties["oil viscosity"][:, 0] > properties["oil viscosity"][:, 2]).all()
+    assert 1e-6 < properties["gas viscosity"].min() < 1e-4
+
+
+def test_invalid_description():
+    with pytest.raises(ValueError, match="must be positive"):
+        BlackOilCorrelationEvaluator(
+            PvtModelCorrelationDescription(gas_density_std=Scalar(0.0, "kg/m3"))
+        )
+
+
+def test_create_table():
+    evaluator = BlackOilCorrelationEvaluator(
+        PvtModelCorrelationDescription(
+            pvt_correlation_package=CorrelationPackage.VazquezBeggs
+        )
+    )
+    pressure_values = np.linspace(1e5, 4e7, 30)
+    temperature_values = np.linspace(280.0, 420.0, 15)
+    table = evaluator.create_table(pressure_values, temperature_values)
+
+    assert table.variable_names == list(BLACK_OIL_PROPERTIES)
+    assert table.table_values.shape == (len(BLACK_OIL_PROPERTIES), 30, 15)
+    assert table.oil_density_std == Scalar(850.0, "kg/m3")
+    assert table.gas_oil_ratio == Scalar(150.0, "sm3/sm3")
+
+    # The grid points of the table are the values computed by the evaluator.
+    interpolator = PvtTableInterpolator(table)
+    p, t = pressure_values[7], temperature_values[3]
+    expected = evaluator.evaluate(p, t)
+    obtained = interpolator.evaluate(p, t)
+    for name in BLACK_OIL_PROPERTIES:
+        assert obtained[name] == pytest.approx(expected[name])
@@ -0,0 +1,198 @@
+import os
+
+import pytest
+
+from ..common_testing.alfasim_sdk_common_testing import get_acme_tab_file_path
+from alfasim_sdk._internal.alfacase import case_description
+from alfasim_sdk._internal.alfacase import pvt_tab_file
+from alfasim_sdk._internal.alfacase.case_description_attributes import (
+    InvalidReferenceError,
+)
+from alfasim_sdk._internal.alfacase.pvt_tab_file import get_pvt_tab_file_index
+from alfasim_sdk._internal.alfacase.pvt_tab_file import scan_pvt_tab_file
+
+
+def test_scan_pvt_tab_file(tmp_path):
+    tab_file = tmp_path / "models.tab"
+    content = (
+        'PVTTABLE LABEL = "PVT1",PHASE = THREE,\\\n'
+        'EOS = "SRK",\\\n'
+        "PVTTABLE POINT = (1, 2, 3)\n"
+        "PVTTABLE LABEL = 'PVT 2', PHASE = THREE,\r\n"
+        "PVTTABLE POINT = (1, 2, 3)\n"
+        "PVTTABLE LABEL = PVT3\n"
+        'PVTTABLE LABEL = "PVT1",PHASE = TWO,\n'
+    )
+    tab_file.write_bytes(content.encode("UTF-8"))
+
+    index = scan_pvt_tab_file(tab_file)
+    assert index.labels == {
+        "PVT1": 0,
+        "PVT 2": content.index("PVTTABLE LABEL = 'PVT 2'"),
+        "PVT3": content.index("PVTTABLE LABEL = PVT3"),
+    }
+
+    empty_file = tmp_path / "empty.tab"
+    empty_file.write_text("")
+    assert scan_pvt_tab_file(empty_file).labels == {}
+
+
+def test_scan_acme_tab_file():
+    index = scan_pvt_tab_file(get_acme_tab_file_path())
+    assert list(index.labels) == ["SOMELABEL"]
+
+
+def test_get_pvt_tab_file_index_is_cached(tmp_path, monkeypatch):
+    tab_file = tmp_path / "models.tab"
+    tab_file.write_text('PVTTABLE LABEL = "PVT1",PHASE = THREE,\n')
+
+    scanned_files = []
+
+    def scan(file_path):
+        scanned_files.append(file_path)
+        return scan_pvt_tab_file(file_path)
+
+    monkeypatch.setattr(pvt_tab_file, "scan_pvt_tab_file", scan)
+    index = get_pvt_tab_file_index(tab_file)
+    assert get_pvt_tab_file_index(tab_file) is index
+    assert get_pvt_tab_file_index(str(tab_file)) is index
+    assert len(scanned_files) == 1
+
+    tab_file.write_text(
+        'PVTTABLE LABEL = "PVT1",PHASE = THREE,\nPVTTABLE LABEL = "PVT2",PHASE = THREE,\n'
+    )
+    stat = tab_file.stat()
+    os.utime(str(tab_file), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert list(get_pvt_tab_file_index(tab_file).labels) == ["PVT1", "PVT2"]
+    assert len(scanned_files) == 2
+
+
+def test_check_pvt_model_files_scans_each_file_once(tmp_path, monkeypatch):
+    tab_file = tmp_path / "models.tab"
+    tab_file.write_text(
+        'PVTTABLE LABEL = "PVT1",PHASE = THREE,\nPVTTABLE LABEL = "PVT2",PHASE = THREE,\n'
+    )
+    scanned_files = []
+
+    def scan(file_path):
+        scanned_files.append(file_path)
+        return scan_pvt_tab_file(file_path)
+
+    monkeypatch.setattr(pvt_tab_file, "scan_pvt_tab_file", scan)
+    case = case_description.CaseDescription(
+        pvt_models=case_description.PvtModelsDescription(
+            tables={f"PVT{i}": f"{tab_file}|PVT{i % 2 + 1}" for i in range(10)}
+        )
+    )
+    case._check_pvt_model_files()
+    assert scanned_files == [tab_file]
+
+    case.pvt_models.tables["Missing"] = f"{tab_file}|PVT3"
+    with pytest.raises(
+        InvalidReferenceError,
+        match="'PVT3' could not be found on 'models.tab', available models are: 'PVT1, PVT2'",
+    ):
+        case._check_pvt_model_files()
+    assert scanned_files == [tab_file]
+
+
+def _make_tab_content(label, pressures, temperatures, temperature_first=False):
+    points = [(p, t) for t in temperatures for p in pressures]
+    if not temperature_first:
+        points.sort()
+    lines = [
+        f'PVTTABLE LABEL = "{label}",PHASE = TWO,\\',
+        "! Comment",
+        "STDPRESSURE = .100000E+01 ATM,\\",
+        "STDTEMPERATURE = .288710E+03 K,\\",
+        "GOR = .100000E+03 Sm3/Sm3,\\",
+        "STDOILDENSITY = .800000E+03 kg/m3,\\",
+        "MESHTYPE = STANDARD,TOTWATERFRACTION = (.100000E-01),\\",
+        f"PRESSURE = ({','.join(str(p) for p in pressures)}) Pa,\\",
+        f"TEMPERATURE = ({','.join(str(t) for t in temperatures)}) C,\\",
+        "COLUMNS = (PT,TM,ROG,ROHL)",
+    ]
+    for p, t in points:
+        lines.append(f"PVTTABLE POINT = ({p:E},{t:E},{p * 1e-5 + t:E},\\")
+        lines.append(f"{1000.0 - t:E})")
+    return "\n".join(lines) + "\n"
+
+
+def test_read_pvt_tab_file(tmp_path):
+    import numpy as np
+
+    from alfasim_sdk import load_pvt_model_table_parameters_description_from_tab
+    from alfasim_sdk import read_pvt_tab_file
+
+    tab_file = tmp_path / "models.tab"
+    tab_file.write_text(
+        _make_tab_content("PVT1", [1e5, 2e5, 3e5], [10.0, 20.0])
+        + _make_tab_content("PVT2", [1e5, 5e5], [0.0, 50.0, 100.0], True)
+    )
+
+    tables = read_pvt_tab_file(tab_file)
+    assert list(tables) == ["PVT1", "PVT2"]
+    assert read_pvt_tab_file(tab_file, ["PVT2"]) == {"PVT2": tables["PVT2"]}
+
+    pvt1 = tables["PVT1"]
+    assert pvt1.label == "PVT1"
+    assert pvt1.number_of_phases == 2
+    assert pvt1.variable_names == ["ROG", "ROHL"]
+    np.testing.assert_allclose(pvt1.pressure_values, [1e5, 2e5, 3e5])
+    np.testing.assert_allclose(pvt1.temperature_values, [283.15, 293.15])
+    np.testing.assert_allclose(
+        pvt1.table_values[0], [[11.0, 21.0], [12.0, 22.0], [13.0, 23.0]]
+    )
+    np.testing.assert_allclose(pvt1.table_values[1], [[990.0, 980.0]] * 3)
+    assert pvt1.pressure_std.GetValue("bar") == pytest.approx(1.01325)
+    assert pvt1.temperature_std.GetValue("degC") == pytest.approx(15.56)
+    assert pvt1.gas_oil_ratio.GetValue("sm3/sm3") == 100.0
+    assert pvt1.oil_density_std.GetValue("kg/m3") == 800.0
+    assert pvt1.total_water_fraction.GetValue("-") == 0.01
+    assert np.isnan(pvt1.water_density_std.GetValue())
+
+    # Points ordered by temperature are sorted by pressure.
+    pvt2 = tables["PVT2"]
+    np.testing.assert_allclose(
+        pvt2.table_values[0], [[1.0, 51.0, 101.0], [5.0, 55.0, 105.0]]
+    )
+
+    assert (
+        load_pvt_model_table_parameters_description_from_tab(f"{tab_file}|PVT2") == pvt2
+    )
+    with pytest.raises(ValueError, match="declares 2 PVT models"):
+        load_pvt_model_table_parameters_description_from_tab(tab_file)
+    with pytest.raises(ValueError, match="'PVT3' could not be found on 'models.tab'"):
+        read_pvt_tab_file(tab_file, ["PVT3"])
+
+
+def test_read_acme_tab_file():
+    from alfasim_sdk import load_pvt_model_table_parameters_description_from_tab
+
+    table = load_pvt_model_table_parameters_description_from_tab(
+        get_acme_tab_file_path()
+    )
+    assert table.label == "SOMELABEL"
+    assert table.number_of_phases == 3
+    assert table.table_values.shape == (29, 50, 50)
+    assert table.variable_names[:3] == ["ROG", "ROHL", "ROWT"]
+    assert table.pressure_values[0] == 96526.3
+    assert table.temperature_values[0] == pytest.approx(253.15)
+    assert table.table_variables[0][:2].tolist() == [0.900891, 0.892869]
+
+
+def test_read_invalid_pvt_tab_file(tmp_path):
+    from alfasim_sdk import read_pvt_tab_file
+
+    tab_file = tmp_path / "models.tab"
+    content = _make_tab_content("PVT1", [1e5, 2e5], [10.0, 20.0])
+    tab_file.write_text(content.rsplit("PVTTABLE POINT", 1)[0])
+    with pytest.raises(
+        ValueError,
+        match="Invalid PVT model 'PVT1' on 'models.tab': expected 4 points, got 3",
+    ):
+        read_pvt_tab_file(tab_file)
+
+    tab_file.write_text(content.replace("COLUMNS = (PT,TM,ROG,ROHL)", ""))
+    with pytest.raises(ValueError, match="missing COLUMNS"):
+        read_pvt_tab_file(tab_file)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from alfasim_sdk import generate_pvt_table
+from alfasim_sdk import generate_pvt_table_file
+from alfasim_sdk import load_pvt_model_table_parameters_description_from_alfatable
+from alfasim_sdk import PvtModelTableParametersDescription
+
+
+def test_generate_pvt_table():
+    description = generate_pvt_table(50, 40)
+    assert description.table_values.shape == (16, 50, 40)
+    assert description.number_of_phases == 2
+    assert description.label == "synthetic 50x40x16"
+    assert description.variable_names == (
+        PvtModelTableParametersDescription.create_constant().variable_names
+    )
+    assert np.isfinite(description.table_values).all()
+
+    # Every variable changes monotonically with the pressure and with the temperature.
+    for values in description.table_values:
+        pressure_steps = np.sign(np.diff(values, axis=0))
+        temperature_steps = np.sign(np.diff(values, axis=1))
+        assert len(np.unique(pressure_steps[pressure_steps != 0])) == 1
+        assert len(np.unique(temperature_steps[temperature_steps != 0])) == 1
+
+    density = description.table_values[description.variable_names.index("gas density")]
+    assert (np.diff(density, axis=0) > 0).all()
+    assert (np.diff(density, axis=1) < 0).all()
+
+
+def test_generate_pvt_table_options():
+    description = generate_pvt_table(
+        30,
+        20,
+        40,
+        has_water=True,
+        seed=3,
+        pressure_range=(1e5, 1e6),
+        temperature_range=(300.0, 400.0),
+        uniform_grid=False,
+    )
+    assert description.number_of_phases == 3
+    assert description.table_values.shape == (40, 30, 20)
+    assert description.variable_names[16] == "water density"
+    assert description.variable_names[-1] == "synthetic variable 39"
+    assert description.pressure_values[[0, -1]].tolist() == pytest.approx([1e5, 1e6])
+    assert description.temperature_values[[0, -1]].tolist() == [300.0, 400.0]
+    assert (np.diff(description.pressure_values) > 0).all()
+    assert (np.diff(description.temperature_values) > 0).all()
+    assert not np.allclose(np.diff(description.pressure_values), 1e6 / 30)
+
+    assert generate_pvt_table(30, 20, 3).variable_names == [
+        "gas density",
+        "gas density derivative pressure",
+        "gas density derivative temperature",
+    ]
+    with pytest.raises(ValueError, match="at least 2 pressures"):
+        generate_pvt_table(1, 20)
+
+
+def test_generate_pvt_table_is_reproducible():
+    description = generate_pvt_table(20, 20, 30, seed=7)
+    assert description == generate_pvt_table(20, 20, 30, seed=7)
+    assert description != generate_pvt_table(20, 20, 30, seed=8)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_generate_pvt_table_file(tmp_path, binary):
+    alfatable_file = generate_pvt_table_file(
+        tmp_path / "case.alfacase", "synthetic", 20, 10, 20, seed=1, binary=binary
+    )
+    assert alfatable_file == tmp_path / "case.synthetic.alfatable"
+    loaded = load_pvt_model_table_parameters_description_from_alfatable(alfatable_file)
+    assert loaded == generate_pvt_table(20, 10, 20, seed=1)
@@ -0,0 +1,106 @@
+import warnings
+
+import attr
+import numpy as np
+import pytest
+
+from alfasim_sdk import PvtModelTableParametersDescription
+from alfasim_sdk import PvtTableInterpolator
+from alfasim_sdk import PvtTableOutOfRangeWarning
+
+
+def _make_description(pressure_values, temperature_values, **kwargs):
+    t, p = np.meshgrid(temperature_values, pressure_values)
+    return PvtModelTableParametersDescription(
+        pressure_values=np.asarray(pressure_values, dtype=float),
+        temperature_values=np.asarray(temperature_values, dtype=float),
+        table_variables=[(2.0 * p + 3.0 * t).flatten(), (p * t).flatten()],
+        variable_names=["linear", "bilinear"],
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "pressure_values",
+    [np.linspace(1e5, 1e6, 10), np.array([1e5, 2e5, 5e5, 8e5, 1e6])],
+    ids=["uniform", "non-uniform"],
+)
+def test_evaluate(pressure_values):
+    description = _make_description(pressure_values, [250.0, 300.0, 400.0, 500.0])
+    interpolator = PvtTableInterpolator(description)
+    assert interpolator.variable_names == ("linear", "bilinear")
+    assert interpolator.pressure_range == (1e5, 1e6)
+    assert interpolator.temperature_range == (250.0, 500.0)
+
+    rng = np.random.RandomState(0)
+    pressure = rng.uniform(1e5, 1e6, 100)
+    temperature = rng.uniform(250.0, 500.0, 100)
+    values = interpolator.evaluate(pressure, temperature)
+    assert list(values) == ["linear", "bilinear"]
+    # Bilinear interpolation is exact for these functions.
+    np.testing.assert_allclose(values["linear"], 2.0 * pressure + 3.0 * temperature)
+    np.testing.assert_allclose(values["bilinear"], pressure * temperature)
+
+    # Grid points.
+    t, p = np.meshgrid(description.temperature_values, pressure_values)
+    np.testing.assert_allclose(
+        interpolator.evaluate_variable("bilinear", p.flatten(), t.flatten()),
+        description.table_variables[1],
+    )
+
+    # Scalars and broadcasting.
+    assert interpolator.evaluate_variable("linear", 2e5, 300.0) == pytest.approx(
+        4e5 + 900.0
+    )
+    location = interpolator.locate(pressure[:, np.newaxis], [300.0, 400.0])
+    obtained = interpolator.evaluate(None, None, ["linear"], location=location)
+    assert obtained["linear"].shape == (100, 2)
+    np.testing.assert_allclose(obtained["linear"][:, 1], 2.0 * pressure + 3.0 * 400.0)
+
+
+def test_evaluate_outside():
+    description = _make_description([1e5, 2e5, 3e5], [300.0, 400.0], label="PVT1")
+    interpolator = PvtTableInterpolator(description)
+
+    pressure = np.array([0.5e5, 1.5e5, 4e5, 2e5])
+    temperature = np.array([350.0, 350.0, 350.0, 500.0])
+    np.testing.assert_array_equal(
+        interpolator.is_outside(pressure, temperature), [True, False, True, True]
+    )
+
+    with pytest.warns(PvtTableOutOfRangeWarning, match="3 of 4 points.*'PVT1'"):
+        values = interpolator.evaluate_variable("linear", pressure, temperature)
+    # Evaluated at the closest boundary.
+    np.testing.assert_allclose(
+        values, [2e5 + 1050.0, 3e5 + 1050.0, 6e5 + 1050.0, 4e5 + 1200.0]
+    )
+
+    interpolator = PvtTableInterpolator(
+        attr.evolve(description, warn_when_outside=False)
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        interpolator.evaluate(pressure, temperature)
+
+
+def test_create_constant_table():
+    description = PvtModelTableParametersDescription.create_constant()
+    interpolator = PvtTableInterpolator(description)
+    values = interpolator.evaluate([1e5, 1e6], [300.0, 350.0], ["oil density"])
+    np.testing.assert_allclose(values["oil density"], [1000.0, 1000.0])
+
+
+def test_invalid_tables():
+    description = _make_description([1e5, 2e5], [300.0, 400.0])
+    with pytest.raises(ValueError, match="must be sorted"):
+        PvtTableInterpolator(
+            attr.evolve(description, pressure_values=np.array([2e5, 1e5]))
+        )
+    with pytest.raises(ValueError, match="one value for each pressure and temperature"):
+        PvtTableInterpolator(
+            attr.evolve(description, temperature_values=np.array([300.0]))
+        )
+
+    interpolator = PvtTableInterpolator(description)
+    with pytest.raises(ValueError, match="no variable 'foo'"):
+        interpolator.evaluate(1e5, 300.0, ["foo"])
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from alfasim_sdk import generate_alfatable_file
+from alfasim_sdk import generate_pvt_table
+from alfasim_sdk import load_pvt_model_table_parameters_description_from_alfatable
+from alfasim_sdk import PvtModelTableParametersDescription
+from alfasim_sdk import PvtTableInterpolator
+from alfasim_sdk import resample_pvt_table
+
+
+def _get_max_relative_error(resampled, description):
+    interpolator = PvtTableInterpolator(resampled)
+    p, t = np.meshgrid(
+        description.pressure_values, description.temperature_values, indexing="ij"
+    )
+    values = interpolator.evaluate(p, t)
+    return {
+        name: np.max(np.abs(values[name] - expected) / np.abs(expected))
+        for name, expected in zip(description.variable_names, description.table_values)
+    }
+
+
+def test_resample_pvt_table():
+    description = generate_pvt_table(200, 100, 20, has_water=True)
+    resampled, report = resample_pvt_table(description, 1e-3)
+
+    assert report.original_shape == (200, 100)
+    assert report.resampled_shape == (
+        len(resampled.pressure_values),
+        len(resampled.temperature_values),
+    )
+    assert report.resampled_shape[0] < 100 and report.resampled_shape[1] < 50
+    assert report.compression_ratio == pytest.approx(
+        200 * 100 / np.prod(report.resampled_shape)
+    )
+    assert report.within_tolerance
+    assert report.tolerances == dict.fromkeys(description.variable_names, 1e-3)
+    assert 0.0 < max(report.max_relative_errors.values()) <= 1e-3
+
+    # The resampled grid is a subset of the original one, with the same boundaries.
+    assert np.isin(resampled.pressure_values, description.pressure_values).all()
+    assert np.isin(resampled.temperature_values, description.temperature_values).all()
+    assert resampled.pressure_values[[0, -1]].tolist() == [1e5, 1e8]
+    assert resampled.temperature_values[[0, -1]].tolist() == [250.0, 500.0]
+    assert resampled.variable_names == description.variable_names
+    assert resampled.label == description.label
+
+    errors = _get_max_relative_error(resampled, description)
+    assert errors == pytest.approx(report.max_relative_errors)
+
+
+def test_resample_pvt_table_per_variable_tolerance():
+    description = generate_pvt_table(50, 40, 3)
+    resampled, report = resample_pvt_table(
+        description, {"gas density": 1e-2, "gas density derivative pressure": 1e-4}
+    )
+    assert report.tolerances == {
+        "gas density": 1e-2,
+        "gas density derivative pressure": 1e-4,
+        "gas density derivative temperature": 0.0,
+    }
+    assert report.within_tolerance
+    # A variable without tolerance requires the whole grid (the values are not linear).
+    assert report.resampled_shape == (50, 40)
+    assert resampled == description
+
+    with pytest.raises(ValueError, match="no variables named: foo"):
+        resample_pvt_table(description, {"foo": 1e-3})
+    with pytest.raises(ValueError, match="must be positive"):
+        resample_pvt_table(description, -1.0)
+
+
+def test_resample_linear_pvt_table():
+    pressure_values = np.linspace(1e5, 1e7, 40)
+    temperature_values = np.linspace(250.0, 500.0, 30)
+    p, t = np.meshgrid(pressure_values, temperature_values, indexing="ij")
+    description = PvtModelTableParametersDescription(
+        pressure_values=pressure_values,
+        temperature_values=temperature_values,
+        table_variables=[(1.0 + 1e-5 * p + 2.0 * t).ravel(), (1e3 - t).ravel()],
+        variable_names=["a", "b"],
+    )
+    resampled, report = resample_pvt_table(description, 0.0)
+    assert report.resampled_shape == (2, 2)
+    assert report.within_tolerance
+    assert max(report.max_relative_errors.values()) < 1e-12
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_resample_pvt_table_float32(tmp_path, binary):
+    description = generate_pvt_table(60, 30, 10)
+    resampled, report = resample_pvt_table(description, 1e-4, float32=True)
+    assert resampled.table_values.dtype == np.float32
+    assert resampled.pressure_values.dtype == np.float64
+    assert report.within_tolerance
+    assert max(report.max_relative_errors.values()) > 0.0
+
+    alfatable_file = generate_alfatable_file(
+        tmp_path / "case.alfacase", "resampled", resampled, binary=binary
+    )
+    loaded = load_pvt_model_table_parameters_description_from_alfatable(alfatable_file)
+    if binary:
+        # Kept as float32 on binary files.
+        assert loaded.table_values.dtype == np.float32
+        assert loaded == resampled
+    assert np.allclose(loaded.table_values, resampled.table_values, rtol=1e-7)